@@ -0,0 +1,7 @@
+# anysection/__main__.py
+
+import sys
+
+from anysection.cli import main
+
+sys.exit(main())
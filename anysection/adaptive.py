@@ -0,0 +1,151 @@
+# anysection/adaptive.py
+
+import numpy as np
+
+from anysection.gauss_tables import GaussTables
+
+
+class AdaptiveMesh:
+    """
+    Fiber mesh of one material region, refined where the fiber integration of
+    N and M is inaccurate.
+
+    The region starts from a coarse grid of cells, each integrated by one fiber
+    at its centroid. For a set of strain states the fiber sums of every cell are
+    compared with a Gauss quadrature of the same cell (GaussTables points over
+    the cell height, exact chord widths in between, so only the stress
+    variation is approximated). Cells with large errors, i.e. steep strain
+    gradients or kinks of the material law such as the neutral axis and the
+    softening branch, are split in two across the strain gradient (at mid
+    height), while cells of near-constant stress keep their size.
+
+    Parameters:
+        polygon (Polygon): Region outline.
+        material (Material): Region material.
+        divisions (tuple): (nx, ny) cells of the initial grid.
+        order (int): Gauss points per cell interval (1 to 10).
+        max_level (int): Maximum number of splits of an initial cell.
+    """
+
+    def __init__(self, polygon, material, divisions=(4, 4), order=5, max_level=8):
+        self.polygon = polygon
+        self.material = material
+        self.order = order
+        self.max_level = max_level
+        self._kernel = material.kernel()
+        points, weights = GaussTables.get_gauss_points(order)
+        self._gauss = np.asarray(points, dtype=float), np.asarray(weights, dtype=float)
+
+        x_min, y_min, x_max, y_max = polygon.bounds()
+        nx, ny = divisions
+        xs = np.linspace(x_min, x_max, nx + 1)
+        ys = np.linspace(y_min, y_max, ny + 1)
+        crossed = polygon.crossed_cells(xs, ys)
+        inside = polygon.contains(*np.meshgrid((xs[:-1] + xs[1:]) / 2, (ys[:-1] + ys[1:]) / 2, indexing="ij"))
+        self.cells = []  # (box (x0, x1, y0, y1), level, clipped piece or None for a full box)
+        for i in range(nx):
+            for j in range(ny):
+                if crossed[i, j] or inside[i, j]:
+                    box = (xs[i], xs[i + 1], ys[j], ys[j + 1])
+                    self._add_cell(box, 0, polygon if crossed[i, j] else None)
+        self._build()
+
+    def _add_cell(self, box, level, piece):
+        """
+        Add a cell; `piece` is the polygon to clip to the box, None if the box is full.
+        """
+        if piece is not None:
+            x0, x1, y0, y1 = box
+            piece = piece.clip(1.0, 0.0, x0).clip(-1.0, 0.0, -x1).clip(0.0, 1.0, y0).clip(0.0, -1.0, -y1)
+            if not piece.rings or piece.area() <= 1e-12 * (x1 - x0) * (y1 - y0):
+                return
+        self.cells.append((box, level, piece))
+
+    def _build(self):
+        """
+        Fiber and quadrature arrays of the current cells.
+        """
+        points, weights = self._gauss
+        x, y, area = [], [], []
+        quadrature_y, quadrature_w, counts = [], [], []
+        for (x0, x1, y0, y1), _, piece in self.cells:
+            if piece is None:
+                x.append((x0 + x1) / 2)
+                y.append((y0 + y1) / 2)
+                area.append((x1 - x0) * (y1 - y0))
+                breaks = np.array([y0, y1])
+            else:
+                cx, cy = piece.centroid()
+                x.append(cx)
+                y.append(cy)
+                area.append(piece.area())
+                breaks = np.unique(np.concatenate(piece.rings)[:, 1])
+            # Gauss points on every interval between vertex ordinates, where the
+            # chord width is linear
+            low, high = breaks[:-1, None], breaks[1:, None]
+            qy = ((low + high) / 2 + (high - low) / 2 * points).ravel()
+            qw = ((high - low) / 2 * weights).ravel()
+            qw = qw * (x1 - x0 if piece is None else piece.chord_widths(qy))
+            quadrature_y.append(qy)
+            quadrature_w.append(qw)
+            counts.append(len(qy))
+        self.x, self.y, self.area = np.array(x), np.array(y), np.array(area)
+        self._quadrature_y = np.concatenate(quadrature_y) if quadrature_y else np.zeros(0)
+        self._quadrature_w = np.concatenate(quadrature_w) if quadrature_w else np.zeros(0)
+        self._starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(int)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def fibers(self):
+        """
+        Return the (x, y, area) arrays of the fibers, one per cell.
+        """
+        return self.x, self.y, self.area
+
+    def errors(self, neutral_axes, curvatures):
+        """
+        Fiber integration errors of every cell for strain states
+        strain = curvature * (y - neutral_axis).
+
+        Returns:
+            tuple: (dN, dM) arrays of shape (states, cells): fiber sums minus the
+            Gauss quadrature of the axial force and of the moment about the
+            neutral axis.
+        """
+        neutral_axes = np.asarray(neutral_axes, dtype=float)[:, None]
+        curvatures = np.asarray(curvatures, dtype=float)[:, None]
+        lever_arm = self.y - neutral_axes
+        fiber_force = self._kernel.stress(curvatures * lever_arm) * self.area
+        quadrature_arm = self._quadrature_y - neutral_axes
+        force = self._kernel.stress(curvatures * quadrature_arm) * self._quadrature_w
+        gauss_force = np.add.reduceat(force, self._starts, axis=1)
+        gauss_moment = np.add.reduceat(force * quadrature_arm, self._starts, axis=1)
+        return fiber_force - gauss_force, fiber_force * lever_arm - gauss_moment
+
+    def split(self, mask):
+        """
+        Split the selected cells in two at mid height (cells at `max_level` stay).
+
+        Returns:
+            int: Number of cells split.
+        """
+        cells = self.cells
+        self.cells = []
+        count = 0
+        for (box, level, piece), selected in zip(cells, mask):
+            if not selected or level >= self.max_level:
+                self.cells.append((box, level, piece))
+                continue
+            x0, x1, y0, y1 = box
+            middle = (y0 + y1) / 2
+            self._add_cell((x0, x1, y0, middle), level + 1, piece)
+            self._add_cell((x0, x1, middle, y1), level + 1, piece)
+            count += 1
+        if count:
+            self._build()
+        return count
+
+    def __str__(self):
+        levels = max((level for _, level, _ in self.cells), default=0)
+        return f"AdaptiveMesh: {len(self.cells)} fibers of {self.material.name}, {levels} levels"
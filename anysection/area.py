@@ -1,5 +1,7 @@
 from math import pi
-from anysection.fiber import Fiber
+import numpy as np
+from anysection.fiber import FiberBase
+from anysection.interning import freeze
 
 
 class Area:
@@ -20,6 +22,26 @@ class Area:
     def moment_of_inertia(self):
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def product_of_inertia(self):
+        """
+        Return the product of inertia Ixy about the centroidal axes.
+        """
+        return self.to_polygon().product_of_inertia()
+
+    def _identity(self):
+        return type(self), freeze({key: value for key, value in vars(self).items() if key != "name"})
+
+    def __eq__(self, other):
+        """
+        Areas are equal when they have the same type and dimensions.
+        """
+        if not isinstance(other, Area):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    def __hash__(self):
+        return hash(self._identity())
+
     def __str__(self):
         return f"Area: {self.name}, Centroid: ({self.centroid_x}, {self.centroid_y})"
 
@@ -38,6 +60,17 @@ class Rectangle(Area):
         Iy = (self.height * self.width ** 3) / 12
         return Ix, Iy
 
+    def product_of_inertia(self):
+        return 0.0
+
+    def to_polygon(self):
+        """
+        Return the rectangle as a Polygon centred on its centroid.
+        """
+        hw, hh = self.width / 2, self.height / 2
+        cx, cy = self.centroid_x, self.centroid_y
+        return Polygon([(cx - hw, cy - hh), (cx + hw, cy - hh), (cx + hw, cy + hh), (cx - hw, cy + hh)])
+
 
 class Circle(Area):
     def __init__(self, radius, centroid_x=0.0, centroid_y=0.0):
@@ -51,6 +84,20 @@ class Circle(Area):
         I = (pi * self.radius ** 4) / 4
         return I, I
 
+    def product_of_inertia(self):
+        return 0.0
+
+    def to_polygon(self, segments=64):
+        """
+        Return an inscribed regular polygon approximating the circle.
+
+        Parameters:
+            segments (int): Number of polygon edges.
+        """
+        theta = np.linspace(0.0, 2 * pi, segments, endpoint=False)
+        return Polygon(np.column_stack((self.centroid_x + self.radius * np.cos(theta),
+                                        self.centroid_y + self.radius * np.sin(theta))))
+
 
 class Triangle(Area):
     def __init__(self, base, height, centroid_x=0.0, centroid_y=0.0):
@@ -66,6 +113,329 @@ class Triangle(Area):
         Iy = (self.height * self.base ** 3) / 36
         return Ix, Iy
 
+    def product_of_inertia(self):
+        # Right angle at the bottom-left corner (see to_polygon)
+        return -(self.base * self.height) ** 2 / 72
+
+    def to_polygon(self):
+        """
+        Return the right triangle (right angle at the bottom-left corner) as a Polygon.
+        """
+        x0 = self.centroid_x - self.base / 3
+        y0 = self.centroid_y - self.height / 3
+        return Polygon([(x0, y0), (x0 + self.base, y0), (x0, y0 + self.height)])
+
+
+class Polygon(Area):
+    """
+    Arbitrary polygon with optional holes.
+
+    Section properties are evaluated in closed form from the vertex arrays with
+    Green's theorem, so they are exact for any straight-edged shape (box girders,
+    I-sections, hollow piers).
+
+    Parameters:
+        vertices: Sequence of (x, y) pairs describing the outer boundary.
+        holes: Optional sequence of vertex sequences, one per hole.
+    """
+    def __init__(self, vertices, holes=None):
+        outer = self._orient(vertices, ccw=True)
+        self.rings = [outer] + [self._orient(hole, ccw=False) for hole in (holes or [])]
+        super().__init__("Polygon")
+        self.centroid_x, self.centroid_y = self.centroid()
+
+    @staticmethod
+    def _orient(vertices, ccw):
+        ring = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        if len(ring) > 1 and np.allclose(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if len(ring) < 3:
+            raise ValueError("A polygon ring needs at least three vertices.")
+        x, y = ring[:, 0], ring[:, 1]
+        signed = np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)
+        if (signed > 0) != ccw:
+            ring = ring[::-1]
+        return ring
+
+    @classmethod
+    def _from_rings(cls, rings):
+        polygon = cls.__new__(cls)
+        polygon.rings = rings
+        Area.__init__(polygon, "Polygon")
+        if polygon.area() != 0:
+            polygon.centroid_x, polygon.centroid_y = polygon.centroid()
+        return polygon
+
+    def _identity(self):
+        # Rings start at their lexicographically smallest vertex, so the key does
+        # not depend on where the vertex list happened to begin.
+        rings = [np.roll(ring, -np.lexsort((ring[:, 1], ring[:, 0]))[0], axis=0) for ring in self.rings]
+        return type(self), freeze(rings[:1] + sorted(rings[1:], key=lambda ring: tuple(ring[0])))
+
+    @property
+    def vertices(self):
+        return self.rings[0]
+
+    @property
+    def holes(self):
+        return self.rings[1:]
+
+    def _edges(self):
+        """
+        Return start/end coordinates of every edge of every ring as flat arrays.
+        """
+        if not self.rings:
+            empty = np.zeros(0)
+            return empty, empty, empty, empty
+        start = np.concatenate(self.rings)
+        end = np.concatenate([np.roll(ring, -1, axis=0) for ring in self.rings])
+        return start[:, 0], start[:, 1], end[:, 0], end[:, 1]
+
+    def _integrals(self):
+        """
+        Return (A, Sx, Sy, Ixx, Iyy, Ixy) about a local origin (the first outer
+        vertex) together with that origin, where Sx = integral of x dA and
+        Ixx = integral of y^2 dA. Working about a nearby origin keeps the sums
+        well conditioned for sections far from the global origin.
+        """
+        x0, y0, x1, y1 = self._edges()
+        ox, oy = (x0[0], y0[0]) if len(x0) else (0.0, 0.0)
+        x0, x1, y0, y1 = x0 - ox, x1 - ox, y0 - oy, y1 - oy
+        cross = x0 * y1 - x1 * y0
+        A = cross.sum() / 2
+        Sx = np.dot(cross, x0 + x1) / 6
+        Sy = np.dot(cross, y0 + y1) / 6
+        Ixx = np.dot(cross, y0 * y0 + y0 * y1 + y1 * y1) / 12
+        Iyy = np.dot(cross, x0 * x0 + x0 * x1 + x1 * x1) / 12
+        Ixy = np.dot(cross, x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) / 24
+        return (A, Sx, Sy, Ixx, Iyy, Ixy), (ox, oy)
+
+    def area(self):
+        return float(self._integrals()[0][0])
+
+    def centroid(self):
+        (A, Sx, Sy, _, _, _), (ox, oy) = self._integrals()
+        return float(ox + Sx / A), float(oy + Sy / A)
+
+    def moment_of_inertia(self):
+        (A, Sx, Sy, Ixx, Iyy, _), _ = self._integrals()
+        Ix = Ixx - Sy * Sy / A
+        Iy = Iyy - Sx * Sx / A
+        return float(Ix), float(Iy)
+
+    def product_of_inertia(self):
+        """
+        Return the product of inertia Ixy about the centroidal axes.
+        """
+        (A, Sx, Sy, _, _, Ixy), _ = self._integrals()
+        return float(Ixy - Sx * Sy / A)
+
+    def y_moments(self, order, y0=0.0):
+        """
+        Return the exact integrals of (y - y0)**k dA for k = 0..order.
+
+        Parameters:
+            order (int): Highest power of (y - y0).
+            y0 (float): Reference ordinate.
+
+        Returns:
+            numpy.ndarray: Array of length order + 1.
+        """
+        x0, y_start, x1, y_end = self._edges()
+        y_start, y_end = y_start - y0, y_end - y0
+        cross = x0 * y_end - x1 * y_start
+        moments = np.empty(order + 1)
+        power_sum = np.ones_like(y_start)
+        start_power = np.ones_like(y_start)
+        for q in range(order + 1):
+            if q > 0:
+                start_power = start_power * y_start
+                power_sum = power_sum * y_end + start_power
+            moments[q] = np.dot(cross, power_sum) / ((q + 1) * (q + 2))
+        return moments
+
+    def bounds(self):
+        """
+        Return the bounding box (x_min, y_min, x_max, y_max) of the polygon.
+        """
+        points = np.concatenate(self.rings)
+        return (*points.min(axis=0), *points.max(axis=0))
+
+    def contains(self, x, y, chunk_size=65536):
+        """
+        Vectorized even-odd point-in-polygon test (holes excluded).
+
+        Parameters:
+            x, y (array_like): Point coordinates.
+            chunk_size (int): Points tested per batch, bounding the temporary
+                points x edges arrays.
+
+        Returns:
+            numpy.ndarray: Boolean mask with the shape of x.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        px, py = x.ravel(), y.ravel()
+        x0, y0, x1, y1 = self._edges()
+        spans = y0 != y1
+        x0, y0, x1, y1 = x0[spans], y0[spans], x1[spans], y1[spans]
+        slope = (x1 - x0) / (y1 - y0)
+        inside = np.zeros(px.shape, dtype=bool)
+        for start in range(0, len(px), chunk_size):
+            cx = px[start:start + chunk_size, None]
+            cy = py[start:start + chunk_size, None]
+            straddles = (y0 > cy) != (y1 > cy)
+            crosses = straddles & (cx < x0 + (cy - y0) * slope)
+            inside[start:start + chunk_size] = np.count_nonzero(crosses, axis=1) % 2 == 1
+        return inside.reshape(x.shape)
+
+    def chord_widths(self, y):
+        """
+        Width of the polygon along horizontal lines, holes excluded.
+
+        Every edge crossing a line contributes its intercept, signed by its
+        direction (rings are stored counterclockwise, holes clockwise).
+
+        Parameters:
+            y (array_like): Ordinates of the lines.
+
+        Returns:
+            numpy.ndarray: Widths with the shape of y.
+        """
+        y = np.asarray(y, dtype=float)
+        x0, y0, x1, y1 = self._edges()
+        spans = y0 != y1
+        x0, y0, x1, y1 = x0[spans], y0[spans], x1[spans], y1[spans]
+        lines = y.reshape(-1, 1)
+        straddles = (y0 > lines) != (y1 > lines)
+        intercepts = x0 + (lines - y0) * (x1 - x0) / (y1 - y0)
+        widths = np.where(straddles, intercepts * np.sign(y1 - y0), 0.0).sum(axis=1)
+        return widths.reshape(y.shape)
+
+    def crossed_cells(self, xs, ys):
+        """
+        Mark the cells of a rectangular grid that an edge of any ring passes
+        through or touches.
+
+        Parameters:
+            xs, ys (numpy.ndarray): Increasing grid lines along x and y.
+
+        Returns:
+            numpy.ndarray: Boolean array of shape (len(xs) - 1, len(ys) - 1).
+        """
+        crossed = np.zeros((len(xs) - 1, len(ys) - 1), dtype=bool)
+        for x0, y0, x1, y1 in zip(*self._edges()):
+            # Cells overlapping the bounding box of the edge ...
+            i0 = max(np.searchsorted(xs, min(x0, x1), side="right") - 1, 0)
+            i1 = min(np.searchsorted(xs, max(x0, x1), side="left"), len(xs) - 1)
+            j0 = max(np.searchsorted(ys, min(y0, y1), side="right") - 1, 0)
+            j1 = min(np.searchsorted(ys, max(y0, y1), side="left"), len(ys) - 1)
+            if i1 <= i0 or j1 <= j0:
+                continue
+            # ... whose corners are not all strictly on one side of its line
+            side = ((x1 - x0) * (ys[None, j0:j1 + 1] - y0)
+                    - (y1 - y0) * (xs[i0:i1 + 1, None] - x0))
+            low = np.minimum(np.minimum(side[:-1, :-1], side[1:, :-1]), np.minimum(side[:-1, 1:], side[1:, 1:]))
+            high = np.maximum(np.maximum(side[:-1, :-1], side[1:, :-1]), np.maximum(side[:-1, 1:], side[1:, 1:]))
+            crossed[i0:i1, j0:j1] |= (low <= 0) & (high >= 0)
+        return crossed
+
+    def mesh(self, nx, ny):
+        """
+        Discretize the polygon into fibers on a regular nx by ny grid.
+
+        Interior cells keep their full area and centre; every cell an edge of the
+        outline or of a hole passes through is clipped exactly, so the fibers
+        reproduce the polygon's area even for parts thinner than a cell.
+
+        Parameters:
+            nx (int): Number of grid divisions along x.
+            ny (int): Number of grid divisions along y.
+
+        Returns:
+            tuple: (x, y, area) arrays of the fiber centroids and areas.
+        """
+        x_min, y_min, x_max, y_max = self.bounds()
+        xs = np.linspace(x_min, x_max, nx + 1)
+        ys = np.linspace(y_min, y_max, ny + 1)
+        centre_x = (xs[:-1, None] + xs[1:, None]) / 2 + np.zeros(ny)
+        centre_y = (ys[None, :-1] + ys[None, 1:]) / 2 + np.zeros((nx, 1))
+        # Cells no edge passes through lie entirely inside or outside, so their
+        # centre decides; every other cell is clipped.
+        boundary = self.crossed_cells(xs, ys)
+        interior = ~boundary & self.contains(centre_x, centre_y)
+        cell_area = np.diff(xs)[:, None] * np.diff(ys)[None, :]
+        fx = [centre_x[interior]]
+        fy = [centre_y[interior]]
+        fa = [cell_area[interior]]
+
+        for i, j in zip(*np.nonzero(boundary)):
+            cell = self.clip(1.0, 0.0, xs[i]).clip(-1.0, 0.0, -xs[i + 1])
+            cell = cell.clip(0.0, 1.0, ys[j]).clip(0.0, -1.0, -ys[j + 1])
+            a = cell.area()
+            if a > 1e-12 * cell_area[i, j]:
+                cx, cy = cell.centroid()
+                fx.append([cx])
+                fy.append([cy])
+                fa.append([a])
+
+        return np.concatenate(fx), np.concatenate(fy), np.concatenate(fa)
+
+    def translate(self, dx, dy):
+        """
+        Return a copy of the polygon shifted by dx and dy.
+        """
+        offset = np.array([dx, dy], dtype=float)
+        return Polygon._from_rings([ring + offset for ring in self.rings])
+
+    def to_polygon(self):
+        return self
+
+    def clip(self, nx, ny, offset):
+        """
+        Clip the polygon to the half-plane nx * x + ny * y >= offset.
+
+        Every ring is clipped independently (Sutherland-Hodgman), which keeps the
+        Green's-theorem sums exact for the retained part, holes included.
+
+        Returns:
+            Polygon: The retained part (possibly with no rings if empty).
+        """
+        rings = []
+        for ring in self.rings:
+            clipped = self._clip_ring(ring, nx, ny, offset)
+            if len(clipped) >= 3:
+                rings.append(clipped)
+        return Polygon._from_rings(rings)
+
+    @staticmethod
+    def _clip_ring(ring, nx, ny, offset):
+        nxt = np.roll(ring, -1, axis=0)
+        d0 = ring @ (nx, ny) - offset
+        d1 = nxt @ (nx, ny) - offset
+        inside = d0 >= 0
+        crossing = inside != (d1 >= 0)
+        denom = np.where(crossing, d0 - d1, 1.0)
+        t = np.where(crossing, d0 / denom, 0.0)
+        cut = ring + t[:, None] * (nxt - ring)
+        points = np.stack((ring, cut), axis=1).reshape(-1, 2)
+        keep = np.column_stack((inside, crossing)).ravel()
+        return points[keep]
+
+    def compression_zone(self, neutral_axis, curvature):
+        """
+        Return the part of the polygon in compression for the strain field
+        strain = curvature * (y - neutral_axis).
+
+        Parameters:
+            neutral_axis (float): Position of the neutral axis.
+            curvature (float): Section curvature.
+        """
+        if curvature == 0:
+            return Polygon._from_rings([])
+        sign = -1.0 if curvature > 0 else 1.0
+        return self.clip(0.0, sign, sign * neutral_axis)
+
 
 class CompositeArea(Area):
     def __init__(self):
@@ -78,7 +448,7 @@ class CompositeArea(Area):
     def area(self):
         _sum = 0
         for component in self.components:
-            if isinstance(component[0], Fiber):
+            if isinstance(component[0], FiberBase):
                 _sum += component[0].area
             else:
                 _sum += component[0].area()
@@ -90,7 +460,7 @@ class CompositeArea(Area):
         A_total = self.area()
 
         for comp, dx, dy in self.components:
-            if isinstance(comp, Fiber):
+            if isinstance(comp, FiberBase):
                 A = comp.area
             else:
                 A = comp.area()
@@ -118,6 +488,28 @@ class CompositeArea(Area):
 
         return Ix_total, Iy_total
 
+    def product_of_inertia(self):
+        Ixy_total = 0
+        cx_total, cy_total = self.centroid()
+
+        for comp, dx, dy in self.components:
+            cx, cy = comp.centroid()
+            Ixy_total += comp.product_of_inertia() + comp.area() * (cx + dx - cx_total) * (cy + dy - cy_total)
+
+        return Ixy_total
+
+    def to_polygons(self):
+        """
+        Return the components as a list of Polygons shifted by their (dx, dy) offsets.
+        """
+        polygons = []
+        for comp, dx, dy in self.components:
+            if isinstance(comp, CompositeArea):
+                polygons.extend(polygon.translate(dx, dy) for polygon in comp.to_polygons())
+            elif not isinstance(comp, FiberBase):
+                polygons.append(comp.to_polygon().translate(dx, dy))
+        return polygons
+
 
 class Tee(CompositeArea):
     """
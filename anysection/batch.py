@@ -0,0 +1,192 @@
+# anysection/batch.py
+
+import numpy as np
+
+from anysection.solver import SectionSolver
+
+
+class BatchEvaluator:
+    """
+    Evaluate the fibers of one section for many realizations at once.
+
+    A realization is a set of fiber areas, fiber ordinates and materials. Any of
+    them may vary across a batch of R realizations: areas and ordinates as
+    (R, fibers) arrays, materials as objects whose parameters are (R, 1) arrays
+    (see Material.with_parameters). Everything that does not vary is shared.
+    Initial fiber strains (shrinkage, creep, prestress; see
+    SectionSolver.set_initial_strain) may vary too, e.g. one row per time step.
+
+    Parameters:
+        solver (SectionSolver): Solver providing the analysis fibers (material
+            regions are meshed with its mesh divisions).
+    """
+
+    def __init__(self, solver):
+        self._set_fibers(solver.analysis_fibers())
+        self.initial_strain = solver.initial_strain
+
+    def _set_fibers(self, fibers):
+        # float64 arrays (e.g. attached shared memory) are used without copying
+        self.area = np.asarray(fibers.area, dtype=float)
+        self.x = np.asarray(fibers.x, dtype=float)
+        self.y = np.asarray(fibers.y, dtype=float)
+        self.materials = list(fibers.materials)
+        ids = fibers.material_ids
+        self.groups = [(material, np.flatnonzero(ids == k)) for k, material in enumerate(self.materials)]
+        self.kernels = [material.kernel() for material in self.materials]
+
+    @classmethod
+    def from_fibers(cls, fibers):
+        """
+        Build an evaluator directly from a FiberArrays container.
+        """
+        evaluator = cls.__new__(cls)
+        evaluator._set_fibers(fibers)
+        evaluator.initial_strain = None
+        return evaluator
+
+    @classmethod
+    def from_section(cls, section, mesh_divisions=(20, 20)):
+        """
+        Build an evaluator for a section, meshing its material regions.
+        """
+        return cls(SectionSolver(section, mesh_divisions=mesh_divisions))
+
+    def material_index(self, material):
+        """
+        Return the index of a material in the material table.
+
+        Materials are matched by identity: two separately built materials with
+        equal parameters (which compare equal) stay distinct entries.
+        """
+        for k, candidate in enumerate(self.materials):
+            if candidate is material:
+                return k
+        raise ValueError(f"{material} is not a material of the section.")
+
+    def batched_materials(self, overrides):
+        """
+        Return the material table with some materials rebuilt with array parameters.
+
+        Parameters:
+            overrides (dict): Maps a material of the section (or its index in the
+                material table) to a dict of constructor arguments.
+        """
+        by_index = {}
+        for key, parameters in overrides.items():
+            index = key if isinstance(key, int) else self.material_index(key)
+            by_index[index] = parameters
+        return [material.with_parameters(**by_index[k]) if k in by_index else material
+                for k, material in enumerate(self.materials)]
+
+    def forces(self, neutral_axis, curvature, area=None, y=None, materials=None, initial_strain=None):
+        """
+        Axial force and moment about the neutral axis of every realization.
+
+        Parameters:
+            neutral_axis (numpy.ndarray): Neutral axis of every realization, shape (R,).
+            curvature (float or numpy.ndarray): Curvature, scalar or shape (R,).
+            area, y (numpy.ndarray, optional): Fiber areas and ordinates, shape
+                (fibers,) or (R, fibers). Default to the section's.
+            materials (list, optional): Material table (possibly batched).
+            initial_strain (numpy.ndarray, optional): Initial fiber strains added to
+                the plane strains, shape (fibers,) or (R, fibers). Defaults to those
+                of the solver the evaluator was built from.
+
+        Returns:
+            tuple: (axial forces, moments, sum of |fiber forces|), each of shape (R,).
+        """
+        area = self.area if area is None else area
+        y = self.y if y is None else y
+        kernels = self.kernels if materials is None else [material.kernel() for material in materials]
+        lever_arm = y - np.asarray(neutral_axis)[:, None]
+        strain = np.asarray(curvature).reshape(-1, 1) * lever_arm
+        initial_strain = self.initial_strain if initial_strain is None else initial_strain
+        if initial_strain is not None:
+            strain = strain + initial_strain
+        stress = np.empty(strain.shape)
+        for (_, index), kernel in zip(self.groups, kernels):
+            stress[:, index] = kernel.stress(strain[:, index])
+        force = stress * area
+        return force.sum(axis=1), (force * lever_arm).sum(axis=1), np.abs(force).sum(axis=1)
+
+    def equilibrium(self, curvature, axial_force, area=None, y=None, materials=None, max_iter=50, rtol=1e-6,
+                    initial_strain=None):
+        """
+        Solve the neutral axis of every realization with a vectorized Illinois
+        (modified false position) iteration, bracketed by the section height and
+        widened beyond it where needed.
+
+        Parameters:
+            curvature (float or numpy.ndarray): Curvature, scalar or shape (R,).
+            axial_force (numpy.ndarray): Target axial force of every realization, shape (R,).
+            area, y, materials, initial_strain: See `forces`.
+            max_iter (int): Maximum number of iterations.
+            rtol (float): Equilibrium tolerance relative to the sum of |fiber forces|.
+
+        Returns:
+            tuple: (neutral axes, moments, converged mask), each of shape (R,).
+        """
+        axial_force = np.asarray(axial_force, dtype=float)
+        y_fibers = self.y if y is None else y
+        bottom = np.broadcast_to(y_fibers.min(axis=-1), axial_force.shape).astype(float)
+        top = np.broadcast_to(y_fibers.max(axis=-1), axial_force.shape).astype(float)
+        a, b = bottom, top
+        fa = self.forces(a, curvature, area, y, materials, initial_strain)[0] - axial_force
+        fb = self.forces(b, curvature, area, y, materials, initial_strain)[0] - axial_force
+        bracketed = fa * fb <= 0
+        # Under large axial forces and small curvatures the neutral axis lies
+        # outside the section: widen the bracket where no sign change was found.
+        depth = np.maximum(top - bottom, 1e-12)
+        for expansion in range(30):
+            if bracketed.all():
+                break
+            widen = ~bracketed
+            a = np.where(widen, bottom - depth * 2.0 ** expansion, a)
+            b = np.where(widen, top + depth * 2.0 ** expansion, b)
+            fa = np.where(widen, self.forces(a, curvature, area, y, materials, initial_strain)[0] - axial_force,
+                          fa)
+            fb = np.where(widen, self.forces(b, curvature, area, y, materials, initial_strain)[0] - axial_force,
+                          fb)
+            bracketed = fa * fb <= 0
+        for _ in range(max_iter):
+            denominator = fb - fa
+            safe = denominator != 0
+            c = np.where(safe, (a * fb - b * fa) / np.where(safe, denominator, 1.0), (a + b) / 2)
+            axial, moment, scale = self.forces(c, curvature, area, y, materials, initial_strain)
+            fc = axial - axial_force
+            converged = bracketed & (np.abs(fc) <= rtol * scale + 1e-6)
+            if converged.all():
+                break
+            flip = fc * fb < 0
+            a, fa = np.where(flip, b, a), np.where(flip, fb, fa / 2)
+            b, fb = c, fc
+        return c, moment, converged
+
+    def moment_curvature(self, curvatures, axial_force, area=None, y=None, materials=None, max_iter=50, rtol=1e-6,
+                         initial_strain=None):
+        """
+        Moment-curvature analysis of every realization.
+
+        Parameters:
+            curvatures (iterable): Curvature values.
+            axial_force (numpy.ndarray): Target axial force of every realization, shape (R,).
+            area, y, materials, max_iter, rtol, initial_strain: See `equilibrium`.
+
+        Returns:
+            tuple: (neutral axes, moments) of shape (R, curvatures), NaN where no
+            equilibrium was found.
+        """
+        axial_force = np.asarray(axial_force, dtype=float)
+        curvatures = np.asarray(curvatures, dtype=float)
+        neutral_axes = np.full(axial_force.shape + curvatures.shape, np.nan)
+        moments = np.full(axial_force.shape + curvatures.shape, np.nan)
+        for k, curvature in enumerate(curvatures):
+            na, moment, converged = self.equilibrium(curvature, axial_force, area, y, materials, max_iter, rtol,
+                                                     initial_strain)
+            neutral_axes[:, k] = np.where(converged, na, np.nan)
+            moments[:, k] = np.where(converged, moment, np.nan)
+        return neutral_axes, moments
+
+    def __str__(self):
+        return f"BatchEvaluator: {len(self.area)} fibers, {len(self.materials)} materials"
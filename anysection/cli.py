@@ -0,0 +1,369 @@
+# anysection/cli.py
+
+import argparse
+import cProfile
+import functools
+import json
+import os
+import pstats
+import re
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from io import StringIO
+from time import perf_counter
+
+import numpy as np
+
+from anysection.area import Circle, Polygon, Rectangle, Triangle
+from anysection.batch import BatchEvaluator
+from anysection.material import MaterialFactory
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+AREAS = {"Rectangle": Rectangle, "Circle": Circle, "Triangle": Triangle, "Polygon": Polygon}
+PHASES = ("meshing", "material evaluation", "neutral-axis search", "post-processing")
+FORMATS = ("csv", "npz")
+
+
+class PhaseTimer:
+    """
+    Exclusive wall time per named phase: time spent in a phase nested inside
+    another (e.g. material evaluation inside the neutral-axis search) is only
+    counted for the inner one.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+        self._nested = []
+
+    @contextmanager
+    def phase(self, name):
+        start = perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed - self._nested.pop()
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def wrap(self, instance, method, name):
+        """
+        Time every call of a method of one instance as phase `name`.
+        """
+        function = getattr(instance, method)
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return function(*args, **kwargs)
+
+        setattr(instance, method, timed)
+
+    def merge(self, totals, calls):
+        for name, seconds in totals.items():
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + calls[name]
+
+    def report(self):
+        total = sum(self.totals.values()) or 1.0
+        names = [name for name in PHASES if name in self.totals] + sorted(set(self.totals) - set(PHASES))
+        lines = [f"{'phase':<22}{'seconds':>10}{'share':>8}{'calls':>9}"]
+        for name in names:
+            lines.append(f"{name:<22}{self.totals[name]:>10.3f}{self.totals[name] / total:>8.1%}"
+                         f"{self.calls[name]:>9}")
+        return "\n".join(lines)
+
+
+def load_model(path):
+    """
+    Read a JSON model file.
+
+    The file names its materials (MaterialFactory specs) and lists the sections:
+
+        {
+          "materials": {"C30": {"model": "Concrete_ParabolicLinearEC2", ...},
+                        "B500": {"model": "Steel_Bilinear", "Es": 200e9, ...}},
+          "sections": [
+            {"name": "C1",
+             "areas": [{"shape": "Rectangle", "width": 0.4, "height": 0.6, "material": "C30"}],
+             "fibers": [{"area": 3.14e-4, "x": [-0.15, 0.15], "y": -0.25, "material": "B500"}],
+             "loads": [{"axial_force": -1e6, "moment": 2e5}]}
+          ]
+        }
+
+    Areas take the constructor arguments of Rectangle, Circle, Triangle or
+    Polygon plus an optional shift "dx", "dy"; fiber entries may give arrays.
+
+    Returns:
+        tuple: (material specs by name, section specs).
+    """
+    with open(path) as f:
+        model = json.load(f)
+    sections = model.get("sections", [])
+    if not sections:
+        raise ValueError(f"Model file '{path}' defines no sections.")
+    return model.get("materials", {}), sections
+
+
+def build_section(spec, materials):
+    """
+    Build a Section from a section spec of a model file.
+
+    Parameters:
+        spec (dict): Section spec (see `load_model`).
+        materials (dict): Materials by name.
+    """
+    section = Section(spec.get("name", "Section"))
+    for area_spec in spec.get("areas", []):
+        parameters = dict(area_spec)
+        shape = parameters.pop("shape")
+        if shape not in AREAS:
+            raise ValueError(f"Unknown area shape '{shape}', expected one of {tuple(AREAS)}.")
+        material = parameters.pop("material", None)
+        dx, dy = parameters.pop("dx", 0.0), parameters.pop("dy", 0.0)
+        section.add_area(AREAS[shape](**parameters), dx=dx, dy=dy,
+                         material=None if material is None else materials[material])
+    for fiber_spec in spec.get("fibers", []):
+        area, x, y = np.broadcast_arrays(*(np.atleast_1d(np.asarray(fiber_spec[key], dtype=float))
+                                           for key in ("area", "x", "y")))
+        section.add_fibers(area, x, y, materials[fiber_spec["material"]])
+    return section
+
+
+def _axial_limits(evaluator):
+    """
+    Smallest and largest axial force of the section under uniform strains.
+    """
+    strains = np.linspace(-0.05, 0.05, 2001)
+    axial = np.zeros(len(strains))
+    for (_, index), kernel in zip(evaluator.groups, evaluator.kernels):
+        axial += kernel.stress(strains) * evaluator.area[index].sum()
+    return axial.min(), axial.max()
+
+
+def _section_moments(evaluator, curvatures, axial_forces, centroid):
+    """
+    Neutral axes and moments about the section centroid, shape (axial forces, curvatures).
+    """
+    neutral_axes, moments = evaluator.moment_curvature(curvatures, axial_forces)
+    # The evaluator returns moments about the neutral axis: M_c = M_na + (na - y_c) N
+    return neutral_axes, moments + (neutral_axes - centroid) * axial_forces[:, None]
+
+
+def _capacities(evaluator, curvatures, axial_forces, centroid):
+    """
+    Moment capacity (the moment of largest magnitude over the curvatures, with
+    their sign) at every axial force, and the curvature reaching it.
+    """
+    _, moments = _section_moments(evaluator, curvatures, axial_forces, centroid)
+    valid = ~np.isnan(moments).all(axis=1)
+    peak = np.argmax(np.where(np.isnan(moments), -np.inf, np.abs(moments)), axis=1)
+    capacity = np.where(valid, moments[np.arange(len(moments)), peak], np.nan)
+    return capacity, np.where(valid, curvatures[peak], np.nan)
+
+
+def _moment_curvature(evaluator, spec, options, timer):
+    curvatures = options["curvatures"]
+    axial_forces = np.asarray(options["axial_forces"], dtype=float)
+    neutral_axes, moments = _section_moments(evaluator, curvatures, axial_forces, options["centroid"])
+    with timer.phase("post-processing"):
+        columns = {"axial_force": np.repeat(axial_forces, len(curvatures)),
+                   "curvature": np.tile(curvatures, len(axial_forces)),
+                   "moment": moments.ravel(), "neutral_axis": neutral_axes.ravel()}
+        peak = np.nanmax(np.abs(moments)) if not np.isnan(moments).all() else np.nan
+        summary = f"{len(axial_forces)} axial force(s) x {len(curvatures)} curvatures, peak |moment| {peak:.4g}"
+    return columns, summary, True
+
+
+def _interaction(evaluator, spec, options, timer):
+    curvatures = np.abs(options["curvatures"])
+    with timer.phase("material evaluation"):
+        low, high = _axial_limits(evaluator)
+    axial_forces = np.linspace(low, high, options["points"] + 2)[1:-1]
+    positive, positive_curvature = _capacities(evaluator, curvatures, axial_forces, options["centroid"])
+    negative, negative_curvature = _capacities(evaluator, -curvatures, axial_forces, options["centroid"])
+    with timer.phase("post-processing"):
+        columns = {"axial_force": axial_forces, "moment_positive": positive, "curvature_positive": positive_curvature,
+                   "moment_negative": negative, "curvature_negative": negative_curvature}
+        summary = f"{len(axial_forces)} points, N from {low:.4g} to {high:.4g}"
+    return columns, summary, True
+
+
+def _capacity(evaluator, spec, options, timer):
+    loads = spec.get("loads", [])
+    if not loads:
+        raise ValueError(f"Section '{spec.get('name')}' has no loads to check.")
+    axial_forces = np.array([load["axial_force"] for load in loads], dtype=float)
+    demand = np.array([load["moment"] for load in loads], dtype=float)
+    # The capacity is taken in the direction of the demand (curvature of the same sign)
+    curvatures = np.abs(options["curvatures"])
+    positive, _ = _capacities(evaluator, curvatures, axial_forces, options["centroid"])
+    negative, _ = _capacities(evaluator, -curvatures, axial_forces, options["centroid"])
+    capacity = np.where(demand >= 0, positive, negative)
+    with timer.phase("post-processing"):
+        utilization = demand / capacity
+        passed = utilization <= 1.0
+        columns = {"axial_force": axial_forces, "moment": demand, "capacity": capacity,
+                   "utilization": utilization, "passed": passed.astype(float)}
+        summary = (f"{len(loads)} load(s), max utilization {np.nanmax(utilization):.3f} "
+                   f"({'ok' if passed.all() else 'FAILED'})")
+    return columns, summary, bool(passed.all())
+
+
+JOBS = {"moment-curvature": _moment_curvature, "interaction": _interaction, "capacity": _capacity}
+
+
+def run_job(task):
+    """
+    Run one job on one section (in a worker process when --workers > 1).
+
+    Parameters:
+        task (dict): "job", "section" (spec), "materials" (specs by name),
+            "options", "profile" and, when profiling, "profile_path" for the
+            cProfile statistics.
+
+    Returns:
+        dict: "name", "columns", "summary", "passed", the phase "totals" and
+        "calls" and, when profiling, the tracemalloc "peak" and the largest
+        "allocations" still held at the end of the job.
+    """
+    timer = PhaseTimer()
+    profile = task["profile"]
+    if profile:
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    with timer.phase("meshing"):
+        materials = {name: MaterialFactory.from_spec(spec) for name, spec in task["materials"].items()}
+        section = build_section(task["section"], materials)
+        options = dict(task["options"], centroid=section.centroid()[1])
+        evaluator = BatchEvaluator(SectionSolver(section, mesh_divisions=tuple(options["mesh"])))
+    if profile:
+        timer.wrap(evaluator, "equilibrium", "neutral-axis search")
+        timer.wrap(evaluator, "forces", "material evaluation")
+    columns, summary, passed = JOBS[task["job"]](evaluator, task["section"], options, timer)
+
+    result = {"name": section.name, "columns": columns, "summary": summary, "passed": passed,
+              "totals": timer.totals, "calls": timer.calls}
+    if profile:
+        profiler.disable()
+        # Live allocations at the end of the job, without those of the profilers themselves
+        snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, cProfile.__file__),
+                                                              tracemalloc.Filter(False, tracemalloc.__file__)))
+        result["peak"] = tracemalloc.get_traced_memory()[1]
+        result["allocations"] = [str(statistic) for statistic in snapshot.statistics("lineno")[:5]]
+        tracemalloc.stop()
+        profiler.dump_stats(task["profile_path"])
+    return result
+
+
+def write_columns(columns, path, file_format):
+    """
+    Write equally long named columns to a CSV file (header row) or an .npz archive.
+    """
+    if file_format == "npz":
+        np.savez(path, **columns)
+    else:
+        np.savetxt(path, np.column_stack(list(columns.values())), delimiter=",", header=",".join(columns),
+                   comments="")
+    return path
+
+
+def _file_name(name, job, file_format, used):
+    stem = "".join(c if c.isalnum() or c in "-_." else "_" for c in f"{name}_{job}")
+    used[stem] = used.get(stem, 0) + 1
+    if used[stem] > 1:
+        stem = f"{stem}_{used[stem]}"
+    return f"{stem}.{file_format}"
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog="anysection",
+                                     description="Batch section analysis of the sections of a JSON model file.")
+    # Compressive forces are negative and usually written like -5e5, which
+    # argparse (before Python 3.13) would take for an option
+    parser._negative_number_matcher = re.compile(r"^-(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+    parser.add_argument("job", choices=tuple(JOBS), help="Analysis to run on every section.")
+    parser.add_argument("model", help="JSON model file (materials and sections, see anysection.cli.load_model).")
+    parser.add_argument("--sections", nargs="+", metavar="NAME", help="Only analyse these sections.")
+    parser.add_argument("--axial-force", type=float, nargs="+", default=[0.0], metavar="N",
+                        help="Axial force(s) of the moment-curvature job [N], tension positive.")
+    parser.add_argument("--curvatures", type=float, nargs=3, default=(5e-4, 0.03, 60),
+                        metavar=("START", "STOP", "NUM"), help="Curvature steps [1/m].")
+    parser.add_argument("--points", type=int, default=21, help="Axial force levels of the interaction job.")
+    parser.add_argument("--mesh", type=int, nargs=2, default=(20, 20), metavar=("NX", "NY"),
+                        help="Mesh divisions of the material regions.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (one section per task).")
+    parser.add_argument("--output", metavar="DIR", help="Write one columnar file per section to DIR.")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="Format of the output files.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Report time per phase plus cProfile and tracemalloc summaries "
+                             "(tracemalloc slows the run down).")
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the `anysection` command.
+
+    Returns:
+        int: 0 on success, 1 if a capacity check failed.
+    """
+    args = _parser().parse_args(argv)
+    start = perf_counter()
+    materials, sections = load_model(args.model)
+    if args.sections:
+        missing = set(args.sections) - {spec.get("name") for spec in sections}
+        if missing:
+            raise SystemExit(f"anysection: unknown section(s) {sorted(missing)}")
+        sections = [spec for spec in sections if spec.get("name") in args.sections]
+    first, last, count = args.curvatures
+    options = {"curvatures": np.linspace(first, last, int(count)), "axial_forces": args.axial_force,
+               "points": args.points, "mesh": args.mesh}
+
+    with tempfile.TemporaryDirectory(prefix="anysection-profile-") if args.profile else nullcontext() as directory:
+        tasks = [{"job": args.job, "section": spec, "materials": materials, "options": options,
+                  "profile": args.profile,
+                  "profile_path": os.path.join(directory, f"{i}.prof") if args.profile else None}
+                 for i, spec in enumerate(sections)]
+        if args.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                results = list(executor.map(run_job, tasks))
+        else:
+            results = [run_job(task) for task in tasks]
+
+        timer = PhaseTimer()
+        for result in results:
+            timer.merge(result["totals"], result["calls"])
+        with timer.phase("post-processing"):
+            used = {}
+            for result in results:
+                line = f"{result['name']}: {result['summary']}"
+                if args.output:
+                    os.makedirs(args.output, exist_ok=True)
+                    path = os.path.join(args.output, _file_name(result["name"], args.job, args.format, used))
+                    line += f" -> {write_columns(result['columns'], path, args.format)}"
+                print(line)
+        print(f"{len(results)} section(s) in {perf_counter() - start:.2f} s with {args.workers} worker(s)")
+
+        if args.profile:
+            print("\nTime per phase (summed over sections):")
+            print(timer.report())
+            stream = StringIO()
+            stats = pstats.Stats(*(task["profile_path"] for task in tasks), stream=stream)
+            stats.sort_stats("cumulative").print_stats(20)
+            print("\ncProfile (top 20 by cumulative time):")
+            print(stream.getvalue().strip())
+            peak = max(results, key=lambda result: result["peak"])
+            print(f"\ntracemalloc: peak {peak['peak'] / 2 ** 20:.1f} MiB ({peak['name']}), "
+                  f"largest allocations held at the end:")
+            for line in peak["allocations"]:
+                print(f"  {line}")
+    return 0 if all(result["passed"] for result in results) else 1
@@ -0,0 +1,249 @@
+# anysection/confinement.py
+
+from math import pi
+
+import numpy as np
+
+from anysection.area import Circle, Polygon, Rectangle
+from anysection.material import Concrete_ConfinedKappos, Concrete_ConfinedSpoelstra
+
+
+class Hoops:
+    """
+    Transverse reinforcement of a rectangular or circular section.
+
+    The confined core is bounded by the hoop centreline (cover to the outside
+    of the hoop plus half a bar). Rectangular hoops have `legs_x` legs running
+    along x and `legs_y` legs running along y (2 and 2 for a perimeter hoop;
+    crossties add legs); circular sections use hoops or a spiral.
+
+    Parameters:
+        diameter (float): Hoop bar diameter.
+        spacing (float): Centre-to-centre spacing of the hoops along the member.
+        fy (float): Yield strength of the hoops [Pa].
+        cover (float): Clear cover to the outside of the hoops.
+        legs_x, legs_y (int): Number of legs in each direction (rectangular).
+        spiral (bool): Continuous spiral instead of closed hoops (circular).
+        Es (float): Elastic modulus of the hoops [Pa].
+    """
+
+    def __init__(self, diameter, spacing, fy, cover, legs_x=2, legs_y=2, spiral=False, Es=200e9):
+        self.diameter = diameter
+        self.spacing = spacing
+        self.fy = fy
+        self.cover = cover
+        self.legs_x = legs_x
+        self.legs_y = legs_y
+        self.spiral = spiral
+        self.Es = Es
+
+    @property
+    def bar_area(self):
+        return pi * self.diameter ** 2 / 4
+
+    def _core_dimensions(self, area):
+        offset = self.cover + self.diameter / 2
+        if isinstance(area, Rectangle):
+            return area.width - 2 * offset, area.height - 2 * offset
+        if isinstance(area, Circle):
+            return 2 * (area.radius - offset), None
+        raise TypeError(f"Confinement is defined for Rectangle and Circle areas, not {type(area).__name__}.")
+
+    def core(self, area, dx=0.0, dy=0.0):
+        """
+        Return the confined core of an area (placed like the area, shifted by dx, dy).
+        """
+        width, height = self._core_dimensions(area)
+        if width <= 0 or (height is not None and height <= 0):
+            raise ValueError("The cover and hoops leave no confined core.")
+        cx, cy = area.centroid()
+        if height is None:
+            return Circle(width / 2, cx, cy).to_polygon().translate(dx, dy)
+        return Rectangle(width, height, cx, cy).to_polygon().translate(dx, dy)
+
+    def volumetric_ratio(self, area):
+        """
+        Volume of hoops per volume of confined core.
+        """
+        width, height = self._core_dimensions(area)
+        if height is None:
+            return 4 * self.bar_area / (width * self.spacing)
+        return self.bar_area * (self.legs_x * width + self.legs_y * height) / (width * height * self.spacing)
+
+    def effectiveness(self, area, longitudinal_ratio=0.0):
+        """
+        Mander confinement effectiveness coefficient ke: the effectively confined
+        share of the core, reduced by arching between hoops and, for rectangular
+        hoops, between laterally restrained longitudinal bars (taken at the legs).
+
+        Parameters:
+            area (Rectangle or Circle): The section area.
+            longitudinal_ratio (float): Longitudinal reinforcement ratio of the core.
+        """
+        width, height = self._core_dimensions(area)
+        clear = self.spacing - self.diameter
+        if height is None:
+            arching = 1 - clear / (2 * width)
+            confined = arching if self.spiral else arching ** 2
+        else:
+            gaps = 2 * width ** 2 / max(self.legs_y - 1, 1) + 2 * height ** 2 / max(self.legs_x - 1, 1)
+            confined = ((1 - gaps / (6 * width * height)) * (1 - clear / (2 * width))
+                        * (1 - clear / (2 * height)))
+        return max(confined, 0.0) / (1 - longitudinal_ratio)
+
+    def confined_material(self, area, fc, eco=0.002, longitudinal_ratio=0.0):
+        """
+        Confined concrete of the core: Concrete_ConfinedKappos for rectangular
+        hoops, Concrete_ConfinedSpoelstra with the hoops smeared into an
+        equivalent jacket (tj = ke * Ab / s) for circular ones.
+
+        Parameters:
+            area (Rectangle or Circle): The section area.
+            fc (float): Unconfined compressive strength (magnitude) [Pa].
+            eco (float): Strain at peak stress (magnitude).
+            longitudinal_ratio (float): Longitudinal reinforcement ratio of the core.
+
+        Returns:
+            Material: The confined concrete.
+        """
+        width, height = self._core_dimensions(area)
+        ke = self.effectiveness(area, longitudinal_ratio)
+        if height is None:
+            return Concrete_ConfinedSpoelstra(D=width, tj=ke * self.bar_area / self.spacing, fco=fc, fju=self.fy,
+                                              Ej=self.Es, eco=eco)
+        return Concrete_ConfinedKappos(fc=fc, eco=eco, rw=ke * self.volumetric_ratio(area), bc=min(width, height),
+                                       s=self.spacing, fyw=self.fy, HoopType="rectangular")
+
+    def core_mask(self, area, x, y, dx=0.0, dy=0.0):
+        """
+        Vectorized test of which points lie in the confined core.
+        """
+        return self.core(area, dx, dy).contains(x, y)
+
+    def __str__(self):
+        return f"Hoops: d = {self.diameter}, s = {self.spacing}, cover = {self.cover}"
+
+
+def add_confined_area(section, area, hoops, material, fc, eco=0.002, dx=0.0, dy=0.0, longitudinal_ratio=0.0):
+    """
+    Add a hoop-confined Rectangle or Circle to a section as two material
+    regions: the cover (the area with the core as a hole) with the unconfined
+    material and the core with the confined concrete derived from the hoops.
+
+    Parameters:
+        section (Section): Section to add to.
+        area (Rectangle or Circle): Gross concrete area.
+        hoops (Hoops): Transverse reinforcement.
+        material (Material): Unconfined (cover) concrete.
+        fc, eco, longitudinal_ratio: See Hoops.confined_material.
+        dx, dy (float): Shift of the area.
+
+    Returns:
+        Material: The confined core concrete.
+    """
+    core = hoops.core(area)
+    outer = area.to_polygon()
+    cover = Polygon(outer.vertices, holes=[core.vertices])
+    core_material = hoops.confined_material(area, fc, eco, longitudinal_ratio)
+    section.add_area(area, dx=dx, dy=dy)  # geometric properties of the gross area
+    section.regions.append((cover, dx, dy, material))
+    section.regions.append((core, dx, dy, core_material))
+    return core_material
+
+
+class Confinement:
+    """
+    Hoop confinement recorded on a SectionSolver (see `assign_confinement`).
+
+    It is applied whenever the solver builds its fibers and regions, so that
+    re-meshing (adaptive refinement, initial strains on the analytic backend)
+    keeps it: material regions of `material` that enclose the confined core
+    are split into a cover region (the core as a hole) and a core region of
+    `core_material`, and discrete fibers of `material` inside the core are
+    moved to `core_material` on a copy of the section's fibers.
+
+    Parameters:
+        area (Rectangle or Circle): Gross concrete area.
+        hoops (Hoops): Transverse reinforcement.
+        material (Material): Unconfined concrete.
+        core_material (Material): Confined concrete.
+        dx, dy (float): Shift of the area.
+    """
+
+    def __init__(self, area, hoops, material, core_material, dx=0.0, dy=0.0):
+        self.area = area
+        self.hoops = hoops
+        self.material = material
+        self.core_material = core_material
+        self.dx = dx
+        self.dy = dy
+        self.core = hoops.core(area, dx, dy)
+
+    def split_regions(self, regions):
+        """
+        Split the (polygon, material) regions of `material` enclosing the core.
+        """
+        split = []
+        for polygon, material in regions:
+            if material is self.material and polygon.contains(*self.core.vertices.T).all():
+                cover = Polygon(polygon.vertices, holes=list(polygon.holes) + [self.core.vertices])
+                split.extend(((cover, material), (self.core, self.core_material)))
+            else:
+                split.append((polygon, material))
+        return split
+
+    def fiber_mask(self, fibers):
+        """
+        Boolean mask of the fibers of `material` inside the core.
+        """
+        if not any(entry is self.material for entry in fibers.materials):
+            return np.zeros(len(fibers), dtype=bool)
+        candidates = fibers.material_ids == fibers.material_index(self.material)
+        return candidates & self.core.contains(fibers.x, fibers.y)
+
+    def __str__(self):
+        return f"Confinement: {self.material.name} -> {self.core_material.name} ({self.hoops})"
+
+
+def assign_confinement(fibers, area, hoops, material, core_material, dx=0.0, dy=0.0):
+    """
+    Confine the concrete of `material` inside the hoops with `core_material`.
+
+    For a FiberArrays container the fibers inside the core are reassigned in
+    place, with one vectorized point-in-polygon test. For a SectionSolver the
+    confinement is recorded (see Confinement) and the solver rebuilt: regions
+    integrated in closed form or meshed are split into cover and core, and
+    discrete fibers are reassigned on a copy, so the section is not changed.
+
+    Parameters:
+        fibers (FiberArrays or SectionSolver): Fibers or solver to confine.
+        area (Rectangle or Circle): Gross concrete area the fibers were meshed from.
+        hoops (Hoops): Transverse reinforcement.
+        material (Material): Unconfined concrete of the meshed fibers.
+        core_material (Material): Confined concrete.
+        dx, dy (float): Shift of the area.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the reassigned fibers; for a solver, of
+        its analysis fibers of `core_material` (regions integrated in closed
+        form have no fibers).
+    """
+    confinement = Confinement(area, hoops, material, core_material, dx, dy)
+    if not hasattr(fibers, "analysis_fibers"):
+        mask = confinement.fiber_mask(fibers)
+        fibers.assign_material(mask, core_material)
+        return mask
+
+    solver = fibers
+    regions = solver.section.region_polygons()
+    for previous in solver.confinements:
+        regions = previous.split_regions(regions)
+    if (len(confinement.split_regions(regions)) == len(regions)
+            and not confinement.fiber_mask(solver.section.fibers).any()):
+        raise ValueError(f"No region or fiber of {material.name} encloses the confined core.")
+    solver.confinements.append(confinement)
+    solver._prepare()
+    analysis = solver.analysis_fibers()
+    if not any(entry is core_material for entry in analysis.materials):
+        return np.zeros(len(analysis), dtype=bool)
+    return analysis.material_ids == analysis.material_index(core_material)
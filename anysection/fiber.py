@@ -1,13 +1,14 @@
-class Fiber:
+import operator
+
+import numpy as np
+
+
+class FiberBase:
     """
-    Represents a fiber in a section, with area and material properties.
+    Behaviour shared by Fiber and FiberView; subclasses provide the area, x,
+    y and material attributes. Slot-free, so views carry no unused storage.
     """
-
-    def __init__(self, area, x, y, material):
-        self.area = area  # Area of the fiber
-        self.x = x        # X-coordinate of the fiber centroid
-        self.y = y        # Y-coordinate of the fiber centroid
-        self.material = material  # Associated material object
+    __slots__ = ()
 
     def stress(self, strain):
         """
@@ -29,3 +30,237 @@ class Fiber:
 
     def __str__(self):
         return f"Fiber at ({self.x}, {self.y}) with area {self.area} and material {self.material.name}"
+
+
+class Fiber(FiberBase):
+    """
+    Represents a fiber in a section, with area and material properties.
+    """
+    __slots__ = ("area", "x", "y", "material")
+
+    def __init__(self, area, x, y, material):
+        self.area = area  # Area of the fiber
+        self.x = x        # X-coordinate of the fiber centroid
+        self.y = y        # Y-coordinate of the fiber centroid
+        self.material = material  # Associated material object
+
+
+class FiberView(FiberBase):
+    """
+    Lightweight view of one fiber stored in a FiberArrays container.
+
+    Reads and writes go straight to the underlying arrays, so views can be
+    created on demand without duplicating the fiber data.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    @property
+    def area(self):
+        return float(self._store._area[self._index])
+
+    @area.setter
+    def area(self, value):
+        self._store._area[self._index] = value
+
+    @property
+    def x(self):
+        return float(self._store._x[self._index])
+
+    @x.setter
+    def x(self, value):
+        self._store._x[self._index] = value
+
+    @property
+    def y(self):
+        return float(self._store._y[self._index])
+
+    @y.setter
+    def y(self, value):
+        self._store._y[self._index] = value
+
+    @property
+    def material(self):
+        return self._store.materials[self._store._material_ids[self._index]]
+
+    @material.setter
+    def material(self, value):
+        self._store._material_ids[self._index] = self._store.material_index(value)
+
+
+class FiberArrays:
+    """
+    Columnar storage of fibers: area and coordinate arrays plus a small table of
+    materials referenced by index.
+
+    A fiber costs 3 floats and one int32 material index, i.e. 28 bytes in
+    float64 or 16 bytes in float32, against roughly 256 bytes for a Fiber
+    object with a __dict__ registered in the section's CompositeArea.
+
+    Parameters:
+        dtype: Floating point type of the area and coordinate arrays
+            (numpy.float64 or numpy.float32).
+        capacity (int): Number of fibers to preallocate.
+    """
+
+    def __init__(self, dtype=np.float64, capacity=0):
+        self.dtype = np.dtype(dtype)
+        self.materials = []
+        self._material_lookup = {}
+        self._size = 0
+        self._area = np.empty(capacity, dtype=self.dtype)
+        self._x = np.empty(capacity, dtype=self.dtype)
+        self._y = np.empty(capacity, dtype=self.dtype)
+        self._material_ids = np.empty(capacity, dtype=np.int32)
+
+    @classmethod
+    def from_arrays(cls, area, x, y, material_ids, materials):
+        """
+        Wrap existing arrays (e.g. shared memory or memory-mapped files) without copying.
+
+        Parameters:
+            area, x, y (numpy.ndarray): Fiber areas and centroid coordinates.
+            material_ids (numpy.ndarray): int32 index of every fiber's material.
+            materials (list): Material table.
+        """
+        fibers = cls.__new__(cls)
+        fibers.dtype = area.dtype
+        fibers.materials = list(materials)
+        fibers._material_lookup = {id(material): k for k, material in enumerate(fibers.materials)}
+        fibers._size = len(area)
+        fibers._area, fibers._x, fibers._y, fibers._material_ids = area, x, y, material_ids
+        return fibers
+
+    def material_index(self, material):
+        """
+        Return the index of a material in the material table, registering it if needed.
+        """
+        key = id(material)
+        if key not in self._material_lookup:
+            self._material_lookup[key] = len(self.materials)
+            self.materials.append(material)
+        return self._material_lookup[key]
+
+    def _reserve(self, extra):
+        required = self._size + extra
+        capacity = len(self._area)
+        if required <= capacity:
+            return
+        capacity = max(required, 2 * capacity, 16)
+        for name in ("_area", "_x", "_y", "_material_ids"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, area, x, y, material):
+        """
+        Add a single fiber.
+        """
+        self.extend([area], [x], [y], material)
+
+    def append(self, fiber):
+        """
+        Add a Fiber object (kept for code that treats the fibers as a list).
+        """
+        self.add(fiber.area, fiber.x, fiber.y, fiber.material)
+
+    def extend(self, area, x, y, material):
+        """
+        Add many fibers sharing one material.
+
+        Parameters:
+            area, x, y (array_like): Fiber areas and centroid coordinates.
+            material (Material): Material of all added fibers.
+        """
+        area = np.asarray(area, dtype=self.dtype).ravel()
+        count = len(area)
+        self._reserve(count)
+        end = self._size + count
+        self._area[self._size:end] = area
+        self._x[self._size:end] = np.asarray(x, dtype=self.dtype).ravel()
+        self._y[self._size:end] = np.asarray(y, dtype=self.dtype).ravel()
+        self._material_ids[self._size:end] = self.material_index(material)
+        self._size = end
+
+    def extend_from(self, other):
+        """
+        Append every fiber of another FiberArrays container.
+        """
+        remap = np.array([self.material_index(m) for m in other.materials], dtype=np.int32)
+        count = len(other)
+        self._reserve(count)
+        end = self._size + count
+        self._area[self._size:end] = other.area
+        self._x[self._size:end] = other.x
+        self._y[self._size:end] = other.y
+        if count:
+            self._material_ids[self._size:end] = remap[other.material_ids]
+        self._size = end
+
+    def assign_material(self, mask, material):
+        """
+        Change the material of the selected fibers.
+
+        Parameters:
+            mask (array_like): Boolean mask or indices of the fibers.
+            material (Material): New material of those fibers.
+        """
+        self.material_ids[mask] = self.material_index(material)
+
+    def trim(self):
+        """
+        Release the spare capacity left by amortized growth.
+        """
+        for name in ("_area", "_x", "_y", "_material_ids"):
+            setattr(self, name, getattr(self, name)[:self._size].copy())
+
+    @property
+    def area(self):
+        return self._area[:self._size]
+
+    @property
+    def x(self):
+        return self._x[:self._size]
+
+    @property
+    def y(self):
+        return self._y[:self._size]
+
+    @property
+    def material_ids(self):
+        return self._material_ids[:self._size]
+
+    @property
+    def nbytes(self):
+        """
+        Memory held by the fiber arrays, spare capacity included.
+        """
+        return self._area.nbytes + self._x.nbytes + self._y.nbytes + self._material_ids.nbytes
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # A list of views, as slicing the former list of fibers returned
+            return [FiberView(self, k) for k in range(*index.indices(self._size))]
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(f"fiber indices must be integers or slices, not {type(index).__name__}") from None
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("fiber index out of range")
+        return FiberView(self, index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield FiberView(self, index)
+
+    def __str__(self):
+        return f"FiberArrays: {self._size} fibers, {len(self.materials)} materials"
@@ -0,0 +1,196 @@
+# anysection/fields.py
+
+import os
+
+import numpy as np
+
+QUANTITIES = ("strain", "stress", "force", "tangent")
+
+
+class FiberFields:
+    """
+    Lazy fiber-level fields (strains, stresses, ...) of a sequence of strain planes.
+
+    Only the strain planes are stored; the fields of a step are computed from
+    its plane when they are requested, so a 100k-fiber mesh analysed over
+    hundreds of curvature steps never holds steps x fibers arrays unless asked
+    to. Fields can be read one step at a time, streamed in chunks of steps, or
+    written chunk by chunk to memory-mapped ".npy" files.
+
+    The strain of fiber i in step s is
+    planes[s, 0] + planes[s, 1] * (y_i - yr) [+ planes[s, 2] * (x_i - xr)]
+    plus its initial strain, if any.
+
+    Example:
+        results = solver.moment_curvature_analysis(curvatures)
+        fields = solver.fiber_fields(quantities=("stress",))
+        for steps, chunk in fields.chunks(50):
+            peak = np.maximum(peak, np.abs(chunk["stress"]).max(axis=0))
+
+    Parameters:
+        area, x, y (array_like): Fiber areas and coordinates.
+        groups (list): (material, fiber indices) pairs.
+        planes (array_like): (steps, 2) or (steps, 3) strain planes.
+        reference (tuple): (xr, yr) point of the planes.
+        fibers (array_like, optional): Indices or boolean mask of the fibers to
+            keep; defaults to all fibers.
+        quantities (tuple): Fields to compute, any of "strain", "stress",
+            "force" (stress * area) and "tangent" (tangent modulus).
+        initial_strain (array_like, optional): Initial fiber strains, shape
+            (fibers,) or (steps, fibers), over all fibers.
+    """
+
+    def __init__(self, area, x, y, groups, planes, reference=(0.0, 0.0), fibers=None,
+                 quantities=("strain", "stress"), initial_strain=None):
+        unknown = set(quantities) - set(QUANTITIES)
+        if unknown:
+            raise ValueError(f"Unknown quantities {sorted(unknown)}, expected some of {QUANTITIES}.")
+        self.planes = np.atleast_2d(np.asarray(planes, dtype=float))
+        self.reference = tuple(float(value) for value in reference)
+        self.quantities = tuple(quantities)
+
+        count = len(np.asarray(area))
+        if fibers is None:
+            fibers = np.arange(count)
+        fibers = np.asarray(fibers)
+        self.fibers = np.flatnonzero(fibers) if fibers.dtype == bool else fibers.astype(int)
+        self.area = np.asarray(area, dtype=float)[self.fibers]
+        x = np.asarray(x, dtype=float)[self.fibers]
+        y = np.asarray(y, dtype=float)[self.fibers]
+        self.lever_arms = np.vstack((np.ones_like(y), y - self.reference[1], x - self.reference[0]))
+        self.initial_strain = None if initial_strain is None else \
+            np.asarray(initial_strain, dtype=float)[..., self.fibers]
+
+        # Material groups restricted to the kept fibers, as positions in the selection
+        position = np.full(count, -1)
+        position[self.fibers] = np.arange(len(self.fibers))
+        self._groups = []
+        for material, index in groups:
+            kept = position[index]
+            kept = kept[kept >= 0]
+            if len(kept):
+                self._groups.append((material.kernel(), kept))
+
+    @classmethod
+    def from_solver(cls, solver, planes, fibers=None, quantities=("strain", "stress"), initial_strain=None):
+        """
+        Fields of the analysis fibers of a SectionSolver for planes about the origin.
+        """
+        fiber_arrays = solver.analysis_fibers()
+        return cls(fiber_arrays.area, fiber_arrays.x, fiber_arrays.y, solver.material_groups(), planes,
+                   fibers=fibers, quantities=quantities, initial_strain=initial_strain)
+
+    @classmethod
+    def from_evaluator(cls, evaluator, planes, reference=(0.0, 0.0), fibers=None, quantities=("strain", "stress"),
+                       initial_strain=None):
+        """
+        Fields of the fibers of a BatchEvaluator (e.g. for StrainPlaneSolver planes).
+        """
+        if initial_strain is None:
+            initial_strain = evaluator.initial_strain
+        return cls(evaluator.area, evaluator.x, evaluator.y, evaluator.groups, planes, reference, fibers, quantities,
+                   initial_strain)
+
+    @staticmethod
+    def planes_from_neutral_axes(curvatures, neutral_axes):
+        """
+        Convert (curvature, neutral axis) steps of the legacy solvers, where
+        strain = curvature * (y - neutral axis), to planes about the origin.
+        """
+        curvatures = np.asarray(curvatures, dtype=float)
+        neutral_axes = np.asarray(neutral_axes, dtype=float)
+        return np.column_stack((-curvatures * neutral_axes, curvatures))
+
+    def __len__(self):
+        return len(self.planes)
+
+    def compute(self, steps):
+        """
+        Fields of some steps.
+
+        Parameters:
+            steps (int, slice or array_like): Steps to evaluate.
+
+        Returns:
+            dict: Quantity name -> array of shape (steps, kept fibers); a single
+            int step gives arrays of shape (kept fibers,).
+        """
+        planes = self.planes[steps]
+        single = planes.ndim == 1
+        planes = np.atleast_2d(planes)
+        strain = planes @ self.lever_arms[:planes.shape[1]]
+        if self.initial_strain is not None:
+            initial = self.initial_strain if self.initial_strain.ndim == 1 else self.initial_strain[steps]
+            strain = strain + initial
+        fields = {}
+        if "strain" in self.quantities:
+            fields["strain"] = strain
+        if {"stress", "force"} & set(self.quantities):
+            stress = np.empty(strain.shape)
+            for kernel, index in self._groups:
+                stress[:, index] = kernel.stress(strain[:, index])
+            if "stress" in self.quantities:
+                fields["stress"] = stress
+            if "force" in self.quantities:
+                fields["force"] = stress * self.area
+        if "tangent" in self.quantities:
+            tangent = np.empty(strain.shape)
+            for kernel, index in self._groups:
+                tangent[:, index] = kernel.tangent(strain[:, index])
+            fields["tangent"] = tangent
+        if single:
+            fields = {name: values[0] for name, values in fields.items()}
+        return fields
+
+    def __getitem__(self, steps):
+        return self.compute(steps)
+
+    def __iter__(self):
+        """
+        Yield the fields of one step at a time.
+        """
+        for step in range(len(self.planes)):
+            yield self.compute(step)
+
+    def chunks(self, size=64):
+        """
+        Yield (step slice, fields) for consecutive chunks of `size` steps, so that
+        at most size x fibers values of every quantity are held at once.
+        """
+        for start in range(0, len(self.planes), size):
+            steps = slice(start, min(start + size, len(self.planes)))
+            yield steps, self.compute(steps)
+
+    def save(self, directory, chunk_size=64):
+        """
+        Write every quantity to "<directory>/<quantity>.npy" chunk by chunk
+        through memory maps, plus the planes and the kept fiber indices.
+
+        Returns:
+            dict: Quantity name -> read-only memory-mapped (steps, fibers) array.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "planes.npy"), self.planes)
+        np.save(os.path.join(directory, "fibers.npy"), self.fibers)
+        shape = (len(self.planes), len(self.fibers))
+        outputs = {name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                                   dtype=float, shape=shape)
+                   for name in self.quantities}
+        for steps, fields in self.chunks(chunk_size):
+            for name, values in fields.items():
+                outputs[name][steps] = values
+        for output in outputs.values():
+            output.flush()
+        del outputs
+        return self.load(directory, self.quantities)
+
+    @staticmethod
+    def load(directory, quantities=("strain", "stress")):
+        """
+        Memory-map the fields written by `save`.
+        """
+        return {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in quantities}
+
+    def __str__(self):
+        return (f"FiberFields: {len(self.planes)} steps x {len(self.fibers)} fibers "
+                f"({', '.join(self.quantities)})")
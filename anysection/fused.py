@@ -0,0 +1,190 @@
+# anysection/fused.py
+
+import numpy as np
+
+from anysection.material import PiecewisePolynomialKernel
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+ENGINES = ("auto", "numpy", "numba")
+NUMBA_AVAILABLE = numba is not None
+prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def resolve_engine(engine):
+    """
+    Return the fiber integration engine to use: "auto" picks "numba" when Numba
+    is installed and "numpy" otherwise.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}.")
+    if engine == "auto":
+        return "numba" if NUMBA_AVAILABLE else "numpy"
+    if engine == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("The 'numba' engine needs the optional numba package (pip install numba).")
+    return engine
+
+
+def _fiber_stress(strain, table, breaks, values, break_start, break_count, coefficients, row_start):
+    # Binary search for the interval (same rows as PiecewisePolynomialKernel),
+    # then Horner's scheme on the coefficient row; breakpoints take their own value.
+    low = break_start[table]
+    end = low + break_count[table]
+    high = end
+    while low < high:
+        middle = (low + high) // 2
+        if breaks[middle] < strain:
+            low = middle + 1
+        else:
+            high = middle
+    if low < end and breaks[low] == strain:
+        return values[low]
+    row = row_start[table] + low - break_start[table]
+    stress = 0.0
+    for j in range(coefficients.shape[1] - 1, -1, -1):
+        stress = stress * strain + coefficients[row, j]
+    return stress
+
+
+def _sums_over_cases(y, area, tables, initial_strain, neutral_axis, curvature, breaks, values, break_start,
+                     break_count, coefficients, row_start, out):
+    # One load case per (parallel) iteration; no temporaries per fiber
+    for case in prange(neutral_axis.shape[0]):
+        force = 0.0
+        moment = 0.0
+        magnitude = 0.0
+        for i in range(y.shape[0]):
+            table = tables[i]
+            if table < 0:
+                continue
+            lever_arm = y[i] - neutral_axis[case]
+            strain = curvature[case] * lever_arm + initial_strain[i]
+            fiber_force = _fiber_stress(strain, table, breaks, values, break_start, break_count,
+                                        coefficients, row_start) * area[i]
+            force += fiber_force
+            moment += fiber_force * lever_arm
+            magnitude += abs(fiber_force)
+        out[case, 0] = force
+        out[case, 1] = moment
+        out[case, 2] = magnitude
+
+
+def _sums_over_fibers(y, area, tables, initial_strain, neutral_axis, curvature, breaks, values, break_start,
+                      break_count, coefficients, row_start):
+    # A single load case: parallel over fibers with scalar reductions
+    force = 0.0
+    moment = 0.0
+    magnitude = 0.0
+    for i in prange(y.shape[0]):
+        table = tables[i]
+        if table >= 0:
+            lever_arm = y[i] - neutral_axis
+            strain = curvature * lever_arm + initial_strain[i]
+            fiber_force = _fiber_stress(strain, table, breaks, values, break_start, break_count,
+                                        coefficients, row_start) * area[i]
+            force += fiber_force
+            moment += fiber_force * lever_arm
+            magnitude += abs(fiber_force)
+    return force, moment, magnitude
+
+
+if NUMBA_AVAILABLE:
+    _fiber_stress = numba.njit(cache=True, inline="always")(_fiber_stress)
+    _sums_over_cases = numba.njit(cache=True, parallel=True)(_sums_over_cases)
+    _sums_over_fibers = numba.njit(cache=True, parallel=True)(_sums_over_fibers)
+
+
+class FusedFiberKernel:
+    """
+    Fused fiber integration: strain, material law and the force/moment
+    reductions in one loop over the fiber arrays, without temporary arrays.
+
+    Every piecewise-polynomial material is packed into shared breakpoint and
+    coefficient tables (the rows of its PiecewisePolynomialKernel), so the law
+    dispatch is a table lookup inside the loop. Fibers of other laws (e.g.
+    Steel_ParkSampson) are not fused: they stay on the NumPy path, which
+    allocates strain and force temporaries for those fibers on every call, and
+    their sums are added. The loops are compiled with Numba when it is
+    installed; the pure-Python versions are only meant as a reference.
+
+    Parameters:
+        fibers (FiberArrays): Analysis fibers.
+        kernels (list): Material kernels, one per entry of the material table.
+    """
+
+    def __init__(self, fibers, kernels):
+        self.y = np.ascontiguousarray(fibers.y, dtype=float)
+        self.area = np.ascontiguousarray(fibers.area, dtype=float)
+        ids = np.asarray(fibers.material_ids)
+        compiled = [k for k, kernel in enumerate(kernels) if isinstance(kernel, PiecewisePolynomialKernel)]
+        width = max([kernels[k].coefficients.shape[1] for k in compiled], default=1)
+
+        table_of = np.full(len(kernels), -1)
+        breaks, values, break_start, break_count, rows, row_start = [], [], [], [], [], []
+        for table, k in enumerate(compiled):
+            kernel = kernels[k]
+            table_of[k] = table
+            break_start.append(sum(len(b) for b in breaks))
+            break_count.append(len(kernel.breaks))
+            breaks.append(kernel.breaks)
+            values.append(kernel.values)
+            row_start.append(sum(len(r) for r in rows))
+            padded = np.zeros((len(kernel.coefficients), width))
+            padded[:, :kernel.coefficients.shape[1]] = kernel.coefficients
+            rows.append(padded)
+
+        self.tables = np.ascontiguousarray(table_of[ids], dtype=np.int64) if len(ids) else np.zeros(0, np.int64)
+        self.breaks = np.concatenate(breaks) if breaks else np.zeros(0)
+        self.values = np.concatenate(values) if values else np.zeros(0)
+        self.break_start = np.asarray(break_start, dtype=np.int64)
+        self.break_count = np.asarray(break_count, dtype=np.int64)
+        self.coefficients = np.ascontiguousarray(np.vstack(rows) if rows else np.zeros((0, width)))
+        self.row_start = np.asarray(row_start, dtype=np.int64)
+        self._zeros = np.zeros(len(self.y))
+        # Fibers whose laws are not piecewise polynomial stay on the NumPy path
+        self.remaining = [(np.flatnonzero(ids == k), kernel) for k, kernel in enumerate(kernels)
+                          if table_of[k] < 0 and np.any(ids == k)]
+
+    def _tables(self):
+        return self.breaks, self.values, self.break_start, self.break_count, self.coefficients, self.row_start
+
+    def __call__(self, neutral_axis, curvature, initial_strain=None):
+        """
+        Axial force, moment about the neutral axis and sum of |fiber forces|.
+
+        Parameters:
+            neutral_axis, curvature (float or array_like): One load case (scalars)
+                or a batch of cases (arrays of equal length).
+            initial_strain (numpy.ndarray, optional): Initial fiber strains.
+
+        Returns:
+            tuple: (force, moment, magnitude), floats or arrays over the cases.
+        """
+        initial = self._zeros if initial_strain is None else np.ascontiguousarray(initial_strain, dtype=float)
+        if np.ndim(neutral_axis) == 0 and np.ndim(curvature) == 0:
+            force, moment, magnitude = _sums_over_fibers(self.y, self.area, self.tables, initial,
+                                                         float(neutral_axis), float(curvature), *self._tables())
+        else:
+            neutral_axis, curvature = np.broadcast_arrays(np.atleast_1d(np.asarray(neutral_axis, dtype=float)),
+                                                          np.atleast_1d(np.asarray(curvature, dtype=float)))
+            out = np.empty((len(neutral_axis), 3))
+            _sums_over_cases(self.y, self.area, self.tables, initial, np.ascontiguousarray(neutral_axis),
+                             np.ascontiguousarray(curvature), *self._tables(), out)
+            force, moment, magnitude = out[:, 0], out[:, 1], out[:, 2]
+
+        for index, kernel in self.remaining:
+            lever_arm = self.y[index] - np.asarray(neutral_axis, dtype=float)[..., None]
+            strain = np.asarray(curvature, dtype=float)[..., None] * lever_arm + initial[index]
+            fiber_force = kernel.stress(strain) * self.area[index]
+            force = force + fiber_force.sum(axis=-1)
+            moment = moment + (fiber_force * lever_arm).sum(axis=-1)
+            magnitude = magnitude + np.abs(fiber_force).sum(axis=-1)
+        return force, moment, magnitude
+
+    def __str__(self):
+        compiled = int((self.tables >= 0).sum())
+        return (f"FusedFiberKernel: {compiled} of {len(self.tables)} fibers fused "
+                f"({'numba' if NUMBA_AVAILABLE else 'pure Python'})")
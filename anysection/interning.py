@@ -0,0 +1,121 @@
+# anysection/interning.py
+
+import hashlib
+from enum import Enum
+
+import numpy as np
+
+
+def freeze(value):
+    """
+    Convert a value to a hashable, value-based key.
+
+    Arrays are reduced to their shape, dtype and a digest of their contents,
+    containers are frozen element-wise and objects that define `_identity`
+    (materials and areas) use it.
+
+    Parameters:
+        value: Number, string, array, list/tuple/dict or Material/Area.
+
+    Returns:
+        Hashable key that compares equal for equal values.
+    """
+    if hasattr(value, "_identity"):
+        return value._identity()
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        digest = hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+        return ("ndarray", data.shape, data.dtype.str, digest)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, float) and value == 0.0:
+        return 0.0  # -0.0 and 0.0 describe the same section
+    if isinstance(value, (int, float, complex, str, bytes, bool, Enum, type(None))):
+        return value
+    raise TypeError(f"Cannot build a value key for {type(value).__name__} objects.")
+
+
+def section_signature(section):
+    """
+    Value-based key of a section: its areas, material regions, fibers and
+    materials. The section name is not part of the key.
+    """
+    fibers = section.fibers
+    return (
+        freeze(section.composite_area),
+        tuple((freeze(area), freeze(dx), freeze(dy), freeze(material))
+              for area, dx, dy, material in section.regions),
+        tuple(freeze(material) for material in fibers.materials),
+        freeze(fibers.area), freeze(fibers.x), freeze(fibers.y), freeze(fibers.material_ids),
+    )
+
+
+def section_digest(section):
+    """
+    Short hex digest of `section_signature`, e.g. to key sections across processes.
+    """
+    return hashlib.blake2b(repr(section_signature(section)).encode(), digest_size=16).hexdigest()
+
+
+class SectionRegistry:
+    """
+    Interning registry of sections.
+
+    A model with thousands of members usually has only a few dozen distinct
+    sections. The registry keeps one canonical Section per distinct signature
+    so that batch work runs once per unique section and is fanned back out.
+
+    Example:
+        registry = SectionRegistry()
+        capacities = registry.map(lambda s: SectionSolver(s).moment_curvature_analysis(...),
+                                  member_sections)
+    """
+
+    def __init__(self):
+        self._sections = {}
+
+    def intern(self, section):
+        """
+        Return the canonical section equal to `section`, registering it if new.
+        """
+        return self._sections.setdefault(section_signature(section), section)
+
+    def unique(self, sections):
+        """
+        Deduplicate sections.
+
+        Parameters:
+            sections (iterable): Sections, possibly with repeats.
+
+        Returns:
+            tuple: (list of unique canonical sections, numpy int array mapping every
+            input section to its index in that list).
+        """
+        order = {}
+        unique = []
+        inverse = []
+        for section in sections:
+            canonical = self.intern(section)
+            if id(canonical) not in order:
+                order[id(canonical)] = len(unique)
+                unique.append(canonical)
+            inverse.append(order[id(canonical)])
+        return unique, np.asarray(inverse, dtype=int)
+
+    def map(self, function, sections):
+        """
+        Apply `function` once per unique section and return one result per input.
+        """
+        unique, inverse = self.unique(sections)
+        results = [function(section) for section in unique]
+        return [results[k] for k in inverse]
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __str__(self):
+        return f"SectionRegistry: {len(self._sections)} unique sections"
@@ -0,0 +1,406 @@
+# anysection/keypoints.py
+
+import numpy as np
+
+from anysection.batch import BatchEvaluator
+
+
+def _interpolate_rows(curvatures, values, at):
+    """
+    Linear interpolation of every row of `values` (curves, curvatures) at its own curvature.
+    """
+    j = np.clip(np.searchsorted(curvatures, at) - 1, 0, len(curvatures) - 2)
+    rows = np.arange(len(values))
+    weight = (at - curvatures[j]) / (curvatures[j + 1] - curvatures[j])
+    return (1 - weight) * values[rows, j] + weight * values[rows, j + 1]
+
+
+def _area_up_to(curvatures, moments, limit):
+    """
+    Area under every curve from zero curvature up to its own `limit` (trapezoidal,
+    with a triangle from the origin to the first step).
+    """
+    moments = np.nan_to_num(moments)
+    rows = np.arange(len(moments))
+    cumulative = np.zeros(moments.shape)
+    cumulative[:, 1:] = np.cumsum(np.diff(curvatures) * (moments[:, 1:] + moments[:, :-1]) / 2, axis=1)
+    cumulative += moments[:, :1] * curvatures[0] / 2
+    j = np.clip(np.searchsorted(curvatures, limit) - 1, 0, len(curvatures) - 2)
+    end_moment = _interpolate_rows(curvatures, moments, limit)
+    return cumulative[rows, j] + (limit - curvatures[j]) * (moments[rows, j] + end_moment) / 2
+
+
+def peak_points(curvatures, moments):
+    """
+    Peak of every moment-curvature curve, refined by a parabola through the
+    largest step and its neighbours.
+
+    Parameters:
+        curvatures (numpy.ndarray): Increasing curvature steps, shape (curvatures,).
+        moments (numpy.ndarray): Moments, shape (curves, curvatures); NaN where
+            a step did not converge.
+
+    Returns:
+        tuple: (peak curvatures, peak moments, index of the largest step), each
+        of shape (curves,).
+    """
+    curvatures = np.asarray(curvatures, dtype=float)
+    moments = np.atleast_2d(moments)
+    rows = np.arange(len(moments))
+    filled = np.where(np.isnan(moments), -np.inf, moments)
+    k = filled.argmax(axis=1)
+    left, right = np.clip(k - 1, 0, None), np.clip(k + 1, None, len(curvatures) - 1)
+    x0, x1, x2 = curvatures[left], curvatures[k], curvatures[right]
+    y0, y1, y2 = filled[rows, left], filled[rows, k], filled[rows, right]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d01 = (y1 - y0) / (x1 - x0)
+        a = ((y2 - y1) / (x2 - x1) - d01) / (x2 - x0)
+        vertex = (x0 + x1) / 2 - d01 / (2 * a)
+        value = y0 + d01 * (vertex - x0) + a * (vertex - x0) * (vertex - x1)
+    usable = (k > 0) & (k < len(curvatures) - 1) & np.isfinite(y0) & np.isfinite(y2) & (a < 0)
+    usable &= (vertex > x0) & (vertex < x2)
+
+    valid = np.isfinite(y1)
+    peak_curvature = np.where(usable, vertex, x1)
+    peak_moment = np.where(usable, value, y1)
+    return np.where(valid, peak_curvature, np.nan), np.where(valid, peak_moment, np.nan), k
+
+
+def bilinear_idealization(curvatures, moments, reference_curvature, reference_moment, ultimate_curvature,
+                          ultimate_moment):
+    """
+    Equal-energy bilinear idealization of many moment-curvature curves.
+
+    The elastic branch runs from the origin through the reference point (usually
+    first yield) up to the idealized yield point; the second branch runs on to
+    the ultimate point. The idealized yield moment makes the area under the
+    bilinear curve equal the area under the computed curve up to ultimate:
+
+        My = (2 A - Mu ku) / (ku - Mu / K),  K = M_ref / k_ref
+
+    Parameters:
+        curvatures (numpy.ndarray): Increasing curvature steps, shape (curvatures,).
+        moments (numpy.ndarray): Moments, shape (curves, curvatures).
+        reference_curvature, reference_moment (numpy.ndarray): Point fixing the
+            elastic stiffness of every curve, shape (curves,).
+        ultimate_curvature, ultimate_moment (numpy.ndarray): Ultimate points, shape (curves,).
+
+    Returns:
+        tuple: (idealized yield curvatures, idealized yield moments), each of shape (curves,).
+    """
+    curvatures = np.asarray(curvatures, dtype=float)
+    moments = np.atleast_2d(moments)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stiffness = reference_moment / reference_curvature
+        energy = _area_up_to(curvatures, moments, np.nan_to_num(ultimate_curvature, nan=curvatures[0]))
+        yield_moment = (2 * energy - ultimate_moment * ultimate_curvature) / (
+            ultimate_curvature - ultimate_moment / stiffness)
+        yield_curvature = yield_moment / stiffness
+        # No bilinear fit exists when the yield point would lie beyond ultimate
+        valid = (yield_curvature > 0) & (yield_curvature <= ultimate_curvature)
+    return np.where(valid, yield_curvature, np.nan), np.where(valid, yield_moment, np.nan)
+
+
+class KeyPoints:
+    """
+    Key points of a batch of moment-curvature curves.
+
+    Attributes:
+        curvature (dict): Curvatures of "cracking", "first_yield", "peak",
+            "ultimate" and "idealized_yield", each an array over the curves (NaN
+            where the event does not occur).
+        moment (dict): Moments of the same points.
+        ultimate_cause (numpy.ndarray): Cause of ultimate per curve: "crushing",
+            "rupture", "moment_drop" or "last_step".
+    """
+
+    def __init__(self, curvature, moment, ultimate_cause):
+        self.curvature = curvature
+        self.moment = moment
+        self.ultimate_cause = ultimate_cause
+
+    @property
+    def ductility(self):
+        """
+        Curvature ductility, ultimate over idealized yield curvature.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.curvature["ultimate"] / self.curvature["idealized_yield"]
+
+    def __str__(self):
+        return f"KeyPoints of {len(self.ultimate_cause)} curves"
+
+
+def _first_positive_strain(material, limit, stress=False):
+    """
+    Scan a material law: the strain of maximum tensile stress (stress=True) or
+    the first failing strain towards `limit` (sign gives the direction).
+    """
+    strains = np.linspace(0.0, limit, 20001)[1:]
+    if stress:
+        values = material.kernel().stress(strains)
+        return float(strains[values.argmax()]) if values.max() > 0 else None
+    failed = np.flatnonzero([material.is_failure(strain) for strain in strains])
+    if not len(failed):
+        return None
+    # Bisect the scan step that contains the failure limit
+    low, high = (strains[failed[0] - 1] if failed[0] else 0.0), strains[failed[0]]
+    for _ in range(60):
+        middle = (low + high) / 2
+        low, high = (low, middle) if material.is_failure(middle) else (middle, high)
+    return float(high)
+
+
+class KeyPointAnalysis:
+    """
+    Batched moment-curvature analysis with key-point extraction.
+
+    Events are defined by the strain of the extreme fibers of a material set:
+    cracking (concrete reaches the strain of its peak tensile stress), first
+    yield (reinforcement reaches its yield strain), crushing and rupture
+    (concrete or reinforcement fail). Ultimate is the first of crushing,
+    rupture and the moment dropping below `moment_drop` times the peak. With
+    `refine` the solver is called again inside the bracketing curvature steps
+    until every event is located exactly instead of interpolated.
+
+    Parameters:
+        evaluator (BatchEvaluator): Batched fibers of the section.
+        concrete (Material or list): Concrete material(s).
+        reinforcement (Material or list): Reinforcement material(s).
+        cracking_strain, yield_strain (float, optional): Event strains; default
+            to the peak-tension strain of the concrete and `ey` of the reinforcement.
+        crushing_strain, rupture_strain (float, optional): Failure strains
+            (magnitudes); default to the `is_failure` limits of the materials.
+            Any event strain may also be an array with one value per realization,
+            e.g. the yield strains of batched reinforcement.
+        moment_drop (float): Fraction of the peak moment defining ultimate on the
+            softening branch.
+        reference (float, optional): Ordinate about which moments are reported;
+            defaults to the area centroid of the fibers. (BatchEvaluator returns
+            moments about the neutral axis, which differ once N is not zero.)
+    """
+
+    def __init__(self, evaluator, concrete, reinforcement, cracking_strain=None, yield_strain=None,
+                 crushing_strain=None, rupture_strain=None, moment_drop=0.8, reference=None):
+        self.evaluator = evaluator
+        if reference is None:
+            reference = np.dot(evaluator.area, evaluator.y) / evaluator.area.sum()
+        self.reference = reference
+        concrete = concrete if isinstance(concrete, (list, tuple)) else [concrete]
+        reinforcement = reinforcement if isinstance(reinforcement, (list, tuple)) else [reinforcement]
+        self.concrete_fibers = self._mask(concrete)
+        self.reinforcement_fibers = self._mask(reinforcement)
+        if cracking_strain is None:
+            cracking_strain = _first_positive_strain(concrete[0], 0.01, stress=True)
+        if yield_strain is None:
+            yield_strain = getattr(reinforcement[0], "ey", None)
+        if crushing_strain is None:
+            crushing_strain = _first_positive_strain(concrete[0], -0.05)
+        if rupture_strain is None:
+            rupture_strain = _first_positive_strain(reinforcement[0], 0.5)
+        self.cracking_strain = cracking_strain
+        self.yield_strain = yield_strain
+        self.crushing_strain = None if crushing_strain is None else np.abs(crushing_strain)
+        self.rupture_strain = rupture_strain
+        self.moment_drop = moment_drop
+
+    @classmethod
+    def from_section(cls, section, concrete, reinforcement, mesh_divisions=(20, 20), **options):
+        """
+        Build the analysis for a section, meshing its material regions.
+        """
+        return cls(BatchEvaluator.from_section(section, mesh_divisions), concrete, reinforcement, **options)
+
+    def _mask(self, materials):
+        mask = np.zeros(len(self.evaluator.area), dtype=bool)
+        for material, index in self.evaluator.groups:
+            if any(material is candidate for candidate in materials):
+                mask[index] = True
+        return mask
+
+    def _moment(self, neutral_axis, moment, axial_force):
+        """
+        Moment about the reference ordinate from the moment about the neutral axis.
+        """
+        return moment + (neutral_axis - self.reference) * axial_force
+
+    def _extreme_strains(self, mask, neutral_axis, curvature, y):
+        """
+        (max, min) strain over a fiber set; strains are linear in y, so only the
+        extreme ordinates of the set matter.
+        """
+        y = self.evaluator.y if y is None else y
+        y_set = y[..., mask]
+        top, bottom = y_set.max(axis=-1), y_set.min(axis=-1)
+        first, second = curvature * (top - neutral_axis), curvature * (bottom - neutral_axis)
+        return np.maximum(first, second), np.minimum(first, second)
+
+    def _event_measures(self, neutral_axis, curvature, y):
+        """
+        Event functions (positive once the event has happened) at given states.
+        """
+        def threshold(value, measure):
+            # Per-realization strains broadcast over the curvature steps
+            value = np.asarray(value, dtype=float)
+            return value.reshape(value.shape + (1,) * (np.ndim(measure) - value.ndim))
+
+        measures = {}
+        if self.cracking_strain is not None and self.concrete_fibers.any():
+            high = self._extreme_strains(self.concrete_fibers, neutral_axis, curvature, y)[0]
+            measures["cracking"] = high - threshold(self.cracking_strain, high)
+        if self.yield_strain is not None and self.reinforcement_fibers.any():
+            high, low = self._extreme_strains(self.reinforcement_fibers, neutral_axis, curvature, y)
+            extreme = np.maximum(high, -low)
+            measures["first_yield"] = extreme - threshold(self.yield_strain, extreme)
+        if self.crushing_strain is not None and self.concrete_fibers.any():
+            low = -self._extreme_strains(self.concrete_fibers, neutral_axis, curvature, y)[1]
+            measures["crushing"] = low - threshold(self.crushing_strain, low)
+        if self.rupture_strain is not None and self.reinforcement_fibers.any():
+            high = self._extreme_strains(self.reinforcement_fibers, neutral_axis, curvature, y)[0]
+            measures["rupture"] = high - threshold(self.rupture_strain, high)
+        return measures
+
+    def _refine(self, name, lower, upper, g_lower, g_upper, axial_force, area, y, materials, peak_moment,
+                idle_curvature, max_iter, tolerance):
+        """
+        Locate an event between bracketing curvatures with a vectorized Illinois
+        iteration; every function evaluation is a batched equilibrium solve.
+        Rows without an event are parked at `idle_curvature`.
+        """
+        active = np.isfinite(lower) & np.isfinite(upper)
+        a, b = np.where(active, lower, idle_curvature), np.where(active, upper, idle_curvature)
+        fa, fb = np.where(active, g_lower, -1.0), np.where(active, g_upper, 1.0)
+        c = b.copy()
+        neutral_axis = np.full(len(a), np.nan)
+        moment = np.full(len(a), np.nan)
+        for _ in range(max_iter):
+            denominator = fb - fa
+            c = np.where(denominator != 0, (a * fb - b * fa) / np.where(denominator != 0, denominator, 1.0),
+                         (a + b) / 2)
+            neutral_axis, moment, converged = self.evaluator.equilibrium(c, axial_force, area, y, materials)
+            moment = self._moment(neutral_axis, moment, axial_force)
+            if name == "moment_drop":
+                fc = self.moment_drop * peak_moment - np.where(converged, moment, -np.inf)
+            else:
+                fc = self._event_measures(neutral_axis, c, y)[name]
+            fc = np.where(np.isfinite(fc), fc, np.abs(fb))
+            if np.all(np.abs(b - a) <= tolerance * np.maximum(np.abs(b), 1e-300)) or np.all(fc == 0):
+                break
+            flip = fc * fb < 0
+            a, fa = np.where(flip, b, a), np.where(flip, fb, fa / 2)
+            b, fb = c, fc
+        return np.where(active, c, np.nan), np.where(active, moment, np.nan)
+
+    @staticmethod
+    def _first_crossing(values, start=None):
+        """
+        Index of the first step where `values` (curves, steps) becomes >= 0,
+        at or after `start`; -1 where it never does.
+        """
+        crossed = values >= 0
+        if start is not None:
+            crossed &= np.arange(values.shape[1]) >= start[:, None]
+        return np.where(crossed.any(axis=1), crossed.argmax(axis=1), -1)
+
+    def run(self, curvatures, axial_force, area=None, y=None, materials=None, refine=True, max_iter=40,
+            tolerance=1e-6):
+        """
+        Moment-curvature analysis and key points of every realization.
+
+        Parameters:
+            curvatures (array_like): Increasing, positive curvature steps.
+            axial_force (array_like): Axial force of every realization (positive = tension).
+            area, y, materials: Batched fiber data, see BatchEvaluator.forces.
+            refine (bool): Locate events with the solver instead of interpolating.
+            max_iter (int): Maximum refinement iterations.
+            tolerance (float): Relative curvature tolerance of the refinement.
+
+        Returns:
+            tuple: (KeyPoints, neutral axes, moments about the reference); the
+            arrays have shape (realizations, curvatures).
+        """
+        curvatures = np.asarray(curvatures, dtype=float)
+        axial_force = np.atleast_1d(np.asarray(axial_force, dtype=float))
+        neutral_axes, moments = self.evaluator.moment_curvature(curvatures, axial_force, area, y, materials)
+        moments = self._moment(neutral_axes, moments, axial_force[:, None])
+        count = len(axial_force)
+        rows = np.arange(count)
+        peak_curvature, peak_moment, peak_index = peak_points(curvatures, moments)
+
+        grid_measures = self._event_measures(neutral_axes, curvatures, None if y is None else y[..., None, :])
+        grid_measures = {name: np.where(np.isnan(moments), -np.inf, values) for name, values in grid_measures.items()}
+        # Beyond the peak: the moment falls under the drop limit or equilibrium is lost
+        drop = self.moment_drop * peak_moment[:, None] - np.where(np.isnan(moments), -np.inf, moments)
+        drop[:, 0] = -np.inf
+        grid_measures["moment_drop"] = np.where(np.arange(len(curvatures)) >= peak_index[:, None], drop, -np.inf)
+
+        curvature, moment = {}, {}
+        # Strain events measured at zero curvature (the unstrained section)
+        at_rest = self._event_measures(np.zeros(count), np.zeros(count), y)
+        for name, values in grid_measures.items():
+            k = self._first_crossing(values)
+            found = k >= 0
+            first = k == 0
+            lower_k, upper_k = np.clip(k - 1, 0, None), np.clip(k, 0, None)
+            lower = np.where(first, 0.0, curvatures[lower_k])
+            upper = curvatures[upper_k]
+            g_lower = np.where(first, at_rest.get(name, -np.inf), values[rows, lower_k])
+            g_upper = values[rows, upper_k]
+            g_upper = np.where(np.isfinite(g_upper), g_upper, np.abs(g_lower))
+            if refine:
+                event_curvature, event_moment = self._refine(
+                    name, np.where(found, lower, np.nan), np.where(found, upper, np.nan), g_lower, g_upper,
+                    axial_force, area, y, materials, peak_moment, curvatures[0], max_iter, tolerance)
+            else:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    weight = np.clip(-g_lower / (g_upper - g_lower), 0.0, 1.0)
+                lower_moment = np.where(first, 0.0, moments[rows, lower_k])
+                upper_moment = np.where(np.isnan(moments[rows, upper_k]), lower_moment, moments[rows, upper_k])
+                event_curvature = lower + weight * (upper - lower)
+                event_moment = lower_moment + weight * (upper_moment - lower_moment)
+            if name == "moment_drop":
+                # By definition; also well defined when the drop is a jump (bar rupture)
+                event_moment = self.moment_drop * peak_moment
+            curvature[name] = np.where(found, event_curvature, np.nan)
+            moment[name] = np.where(found, event_moment, np.nan)
+
+        # Ultimate: the earliest failure event, else the last converged step
+        causes = ["crushing", "rupture", "moment_drop"]
+        candidates = np.column_stack([curvature.pop(name, np.full(count, np.nan)) for name in causes])
+        candidate_moments = np.column_stack([moment.pop(name, np.full(count, np.nan)) for name in causes])
+        first = np.where(np.isnan(candidates), np.inf, candidates).argmin(axis=1)
+        has_event = np.isfinite(candidates).any(axis=1)
+        last = np.where(np.isnan(moments), -1, np.arange(len(curvatures))).max(axis=1)
+        last_moment = moments[rows, np.clip(last, 0, None)]
+        curvature["ultimate"] = np.where(has_event, candidates[rows, first],
+                                         np.where(last >= 0, curvatures[np.clip(last, 0, None)], np.nan))
+        moment["ultimate"] = np.where(has_event, candidate_moments[rows, first],
+                                      np.where(last >= 0, last_moment, np.nan))
+        ultimate_cause = np.where(has_event, np.array(causes)[first], "last_step")
+
+        curvature["peak"], moment["peak"] = peak_curvature, peak_moment
+        for name in ("cracking", "first_yield"):
+            curvature.setdefault(name, np.full(count, np.nan))
+            moment.setdefault(name, np.full(count, np.nan))
+
+        # Elastic stiffness from first yield, else (no yield before the peak)
+        # from the secant at 0.75 Mpeak
+        missing = ~(curvature["first_yield"] <= peak_curvature)
+        reference_curvature = np.where(missing, np.nan, curvature["first_yield"])
+        reference_moment = np.where(missing, np.nan, moment["first_yield"])
+        if missing.any():
+            filled = np.where(np.isnan(moments), -np.inf, moments)
+            k = self._first_crossing(filled - 0.75 * peak_moment[:, None])
+            k = np.clip(k, 1, None)
+            m0, m1 = moments[rows, k - 1], moments[rows, k]
+            weight = np.clip((0.75 * peak_moment - m0) / (m1 - m0), 0.0, 1.0)
+            reference_curvature[missing] = (curvatures[k - 1] + weight * (curvatures[k] - curvatures[k - 1]))[missing]
+            reference_moment[missing] = 0.75 * peak_moment[missing]
+        curvature["idealized_yield"], moment["idealized_yield"] = bilinear_idealization(
+            curvatures, moments, reference_curvature, reference_moment, curvature["ultimate"], moment["ultimate"])
+        return KeyPoints(curvature, moment, ultimate_cause), neutral_axes, moments
+
+    def __str__(self):
+        return (f"KeyPointAnalysis: {int(self.concrete_fibers.sum())} concrete and "
+                f"{int(self.reinforcement_fibers.sum())} reinforcement fibers")
@@ -1,8 +1,15 @@
-from math import sqrt, pow
+import inspect
+import json
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from math import pow, comb
 from enum import Enum
 from dataclasses import dataclass
 import numpy as np
 
+from anysection.interning import freeze
+
 class ModelType(Enum):
     """
     Enumeration of available material model types for concrete, steel, and FRP.
@@ -23,6 +30,11 @@ class ModelType(Enum):
 class Material:
     """
     Abstract base class for all material models.
+
+    Strains and stresses are tension-positive: compressive strains are negative
+    and produce negative stresses. Concrete laws returned positive compressive
+    stresses before this convention was adopted (see the migration note in the
+    README).
     """
 
     def __init__(self, name):
@@ -46,6 +58,85 @@ class Material:
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def stress_array(self, strain):
+        """
+        Vectorized stress evaluation.
+
+        Material parameters may themselves be arrays (e.g. shape (R, 1) for R
+        realizations), in which case they broadcast against the strain array.
+
+        Args:
+            strain (array_like): Input strains.
+
+        Returns:
+            numpy.ndarray: Computed stresses.
+        """
+        return np.vectorize(self.stress, otypes=[float])(strain)
+
+    def tangent_array(self, strain, step=1e-8):
+        """
+        Vectorized tangent modulus d(stress)/d(strain) by central differences.
+
+        Args:
+            strain (array_like): Input strains.
+            step (float): Strain increment of the difference quotient.
+
+        Returns:
+            numpy.ndarray: Tangent moduli.
+        """
+        strain = np.asarray(strain, dtype=float)
+        return (self.stress_array(strain + step) - self.stress_array(strain - step)) / (2 * step)
+
+    def parameters(self):
+        """
+        Return the constructor arguments of the material.
+
+        Returns:
+            dict: Argument name to value.
+        """
+        return {name: getattr(self, name) for name in _constructor_arguments(type(self))}
+
+    def with_parameters(self, **parameters):
+        """
+        Return a new material of the same type with some constructor arguments replaced.
+
+        Args:
+            **parameters: Constructor arguments to override (scalars or arrays).
+
+        Returns:
+            Material: The new material.
+        """
+        arguments = self.parameters()
+        arguments.update(parameters)
+        return type(self)(**arguments)
+
+    def kernel(self):
+        """
+        Build the evaluation kernel of the material.
+
+        Piecewise-polynomial laws compile to a breakpoint/coefficient table that
+        is evaluated in a single pass; other laws use their vectorized methods.
+
+        Returns:
+            MaterialKernel: Object with vectorized `stress` and `tangent` methods.
+        """
+        segments = self.polynomial_segments()
+        if segments is not None and all(np.ndim(value) == 0 for lower, upper, coefficients in segments
+                                        for value in [lower, upper, *coefficients]):
+            return PiecewisePolynomialKernel(segments, self.stress)
+        return MaterialKernel(self)
+
+    def _identity(self):
+        return type(self), freeze(self.parameters())
+
+    def __eq__(self, other):
+        if not isinstance(other, Material):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    def __hash__(self):
+        return hash(self._identity())
+
     def is_failure(self, strain):
         """
         Determine if the material has failed at the given strain.
@@ -58,10 +149,129 @@ class Material:
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def polynomial_segments(self):
+        """
+        Describe the stress-strain law as piecewise polynomials in strain.
+
+        Used by the analytic integration backend of SectionSolver. Laws that are
+        not piecewise polynomial return None and are integrated with fibers.
+
+        Returns:
+            list or None: (strain_min, strain_max, coefficients) tuples, with
+            coefficients in ascending powers of strain. Stress is zero outside
+            the listed intervals.
+        """
+        return None
+
     def __str__(self):
         return f"Material: {self.name}"
 
 
+@lru_cache(maxsize=None)
+def _constructor_arguments(cls):
+    return list(inspect.signature(cls.__init__).parameters)[1:]
+
+
+class MaterialKernel:
+    """
+    Evaluation kernel of a material: vectorized stress and tangent functions.
+
+    Material constants are computed once when the material is built, so the
+    kernel simply binds the material's array methods.
+
+    Args:
+        material (Material): Material to evaluate.
+    """
+
+    def __init__(self, material):
+        self.stress = material.stress_array
+        self.tangent = material.tangent_array
+
+
+class PiecewisePolynomialKernel(MaterialKernel):
+    """
+    Compiled kernel of a piecewise-polynomial law.
+
+    The segments are merged into sorted breakpoints and a coefficient table
+    (one row per interval, zero rows where the law gives no stress), so an
+    evaluation is one `searchsorted` followed by Horner's scheme instead of a
+    masked pass per branch. Tangents are exact polynomial derivatives.
+
+    Which interval a breakpoint belongs to differs between laws (e.g. the
+    tension branch of Concrete_MC90General starts at 0, the ultimate strain
+    of most laws closes the last branch), so the stress at every breakpoint is
+    stored separately and taken from the scalar law when it is given.
+
+    Args:
+        segments (list): (strain_min, strain_max, coefficients) tuples as
+            returned by Material.polynomial_segments.
+        point_stress (callable, optional): Scalar stress law evaluated at the
+            breakpoints; defaults to the interval ending at the breakpoint.
+    """
+
+    def __init__(self, segments, point_stress=None):
+        breaks = sorted({float(bound) for lower, upper, _ in segments for bound in (lower, upper)})
+        degree = max(len(coefficients) for _, _, coefficients in segments)
+        table = np.zeros((len(breaks) + 1, max(degree, 2)))
+        for k in range(len(breaks) - 1):
+            middle = (breaks[k] + breaks[k + 1]) / 2
+            for lower, upper, coefficients in segments:
+                if lower <= middle <= upper:
+                    table[k + 1, :len(coefficients)] = coefficients
+                    break
+        # Row k + 1 holds the interval (breaks[k], breaks[k + 1]); values[k] the stress at breaks[k]
+        self.breaks = np.array(breaks)
+        self.coefficients = table
+        if point_stress is None:
+            self.values = np.array([np.polyval(table[k, ::-1], b) for k, b in enumerate(breaks)])
+        else:
+            self.values = np.array([float(point_stress(b)) for b in breaks])
+        self._columns = [np.ascontiguousarray(table[:, j]) for j in range(table.shape[1])]
+        derivative = table[:, 1:] * np.arange(1, table.shape[1])
+        self._derivative_columns = [np.ascontiguousarray(derivative[:, j]) for j in range(derivative.shape[1])]
+
+    @staticmethod
+    def _horner(columns, strain, rows):
+        result = columns[-1][rows]
+        for column in columns[-2::-1]:
+            result *= strain
+            result += column[rows]
+        return result
+
+    def stress(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        rows = np.searchsorted(self.breaks, strain)
+        stress = self._horner(self._columns, strain, rows)
+        at = np.minimum(rows, len(self.breaks) - 1)
+        exact = self.breaks[at] == strain
+        if np.any(exact):
+            stress = np.where(exact, self.values[at], stress)
+        return stress
+
+    def tangent(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        return self._horner(self._derivative_columns, strain, np.searchsorted(self.breaks, strain))
+
+
+def _parabola_linear_array(strain, fc, eco, ecu):
+    """
+    Vectorized compression branch shared by the parabolic-linear concrete laws.
+    """
+    eta = -strain / eco
+    return np.where(eta <= 1, -fc * (2 * eta - eta * eta),
+                    np.where(-strain <= ecu, -fc * (1 - ((-strain - eco) / (ecu - eco))), 0.0))
+
+
+def _parabola_linear_segments(fc, eco, ecu):
+    """
+    Compression branch shared by the parabolic-linear concrete laws.
+    """
+    return [
+        (-eco, 0.0, [0.0, 2 * fc / eco, fc / eco ** 2]),
+        (-ecu, -eco, [-fc - fc * eco / (ecu - eco), -fc / (ecu - eco)]),
+    ]
+
+
 # ----------------- CONCRETE MATERIALS ----------------- #
 
 class Concrete_NonlinearEC2(Material):
@@ -78,21 +288,34 @@ class Concrete_NonlinearEC2(Material):
         self.fcm = fcm
         self.ec1 = ec1
         self.ecu1 = ecu1
-        self.Ec = 22000 * pow(fcm / 10, 0.3)
+        self.Ec = 22000 * (fcm / 10) ** 0.3
 
     def stress(self, strain):
         if strain >= 0:
             return 0
         elif abs(strain) <= self.ec1:
-            return self.fcm * (2 * (abs(strain) / self.ec1) - pow(abs(strain) / self.ec1, 2))
+            return -self.fcm * (2 * (abs(strain) / self.ec1) - pow(abs(strain) / self.ec1, 2))
         elif abs(strain) <= self.ecu1:
-            return self.fcm
+            return -self.fcm
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        eta = -strain / self.ec1
+        return np.where(strain >= 0, 0.0,
+                        np.where(eta <= 1, -self.fcm * (2 * eta - eta * eta),
+                                 np.where(-strain <= self.ecu1, -self.fcm, 0.0)))
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu1
 
+    def polynomial_segments(self):
+        return [
+            (-self.ec1, 0.0, [0.0, 2 * self.fcm / self.ec1, self.fcm / self.ec1 ** 2]),
+            (-self.ecu1, -self.ec1, [-self.fcm]),
+        ]
+
 
 class Concrete_ParabolicLinearEC2(Material):
     def __init__(self, fck, acc, gc, ec2, ecu2, n):
@@ -108,15 +331,35 @@ class Concrete_ParabolicLinearEC2(Material):
         if strain >= 0:
             return 0
         elif abs(strain) <= self.ec2:
-            return self.acc * self.fck / self.gc * (1 - pow((1 - abs(strain) / self.ec2), self.n))
+            return -self.acc * self.fck / self.gc * (1 - pow((1 - abs(strain) / self.ec2), self.n))
         elif abs(strain) <= self.ecu2:
-            return self.acc * self.fck / self.gc
+            return -self.acc * self.fck / self.gc
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        compression = -strain
+        fcd = self.acc * self.fck / self.gc
+        base = np.clip(1 - compression / self.ec2, 0.0, None)
+        return np.where(strain >= 0, 0.0,
+                        np.where(compression <= self.ec2, -fcd * (1 - base ** self.n),
+                                 np.where(compression <= self.ecu2, -fcd, 0.0)))
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu2
 
+    def polynomial_segments(self):
+        if self.n != int(self.n):
+            return None
+        n = int(self.n)
+        fcd = self.acc * self.fck / self.gc
+        coefficients = [0.0] + [fcd * comb(n, j) / self.ec2 ** j for j in range(1, n + 1)]
+        return [
+            (-self.ec2, 0.0, coefficients),
+            (-self.ecu2, -self.ec2, [-fcd]),
+        ]
+
 
 class Concrete_Popovics(Material):
     def __init__(self, Eco, fc, ec, ecu):
@@ -126,18 +369,33 @@ class Concrete_Popovics(Material):
         self.ec = ec
         self.ecu = ecu
 
+    @property
+    def r(self):
+        # Derived from the current parameters, so edits to them take effect
+        return self.Eco / (self.Eco - self.fc / self.ec)
+
     def stress(self, strain):
         if strain >= 0:
             return 0
         abs_strain = abs(strain)
-        r = self.Eco / (self.Eco - self.fc / self.ec)
+        r = self.r
         if abs_strain <= self.ec:
-            return self.fc * (r * abs_strain / self.ec) / (r - 1 + pow(abs_strain / self.ec, r))
+            return -self.fc * (r * abs_strain / self.ec) / (r - 1 + pow(abs_strain / self.ec, r))
         elif abs_strain <= self.ecu:
-            return self.fc * (1 - ((abs_strain - self.ec) / (self.ecu - self.ec)))
+            return -self.fc * (1 - ((abs_strain - self.ec) / (self.ecu - self.ec)))
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        ratio = np.clip(-strain, 0.0, None) / self.ec
+        r = self.r
+        ascending = -self.fc * (r * ratio) / (r - 1 + ratio ** r)
+        descending = -self.fc * (1 - (-strain - self.ec) / (self.ecu - self.ec))
+        return np.where(strain >= 0, 0.0,
+                        np.where(ratio <= 1, ascending,
+                                 np.where(-strain <= self.ecu, descending, 0.0)))
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu
 
@@ -157,15 +415,27 @@ class Concrete_ParabolicLinearGeneral(Material):
         if strain >= 0:
             return min(self.Ec * strain, self.ft) if strain <= self.etu else 0
         elif abs(strain) <= self.eco:
-            return self.fc * (2 * (abs(strain) / self.eco) - pow(abs(strain) / self.eco, 2))
+            return -self.fc * (2 * (abs(strain) / self.eco) - pow(abs(strain) / self.eco, 2))
         elif abs(strain) <= self.ecu:
-            return self.fc * (1 - ((abs(strain) - self.eco) / (self.ecu - self.eco)))
+            return -self.fc * (1 - ((abs(strain) - self.eco) / (self.ecu - self.eco)))
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        tension = np.where(strain <= self.etu, np.minimum(self.Ec * strain, self.ft), 0.0)
+        return np.where(strain >= 0, tension, _parabola_linear_array(strain, self.fc, self.eco, self.ecu))
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu
 
+    def polynomial_segments(self):
+        ecr = min(self.ft / self.Ec, self.etu)
+        segments = [(0.0, ecr, [0.0, self.Ec])]
+        if ecr < self.etu:
+            segments.append((ecr, self.etu, [self.ft]))
+        return segments + _parabola_linear_segments(self.fc, self.eco, self.ecu)
+
 
 class Concrete_ParabolicLinearFRC(Material):
     def __init__(self, Ec, fc, eco, ecu, ft, s2, e2, s3, e3):
@@ -189,15 +459,31 @@ class Concrete_ParabolicLinearFRC(Material):
             else:
                 return 0
         elif abs(strain) <= self.eco:
-            return self.fc * (2 * (abs(strain) / self.eco) - pow(abs(strain) / self.eco, 2))
+            return -self.fc * (2 * (abs(strain) / self.eco) - pow(abs(strain) / self.eco, 2))
         elif abs(strain) <= self.ecu:
-            return self.fc * (1 - ((abs(strain) - self.eco) / (self.ecu - self.eco)))
+            return -self.fc * (1 - ((abs(strain) - self.eco) / (self.ecu - self.eco)))
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        tension = np.where(strain <= self.e2, self.ft + (self.s2 - self.ft) * (strain / self.e2),
+                           np.where(strain <= self.e3,
+                                    self.s2 + (self.s3 - self.s2) * ((strain - self.e2) / (self.e3 - self.e2)),
+                                    0.0))
+        return np.where(strain >= 0, tension, _parabola_linear_array(strain, self.fc, self.eco, self.ecu))
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu
 
+    def polynomial_segments(self):
+        slope_2 = (self.s2 - self.ft) / self.e2
+        slope_3 = (self.s3 - self.s2) / (self.e3 - self.e2)
+        return [
+            (0.0, self.e2, [self.ft, slope_2]),
+            (self.e2, self.e3, [self.s2 - slope_3 * self.e2, slope_3]),
+        ] + _parabola_linear_segments(self.fc, self.eco, self.ecu)
+
 
 class Concrete_MC90General(Material):
     def __init__(self, fcm, ecu, ft, etu):
@@ -211,15 +497,44 @@ class Concrete_MC90General(Material):
         if strain >= 0:
             return min(self.ft * (1 - (strain / self.etu)), self.ft) if strain <= self.etu else 0
         elif abs(strain) <= self.ecu:
-            return self.fcm * (1 - (abs(strain) / self.ecu))
+            return -self.fcm * (1 - (abs(strain) / self.ecu))
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        tension = np.where(strain <= self.etu, np.minimum(self.ft * (1 - strain / self.etu), self.ft), 0.0)
+        compression = np.where(-strain <= self.ecu, -self.fcm * (1 + strain / self.ecu), 0.0)
+        return np.where(strain >= 0, tension, compression)
+
     def is_failure(self, strain):
         return abs(strain) > self.ecu
 
+    def polynomial_segments(self):
+        return [
+            (0.0, self.etu, [self.ft, -self.ft / self.etu]),
+            (-self.ecu, 0.0, [-self.fcm, -self.fcm / self.ecu]),
+        ]
+
 
 class Concrete_ConfinedKappos(Material):
+    """
+    Confined concrete with strength k * fc, k = 1 + 0.5 * rw * fyw / fc: linear
+    up to eco, constant up to 1.5 * eco, zero beyond and in tension.
+
+    Compressive strains are negative; anysection.confinement derives the
+    parameters from hoop geometry.
+
+    Args:
+        fc (float): Unconfined compressive strength (magnitude) [Pa].
+        eco (float): Strain at peak stress (magnitude).
+        rw (float): Volumetric ratio of the transverse reinforcement.
+        bc (float): Core width to the hoop centreline.
+        s (float): Hoop spacing.
+        fyw (float): Yield strength of the hoops [Pa].
+        HoopType (str): Hoop layout, e.g. "rectangular".
+    """
+
     def __init__(self, fc, eco, rw, bc, s, fyw, HoopType):
         super().__init__("Concrete_ConfinedKappos")
         self.fc = fc
@@ -230,20 +545,54 @@ class Concrete_ConfinedKappos(Material):
         self.fyw = fyw
         self.HoopType = HoopType
 
+    @property
+    def k(self):
+        return 1 + 0.5 * self.rw * (self.fyw / self.fc)
+
     def stress(self, strain):
-        k = 1 + 0.5 * self.rw * (self.fyw / self.fc)
-        if strain <= self.eco:
+        k = self.k
+        if -self.eco <= strain <= 0:
             return self.fc * k * (strain / self.eco)
-        elif strain <= self.eco * 1.5:
-            return self.fc * k
+        elif -self.eco * 1.5 <= strain < -self.eco:
+            return -self.fc * k
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        k = self.k
+        return np.where((strain <= 0) & (strain >= -self.eco), self.fc * k * (strain / self.eco),
+                        np.where((strain < -self.eco) & (strain >= -self.eco * 1.5), -self.fc * k, 0.0))
+
     def is_failure(self, strain):
         return abs(strain) > self.eco * 2
 
+    def polynomial_segments(self):
+        fcc = self.fc * self.k
+        return [
+            (-self.eco, 0.0, [0.0, fcc / self.eco]),
+            (-1.5 * self.eco, -self.eco, [-fcc]),
+        ]
+
 
 class Concrete_ConfinedSpoelstra(Material):
+    """
+    Concrete confined by a jacket of thickness tj and strength fju (lateral
+    pressure flu = 2 * tj * fju / (D + 2 * tj)), with the Mander strength fcc:
+    linear up to eco, constant up to 1.5 * eco, zero beyond and in tension.
+
+    Compressive strains are negative. Steel hoops can be represented by a
+    smeared jacket (see anysection.confinement).
+
+    Args:
+        D (float): Diameter of the confined core.
+        tj (float): Jacket thickness.
+        fco (float): Unconfined compressive strength (magnitude) [Pa].
+        fju (float): Jacket strength [Pa].
+        Ej (float): Jacket modulus [Pa].
+        eco (float): Strain at peak stress (magnitude).
+    """
+
     def __init__(self, D, tj, fco, fju, Ej, eco):
         super().__init__("Concrete_ConfinedSpoelstra")
         self.D = D
@@ -253,19 +602,38 @@ class Concrete_ConfinedSpoelstra(Material):
         self.Ej = Ej
         self.eco = eco
 
+    @property
+    def flu(self):
+        return 2 * self.tj * self.fju / (self.D + 2 * self.tj)
+
+    @property
+    def fcc(self):
+        flu = self.flu
+        return self.fco * (2.254 * np.sqrt(1 + 7.94 * flu / self.fco) - 2 * flu / self.fco - 1.254)
+
     def stress(self, strain):
-        flu = 2 * self.tj * self.fju / (self.D + 2 * self.tj)
-        fcc = self.fco * (2.254 * sqrt(1 + 7.94 * flu / self.fco) - 2 * flu / self.fco - 1.254)
-        if strain <= self.eco:
+        fcc = self.fcc
+        if -self.eco <= strain <= 0:
             return fcc * (strain / self.eco)
-        elif strain <= self.eco * 1.5:
-            return fcc
+        elif -self.eco * 1.5 <= strain < -self.eco:
+            return -fcc
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        fcc = self.fcc
+        return np.where((strain <= 0) & (strain >= -self.eco), fcc * (strain / self.eco),
+                        np.where((strain < -self.eco) & (strain >= -self.eco * 1.5), -fcc, 0.0))
+
     def is_failure(self, strain):
         return abs(strain) > self.eco * 2
 
+    def polynomial_segments(self):
+        return [
+            (-self.eco, 0.0, [0.0, self.fcc / self.eco]),
+            (-1.5 * self.eco, -self.eco, [-self.fcc]),
+        ]
 
 
 # ----------------- STEEL MATERIALS ----------------- #
@@ -287,9 +655,22 @@ class Steel_Bilinear(Material):
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        abs_strain = np.abs(strain)
+        return np.where(abs_strain <= self.ey, self.Es * strain,
+                        np.where(abs_strain <= self.euk, self.fy * np.where(strain > 0, 1.0, -1.0), 0.0))
+
     def is_failure(self, strain):
         return abs(strain) > self.euk
 
+    def polynomial_segments(self):
+        return [
+            (-self.ey, self.ey, [0.0, self.Es]),
+            (self.ey, self.euk, [self.fy]),
+            (-self.euk, -self.ey, [-self.fy]),
+        ]
+
 
 class Steel_ParkSampson(Material):
     def __init__(self, Es, fy, fu, esh, esu):
@@ -301,6 +682,15 @@ class Steel_ParkSampson(Material):
         self.esu = esu
         self.ey = fy / Es
 
+    @property
+    def r(self):
+        return self.esu - self.esh
+
+    @property
+    def m(self):
+        r = self.r
+        return ((self.fu / self.fy) * (30 * r + 1) ** 2 - 60 * r - 1) / (15 * r * r)
+
     def stress(self, strain):
         abs_strain = abs(strain)
         if abs_strain <= self.ey:
@@ -308,13 +698,23 @@ class Steel_ParkSampson(Material):
         elif abs_strain <= self.esh:
             return self.fy * (1 if strain > 0 else -1)
         elif abs_strain <= self.esu:
-            r = self.esu - self.esh
+            r, m = self.r, self.m
             rr = abs_strain - self.esh
-            m = ((self.fu / self.fy) * pow(30 * r + 1, 2) - 60 * r - 1) / (15 * r * r)
-            return self.fy * ((m * rr + 2) / (60 * rr + 2) + (rr * (60 - m)) / (2 * pow(30 * r + 1, 2)))
+            return self.fy * ((m * rr + 2) / (60 * rr + 2) + (rr * (60 - m)) / (2 * pow(30 * r + 1, 2))) * (1 if strain > 0 else -1)
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        abs_strain = np.abs(strain)
+        sign = np.where(strain > 0, 1.0, -1.0)
+        r, m = self.r, self.m
+        rr = np.clip(abs_strain - self.esh, 0.0, None)
+        hardening = self.fy * ((m * rr + 2) / (60 * rr + 2) + (rr * (60 - m)) / (2 * (30 * r + 1) ** 2))
+        return np.where(abs_strain <= self.ey, self.Es * strain,
+                        np.where(abs_strain <= self.esh, self.fy * sign,
+                                 np.where(abs_strain <= self.esu, hardening * sign, 0.0)))
+
     def is_failure(self, strain):
         return abs(strain) > self.esu
 
@@ -334,28 +734,261 @@ class FRP_Linear(Material):
         else:
             return 0
 
+    def stress_array(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        return np.where(np.abs(strain) <= self.euk / self.gs, self.Es / self.gs * strain, 0.0)
+
     def is_failure(self, strain):
         return abs(strain) > self.euk / self.gs
 
+    def polynomial_segments(self):
+        eu = self.euk / self.gs
+        return [(-eu, eu, [0.0, self.Es / self.gs])]
+
+
+# ----------------- TIME-DEPENDENT MATERIALS ----------------- #
+
+def age_adjusted_modulus(elastic_modulus, creep_coefficient, aging_coefficient=0.8):
+    """
+    Age-adjusted effective modulus E / (1 + chi * phi) of concrete.
+
+    Args:
+        elastic_modulus (float or array_like): Modulus at the age of loading.
+        creep_coefficient (float or array_like): Creep coefficient phi(t, t0).
+        aging_coefficient (float or array_like): Aging coefficient chi (0.8 is the
+            usual value for loads applied at early ages).
+
+    Returns:
+        float or numpy.ndarray: Effective modulus.
+    """
+    return elastic_modulus / (1.0 + aging_coefficient * np.asarray(creep_coefficient, dtype=float))
+
+
+class AgeAdjustedMaterial(Material):
+    """
+    Long-term version of a material law: the strain axis is stretched by
+    (1 + chi * phi), stress(strain) = material.stress(strain / (1 + chi * phi)),
+    so that the initial stiffness is the age-adjusted effective modulus and
+    peak and ultimate strains grow with creep.
+
+    The creep coefficient may be an (R, 1) array (e.g. one row per time step)
+    for batched evaluation with BatchEvaluator; shrinkage and other free strains
+    enter the section as initial strains (see SectionSolver.set_initial_strain).
+
+    Args:
+        material (Material): Short-term material law.
+        creep_coefficient (float or array_like): Creep coefficient phi(t, t0).
+        aging_coefficient (float or array_like): Aging coefficient chi.
+    """
+
+    def __init__(self, material, creep_coefficient, aging_coefficient=0.8):
+        super().__init__(f"AgeAdjusted_{material.name}")
+        self.material = material
+        self.creep_coefficient = creep_coefficient
+        self.aging_coefficient = aging_coefficient
+        self.factor = 1.0 + aging_coefficient * np.asarray(creep_coefficient, dtype=float)
+        if np.ndim(self.factor) == 0:
+            self.factor = float(self.factor)
+
+    def stress(self, strain):
+        return self.material.stress(strain / self.factor)
+
+    def stress_array(self, strain):
+        return self.material.stress_array(np.asarray(strain, dtype=float) / self.factor)
+
+    def tangent_array(self, strain, step=1e-8):
+        strain = np.asarray(strain, dtype=float) / self.factor
+        return self.material.tangent_array(strain, step) / self.factor
+
+    def is_failure(self, strain):
+        return self.material.is_failure(strain / self.factor)
+
+    def polynomial_segments(self):
+        segments = self.material.polynomial_segments()
+        if segments is None:
+            return None
+        return [(lower * self.factor, upper * self.factor,
+                 [c / self.factor ** j for j, c in enumerate(coefficients)])
+                for lower, upper, coefficients in segments]
+
 
 # ----------------- MATERIAL FACTORY ----------------- #
 
+MODEL_CLASSES = {model: globals()[model.value] for model in ModelType}
+
+
 class MaterialFactory:
+    """
+    Creates materials from a ModelType (or its name) and keyword specs, as used
+    in model files. On request (intern=True) equal materials (same type and
+    constructor arguments) are created once and shared, so a model with
+    thousands of members holds only its few distinct materials; shared
+    materials must then not be edited in place (use `with_parameters`).
+
+    The registry holds its materials weakly and the kernel cache is bounded,
+    both keyed by a snapshot of the parameters, so neither grows without
+    limit nor returns an entry for parameters a material no longer has.
+
+    A spec is a dict naming the model and its constructor arguments:
+
+        {"model": "Steel_Bilinear", "Es": 200e9, "fy": 500e6, "euk": 0.02}
+    """
+    _registry = weakref.WeakValueDictionary()
+    _kernels = OrderedDict()
+    kernel_cache_size = 256
+
     @staticmethod
-    def create_material(material_type, *args):
-        material_classes = {
-            "Concrete_NonlinearEC2": Concrete_NonlinearEC2,
-            "Concrete_ParabolicLinearEC2": Concrete_ParabolicLinearEC2,
-            "Concrete_Popovics": Concrete_Popovics,
-            "Steel_Bilinear": Steel_Bilinear,
-            "Steel_ParkSampson": Steel_ParkSampson,
-            "FRP_Linear": FRP_Linear
-        }
-
-        if material_type not in material_classes:
-            raise ValueError(f"Material type '{material_type}' not recognized.")
-
-        return material_classes[material_type](*args)
+    def model_type(material_type):
+        """
+        Resolve a ModelType, its value ("Steel_Bilinear") or its name ("STEEL_BILINEAR").
+
+        Args:
+            material_type (ModelType or str): Model to resolve.
+
+        Returns:
+            ModelType: The model type.
+        """
+        if isinstance(material_type, ModelType):
+            return material_type
+        try:
+            return ModelType(material_type)
+        except ValueError:
+            if material_type in ModelType.__members__:
+                return ModelType[material_type]
+        raise ValueError(f"Material type '{material_type}' not recognized.")
+
+    @staticmethod
+    def create_material(material_type, *args, intern=False, **parameters):
+        """
+        Create a material.
+
+        Args:
+            material_type (ModelType or str): Material model.
+            *args: Positional constructor arguments.
+            intern (bool): Return the shared instance of equal materials (see
+                `intern`); off by default, so every call builds a new material.
+            **parameters: Keyword constructor arguments.
+
+        Returns:
+            Material: The material.
+        """
+        material = MODEL_CLASSES[MaterialFactory.model_type(material_type)](*args, **parameters)
+        return MaterialFactory.intern(material) if intern else material
+
+    @staticmethod
+    def from_spec(spec, intern=False):
+        """
+        Create a material from a keyword spec.
+
+        Args:
+            spec (dict): {"model": <ModelType value or name>, <argument>: <value>, ...}.
+            intern (bool): Return the shared instance of equal materials (see
+                `intern`); off by default, so every call builds a new material.
+
+        Returns:
+            Material: The material.
+        """
+        parameters = dict(spec)
+        if "model" not in parameters:
+            raise ValueError("Material spec needs a 'model' entry.")
+        model = parameters.pop("model")
+        return MaterialFactory.create_material(model, intern=intern, **parameters)
+
+    @staticmethod
+    def to_spec(material):
+        """
+        Return the keyword spec of a material (inverse of `from_spec`).
+        """
+        spec = {"model": type(material).__name__}
+        spec.update(material.parameters())
+        return spec
+
+    @staticmethod
+    def from_json(source, intern=False):
+        """
+        Create materials from JSON.
+
+        Args:
+            source (str or file): JSON text or an open file holding one spec, a
+                list of specs or a {name: spec} mapping.
+            intern (bool): Return the shared instance of equal materials (see
+                `intern`); off by default, so every call builds a new material.
+
+        Returns:
+            Material, list or dict: Materials in the layout of the JSON document.
+        """
+        document = json.loads(source) if isinstance(source, str) else json.load(source)
+        created = {}
+
+        def create(spec):
+            # Model files repeat a few specs many times: build each distinct spec once
+            if not intern:
+                return MaterialFactory.from_spec(spec, intern)
+            try:
+                key = tuple(sorted(spec.items()))
+                hash(key)
+            except TypeError:
+                return MaterialFactory.from_spec(spec, intern)
+            if key not in created:
+                created[key] = MaterialFactory.from_spec(spec, intern)
+            return created[key]
+
+        if isinstance(document, list):
+            return [create(spec) for spec in document]
+        if "model" in document:
+            return create(document)
+        return {name: create(spec) for name, spec in document.items()}
+
+    @staticmethod
+    def load(path, intern=False):
+        """
+        Create materials from a JSON file (see `from_json`).
+        """
+        with open(path) as f:
+            return MaterialFactory.from_json(f, intern)
+
+    @staticmethod
+    def intern(material):
+        """
+        Return the registered material equal to `material`, registering it if new.
+
+        Args:
+            material (Material): Material to intern.
+
+        Returns:
+            Material: The canonical instance.
+        """
+        key = material._identity()
+        canonical = MaterialFactory._registry.get(key)
+        if canonical is None or canonical._identity() != key:
+            # New, or the registered instance was edited since it was interned
+            MaterialFactory._registry[key] = canonical = material
+        return canonical
+
+    @staticmethod
+    def kernel(material):
+        """
+        Return the compiled evaluation kernel of a material, built once per
+        distinct set of parameters (see Material.kernel); the least recently
+        used kernels are dropped beyond `kernel_cache_size`.
+        """
+        kernels = MaterialFactory._kernels
+        key = material._identity()
+        if key in kernels:
+            kernels.move_to_end(key)
+            return kernels[key]
+        kernels[key] = kernel = material.kernel()
+        while len(kernels) > MaterialFactory.kernel_cache_size:
+            kernels.popitem(last=False)
+        return kernel
+
+    @staticmethod
+    def clear_registry():
+        """
+        Forget all interned materials and their kernels.
+        """
+        MaterialFactory._registry.clear()
+        MaterialFactory._kernels.clear()
 
 
 # ----------------- EXAMPLE USAGE ----------------- #
@@ -0,0 +1,187 @@
+# anysection/plotting.py
+
+import os
+
+import numpy as np
+
+MATERIAL_COLORS = ("tab:blue", "tab:green", "tab:orange", "tab:purple", "tab:brown", "tab:olive", "tab:cyan")
+
+
+def _material_colors(materials):
+    """
+    One color per material table entry: concrete gray, steel red, others cycled.
+    """
+    colors = []
+    for k, material in enumerate(materials):
+        name = type(material).__name__
+        if name.startswith("Concrete"):
+            colors.append("0.6")
+        elif name.startswith("Steel"):
+            colors.append("tab:red")
+        else:
+            colors.append(MATERIAL_COLORS[k % len(MATERIAL_COLORS)])
+    return colors
+
+
+def _figure(ax, figsize):
+    """
+    Return (figure, axes): the figure of `ax`, or a new figure on the Agg canvas.
+
+    New figures are not registered with pyplot, so rendering thousands of them
+    in a batch neither opens windows nor accumulates pyplot state.
+    """
+    if ax is not None:
+        return ax.figure, ax
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot()
+
+
+def _outline_rings(section):
+    """
+    Vertex rings of the section areas (outer boundaries and holes).
+    """
+    rings = []
+    for polygon in section.composite_area.to_polygons():
+        rings.extend(polygon.rings)
+    return rings
+
+
+def plot_section(section, solver=None, values=None, ax=None, cmap="viridis", label=None, outline=True,
+                 figsize=(6, 6)):
+    """
+    Draw a section: area outlines and every fiber as a true-scale circle.
+
+    All fibers go into one EllipseCollection, so drawing cost does not grow with
+    per-fiber Python work. Fibers are colored by material group, or by a field
+    (e.g. the stresses from `SectionSolver.fiber_fields`) when `values` is given.
+
+    Parameters:
+        section (Section): Section to draw.
+        solver (SectionSolver, optional): Draw its analysis fibers (discrete fibers
+            plus meshed material regions) instead of the section's discrete fibers.
+        values (array_like, optional): One value per drawn fiber to color by.
+        ax (matplotlib.axes.Axes, optional): Axes to draw into; a new Agg figure
+            is created if omitted.
+        cmap (str): Colormap of `values`.
+        label (str, optional): Colorbar label of `values`.
+        outline (bool): Draw the outlines of the section areas.
+        figsize (tuple): Size of a new figure in inches.
+
+    Returns:
+        matplotlib.figure.Figure: The figure drawn into.
+    """
+    from matplotlib.collections import EllipseCollection, PolyCollection
+    from matplotlib.lines import Line2D
+
+    figure, ax = _figure(ax, figsize)
+    fibers = section.fibers if solver is None else solver.analysis_fibers()
+    area = np.asarray(fibers.area, dtype=float)
+    # Small fibers first, so that bars are drawn on top of the meshed regions
+    order = np.argsort(area, kind="stable")
+    x, y = np.asarray(fibers.x, dtype=float)[order], np.asarray(fibers.y, dtype=float)[order]
+    diameters = 2.0 * np.sqrt(area[order] / np.pi)
+
+    if outline:
+        rings = _outline_rings(section)
+        if rings:
+            ax.add_collection(PolyCollection(rings, facecolors="none", edgecolors="black", linewidths=1.5))
+
+    if len(x):
+        collection = EllipseCollection(diameters, diameters, np.zeros(len(x)), units="xy",
+                                       offsets=np.column_stack((x, y)), offset_transform=ax.transData,
+                                       linewidths=0)
+        if values is None:
+            ids = np.asarray(fibers.material_ids)[order]
+            palette = _material_colors(fibers.materials)
+            collection.set_facecolor([palette[k] for k in ids])
+            handles = [Line2D([], [], marker="o", linestyle="", color=palette[k], label=type(material).__name__)
+                       for k, material in enumerate(fibers.materials) if np.any(ids == k)]
+            ax.add_collection(collection)
+            if handles:
+                ax.legend(handles=handles, loc="best", fontsize="small")
+        else:
+            collection.set_array(np.asarray(values, dtype=float)[order])
+            collection.set_cmap(cmap)
+            ax.add_collection(collection)
+            figure.colorbar(collection, ax=ax, label=label)
+
+    ax.autoscale_view()
+    ax.set_aspect("equal", adjustable="datalim")
+    ax.set_title(section.name)
+    ax.set_xlabel("x (m)")
+    ax.set_ylabel("y (m)")
+    return figure
+
+
+def plot_moment_curvature(results, ax=None, label=None, figsize=(10, 5)):
+    """
+    Plot a moment-curvature diagram.
+
+    Parameters:
+        results: List of (curvature, moment) tuples as returned by
+            `SectionSolver.moment_curvature_analysis` (failed steps, with a None
+            moment, are skipped), or a (curvatures, moments) pair of arrays.
+        ax (matplotlib.axes.Axes, optional): Axes to draw into.
+        label (str, optional): Legend label.
+        figsize (tuple): Size of a new figure in inches.
+
+    Returns:
+        matplotlib.figure.Figure: The figure drawn into.
+    """
+    figure, ax = _figure(ax, figsize)
+    if isinstance(results, tuple) and len(results) == 2:
+        curvatures, moments = (np.asarray(values, dtype=float) for values in results)
+    else:
+        valid = [(curvature, moment) for curvature, moment in results if moment is not None]
+        curvatures, moments = (np.array(values, dtype=float) for values in zip(*valid)) if valid else ((), ())
+    ax.plot(curvatures, moments, label=label)
+    ax.set_xlabel("Curvature (1/m)")
+    ax.set_ylabel("Moment (Nm)")
+    ax.grid(True)
+    if label is not None:
+        ax.legend()
+    return figure
+
+
+def save_figure(figure, path, dpi=150):
+    """
+    Write a figure to an image file (format from the extension) and release it.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    figure.savefig(path, dpi=dpi)
+    figure.clear()
+    return path
+
+
+def render_sections(sections, directory, file_format="png", dpi=150, **options):
+    """
+    Render the views of many sections to files, one headless figure at a time.
+
+    Parameters:
+        sections (iterable): Sections (or (section, SectionSolver) pairs to draw
+            the meshed analysis fibers).
+        directory (str): Output directory; files are named after the sections.
+        file_format (str): Image format extension.
+        dpi (int): Resolution.
+        **options: Passed to `plot_section`.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    paths = []
+    names = {}
+    for item in sections:
+        section, solver = item if isinstance(item, tuple) else (item, None)
+        name = "".join(c if c.isalnum() or c in "-_." else "_" for c in section.name)
+        names[name] = names.get(name, 0) + 1
+        if names[name] > 1:
+            name = f"{name}_{names[name]}"
+        path = os.path.join(directory, f"{name}.{file_format}")
+        paths.append(save_figure(plot_section(section, solver, **options), path, dpi))
+    return paths
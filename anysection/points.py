@@ -1,5 +1,11 @@
 # anysection/geometry/points.py
 
+from collections import OrderedDict
+from math import cos, sin
+
+import numpy as np
+
+
 class Point:
     """
     Class representing a point in 2D space.
@@ -22,5 +28,93 @@ class Point:
         self.x += dx
         self.y += dy
 
+    def rotate(self, angle, origin=(0.0, 0.0)):
+        """
+        Rotate the point counterclockwise by `angle` (radians) about `origin`.
+        """
+        dx, dy = self.x - origin[0], self.y - origin[1]
+        c, s = cos(angle), sin(angle)
+        self.x = origin[0] + c * dx - s * dy
+        self.y = origin[1] + s * dx + c * dy
+
     def __str__(self):
         return f"Point({self.x}, {self.y})"
+
+
+def rotate_coordinates(x, y, angles, origin=(0.0, 0.0)):
+    """
+    Coordinates of points in frames rotated counterclockwise by `angles`.
+
+    In the frame at angle theta, u runs along the direction theta and v
+    perpendicular to it: u = dx cos(theta) + dy sin(theta),
+    v = -dx sin(theta) + dy cos(theta), with (dx, dy) relative to `origin`.
+    All angles are handled by one matrix product.
+
+    Parameters:
+        x, y (array_like): Point coordinates.
+        angles (array_like): Frame angles in radians.
+        origin (tuple): Center of rotation.
+
+    Returns:
+        tuple: (u, v), each of shape (angles, points).
+    """
+    angles = np.atleast_1d(np.asarray(angles, dtype=float))
+    c, s = np.cos(angles), np.sin(angles)
+    rotations = np.stack((np.stack((c, s), axis=-1), np.stack((-s, c), axis=-1)), axis=1)  # (angles, 2, 2)
+    offsets = np.vstack((np.asarray(x, dtype=float) - origin[0], np.asarray(y, dtype=float) - origin[1]))
+    frames = rotations @ offsets
+    return frames[:, 0], frames[:, 1]
+
+
+class RotatedFrames:
+    """
+    Bounded LRU cache of rotated fiber coordinates.
+
+    Skew-angle analyses evaluate the same set of angles for many load cases;
+    the cache computes the rotated (u, v) arrays of an angle set once (see
+    `rotate_coordinates`) and hands out read-only views afterwards. Each entry
+    holds 2 x angles x points floats, so `maxsize` bounds the memory.
+
+    Parameters:
+        x, y (array_like): Point coordinates.
+        origin (tuple): Center of rotation.
+        maxsize (int): Maximum number of cached angle sets.
+    """
+
+    def __init__(self, x, y, origin=(0.0, 0.0), maxsize=16):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.maxsize = maxsize
+        self._frames = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, angles):
+        """
+        Return (u, v) of shape (angles, points) for an angle set (radians).
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype=float))
+        key = angles.tobytes()
+        if key in self._frames:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return self._frames[key]
+        self.misses += 1
+        u, v = rotate_coordinates(self.x, self.y, angles, self.origin)
+        u.flags.writeable = False
+        v.flags.writeable = False
+        self._frames[key] = (u, v)
+        while len(self._frames) > self.maxsize:
+            self._frames.popitem(last=False)
+        return u, v
+
+    def clear(self):
+        self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __str__(self):
+        return (f"RotatedFrames: {len(self.x)} points, {len(self._frames)}/{self.maxsize} angle sets "
+                f"({self.hits} hits, {self.misses} misses)")
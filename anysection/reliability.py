@@ -0,0 +1,336 @@
+# anysection/reliability.py
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import qmc
+
+from anysection.batch import BatchEvaluator
+from anysection.material import Material
+
+
+class StreamingStatistics:
+    """
+    Running statistics of a stream of scalar results with bounded memory.
+
+    Mean and standard deviation are exact (pairwise merging of chunk moments).
+    Quantiles come from a uniform reservoir sample and are exact as long as no
+    more than `reservoir_size` values have been seen.
+
+    Parameters:
+        reservoir_size (int): Maximum number of values retained for quantiles.
+        seed (int, optional): Seed of the reservoir sampling.
+    """
+
+    def __init__(self, reservoir_size=100000, seed=None):
+        self.count = 0
+        self.failures = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._reservoir = np.empty(reservoir_size)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Add a chunk of values. NaN entries are counted as failures.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        valid = values[~np.isnan(values)]
+        self.failures += len(values) - len(valid)
+        n = len(valid)
+        if n == 0:
+            return
+
+        chunk_mean = valid.mean()
+        chunk_m2 = np.sum((valid - chunk_mean) ** 2)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.min = min(self.min, valid.min())
+        self.max = max(self.max, valid.max())
+
+        size = len(self._reservoir)
+        seen = self.count + np.arange(n)
+        direct = seen < size
+        self._reservoir[seen[direct]] = valid[direct]
+        slots = self._rng.integers(0, seen[~direct] + 1)
+        replace = slots < size
+        self._reservoir[slots[replace]] = valid[~direct][replace]
+        self.count = total
+
+    @property
+    def std(self):
+        return np.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantile(self, q):
+        """
+        Return the quantile(s) q of the values seen so far.
+        """
+        return np.quantile(self._reservoir[:min(self.count, len(self._reservoir))], q)
+
+    def summary(self, quantiles=(0.05, 0.5, 0.95)):
+        """
+        Return a dictionary with count, failures, mean, std, min, max and quantiles.
+        """
+        result = {"count": self.count, "failures": self.failures, "mean": self.mean,
+                  "std": self.std, "min": self.min, "max": self.max}
+        if self.count:
+            for q, value in zip(quantiles, self.quantile(quantiles)):
+                result[f"q{q:g}"] = value
+        return result
+
+    def __str__(self):
+        return f"StreamingStatistics: n={self.count}, mean={self.mean:.6g}, std={self.std:.6g}"
+
+
+class ReliabilityResult:
+    """
+    Outcome of a sampling-based capacity analysis.
+
+    Attributes:
+        names (list): Names of the random variables.
+        statistics (StreamingStatistics): Statistics of the capacity.
+        samples (numpy.ndarray or None): Realizations (n x variables), if kept.
+        capacities (numpy.ndarray or None): Capacity of every realization, if kept.
+    """
+
+    def __init__(self, names, statistics, samples=None, capacities=None):
+        self.names = names
+        self.statistics = statistics
+        self.samples = samples
+        self.capacities = capacities
+
+    def __str__(self):
+        return f"ReliabilityResult: {self.statistics}"
+
+
+class ReliabilityModel:
+    """
+    Probabilistic moment capacity of a section by Monte Carlo or Latin hypercube
+    sampling.
+
+    Realizations are evaluated in batches as (realizations x fibers) arrays:
+    material parameters become (R, 1) arrays that broadcast through the
+    vectorized stress laws, and the neutral axes of all realizations are found
+    by one simultaneous false-position iteration. Batches can be spread over
+    worker processes.
+
+    Random variables are frozen scipy.stats distributions bound to
+    - a material constructor argument (fcm, fy, ...) with `material_parameter`,
+    - the area of selected fibers (bar area) with `fiber_area`,
+    - a y-offset of selected fibers (cover deviation) with `fiber_offset`.
+
+    Parameters:
+        section (Section): The section to analyze. Material regions are meshed.
+        mesh_divisions (tuple): (nx, ny) grid used to mesh the material regions.
+    """
+
+    def __init__(self, section, mesh_divisions=(20, 20)):
+        self.evaluator = BatchEvaluator.from_section(section, mesh_divisions)
+        self.area = self.evaluator.area
+        self.y = self.evaluator.y
+        self.materials = self.evaluator.materials
+        self.groups = self.evaluator.groups
+        self.variables = []
+
+    def _fiber_mask(self, selection):
+        if isinstance(selection, Material):
+            index = self.evaluator.material_index(selection)
+            return np.isin(np.arange(len(self.area)), self.groups[index][1])
+        mask = np.zeros(len(self.area), dtype=bool)
+        mask[np.asarray(selection)] = True
+        return mask
+
+    def material_parameter(self, name, material, parameter, distribution):
+        """
+        Make a constructor argument of a material random.
+
+        Parameters:
+            name (str): Variable name.
+            material (Material): Material of the section.
+            parameter (str): Constructor argument, e.g. "fcm" or "fy".
+            distribution: Frozen scipy.stats distribution.
+        """
+        self.variables.append((name, "material", (self.evaluator.material_index(material), parameter), distribution))
+
+    def fiber_area(self, name, selection, distribution):
+        """
+        Make the area of selected fibers random (e.g. bar area).
+
+        Parameters:
+            name (str): Variable name.
+            selection: Material whose fibers are affected, or fiber indices/mask.
+            distribution: Frozen scipy.stats distribution of the fiber area.
+        """
+        self.variables.append((name, "area", self._fiber_mask(selection), distribution))
+
+    def fiber_offset(self, name, selection, distribution, direction=1.0):
+        """
+        Shift selected fibers vertically by a random amount (e.g. cover deviation).
+
+        Parameters:
+            name (str): Variable name.
+            selection: Material whose fibers are affected, or fiber indices/mask.
+            distribution: Frozen scipy.stats distribution of the deviation.
+            direction (float): Multiplier applied to the deviation (+1 moves the
+                fibers up, -1 down; a larger bottom cover moves bars up).
+        """
+        self.variables.append((name, "offset", (self._fiber_mask(selection), direction), distribution))
+
+    @property
+    def names(self):
+        return [variable[0] for variable in self.variables]
+
+    def sample(self, n, method="lhs", seed=None):
+        """
+        Draw realizations of the random variables.
+
+        Parameters:
+            n (int): Number of realizations.
+            method (str): "lhs" (Latin hypercube) or "mc" (plain Monte Carlo).
+            seed (int, optional): Random seed.
+
+        Returns:
+            numpy.ndarray: Array of shape (n, number of variables).
+        """
+        return self._draw(n, method, np.random.default_rng(seed))
+
+    def _draw(self, n, method, rng):
+        dimension = len(self.variables)
+        if method == "lhs":
+            u = qmc.LatinHypercube(d=dimension, seed=rng).random(n)
+        elif method == "mc":
+            u = rng.random((n, dimension))
+        else:
+            raise ValueError(f"Unknown sampling method '{method}'.")
+        return np.column_stack([variable[3].ppf(u[:, j]) for j, variable in enumerate(self.variables)])
+
+    def _chunks(self, n, method, seed, chunk_size):
+        """
+        Draw the realizations chunk by chunk from one random stream.
+        """
+        if method not in ("lhs", "mc"):
+            raise ValueError(f"Unknown sampling method '{method}'.")
+        rng = np.random.default_rng(seed)
+        for start in range(0, n, chunk_size):
+            yield self._draw(min(chunk_size, n - start), method, rng)
+
+    def _realize(self, samples):
+        """
+        Build batched fiber areas, ordinates and materials for a block of samples.
+        """
+        count = len(samples)
+        area = self.area
+        y = self.y
+        overrides = {}
+        for j, (_, kind, target, _) in enumerate(self.variables):
+            values = samples[:, j][:, None]
+            if kind == "material":
+                index, parameter = target
+                overrides.setdefault(index, {})[parameter] = values
+            elif kind == "area":
+                area = np.where(target, values, np.broadcast_to(area, (count, len(self.area))))
+            else:
+                mask, direction = target
+                y = y + np.where(mask, direction * values, 0.0)
+        materials = self.evaluator.batched_materials(overrides)
+        return area, np.broadcast_to(y, (count, len(self.y))), materials
+
+    def evaluate(self, samples, curvatures, axial_force=0.0, max_iter=50, rtol=1e-6):
+        """
+        Moment capacity of a block of realizations.
+
+        The capacity of a realization is the largest moment over the curvature
+        range at the given axial force. Realizations for which no equilibrium is
+        found at any curvature return NaN.
+
+        Parameters:
+            samples (numpy.ndarray): Realizations (n x variables).
+            curvatures (iterable): Curvatures at which the moment is evaluated.
+            axial_force (float): Applied axial force (positive = tension).
+            max_iter (int): Maximum iterations of the neutral axis search.
+            rtol (float): Equilibrium tolerance relative to the sum of |fiber forces|.
+
+        Returns:
+            numpy.ndarray: Capacities of shape (n,).
+        """
+        samples = np.atleast_2d(samples)
+        area, y, materials = self._realize(samples)
+        target = np.full(len(samples), float(axial_force))
+        _, moments = self.evaluator.moment_curvature(curvatures, target, area, y, materials, max_iter, rtol)
+        moments = np.where(np.isnan(moments), -np.inf, moments).max(axis=1)
+        return np.where(np.isfinite(moments), moments, np.nan)
+
+    def run(self, n, curvatures, axial_force=0.0, method="lhs", seed=None, chunk_size=256,
+            workers=1, keep_samples=False, reservoir_size=100000):
+        """
+        Sample the random variables and evaluate the capacity of every realization.
+
+        Realizations are drawn and evaluated chunk by chunk, so memory is bounded
+        by the chunk size unless `keep_samples` is set; with "lhs" every chunk is
+        a Latin hypercube of its own. Worker processes receive the model once,
+        when they start, and then only the sample chunks, with at most two
+        chunks per worker in flight.
+
+        Parameters:
+            n (int): Number of realizations.
+            curvatures (iterable): Curvatures at which the moment is evaluated.
+            axial_force (float): Applied axial force (positive = tension).
+            method (str): "lhs" or "mc".
+            seed (int, optional): Random seed.
+            chunk_size (int): Realizations evaluated per batch; bounds the size of
+                the (chunk x fibers) temporaries.
+            workers (int): Number of worker processes (1 evaluates in-process).
+            keep_samples (bool): Keep the realizations and capacities in the result.
+            reservoir_size (int): Values retained for the quantile estimates.
+
+        Returns:
+            ReliabilityResult: Capacity statistics.
+        """
+        curvatures = np.asarray(curvatures, dtype=float)
+        chunks = self._chunks(n, method, seed, chunk_size)
+        statistics = StreamingStatistics(reservoir_size=reservoir_size, seed=seed)
+        samples, capacities = [], []
+
+        def collect(chunk, block):
+            statistics.update(block)
+            if keep_samples:
+                samples.append(chunk)
+                capacities.append(block)
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_model,
+                                     initargs=(self,)) as executor:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append((chunk, executor.submit(_evaluate_chunk, chunk, curvatures, axial_force)))
+                    if len(pending) >= 2 * workers:
+                        chunk, future = pending.popleft()
+                        collect(chunk, future.result())
+                while pending:
+                    chunk, future = pending.popleft()
+                    collect(chunk, future.result())
+        else:
+            for chunk in chunks:
+                collect(chunk, self.evaluate(chunk, curvatures, axial_force))
+
+        if not keep_samples:
+            return ReliabilityResult(self.names, statistics)
+        return ReliabilityResult(self.names, statistics, np.concatenate(samples), np.concatenate(capacities))
+
+
+_WORKER_MODEL = None
+
+
+def _set_worker_model(model):
+    # Pool initializer: the model is unpickled once per worker process
+    global _WORKER_MODEL
+    _WORKER_MODEL = model
+
+
+def _evaluate_chunk(samples, curvatures, axial_force):
+    return _WORKER_MODEL.evaluate(samples, curvatures, axial_force)
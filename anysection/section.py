@@ -1,14 +1,26 @@
+import numpy as np
 from anysection.area import CompositeArea
-from anysection.fiber import Fiber
+from anysection.fiber import FiberArrays
+from anysection.points import RotatedFrames
 class Section:
     """
     Class representing a structural section composed of fibers.
+
+    Fibers are stored column-wise in a FiberArrays container; iterating over
+    `section.fibers` yields lightweight Fiber views.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, dtype=np.float64):
+        """
+        Parameters:
+            name (str): Section name.
+            dtype: Floating point type of the fiber arrays (float64 or float32).
+        """
         self.name = name
-        self.fibers = []  # List to store fiber objects
+        self.fibers = FiberArrays(dtype=dtype)  # Columnar fiber storage
         self.composite_area = CompositeArea()
+        self.regions = []  # (area object, dx, dy, material) for areas carrying a material
+        self._frames = None  # Rotated fiber coordinates, see rotated_coordinates
 
     def add_fiber(self, area, x, y, material):
         """
@@ -20,11 +32,23 @@ class Section:
             y (float): Y-coordinate of the fiber centroid.
             material (Material): Material object (Concrete, Steel, etc.)
         """
-        fiber = Fiber(area, x, y, material)
-        self.fibers.append(fiber)
-        self.composite_area.add_area(fiber, dx=0, dy=0)
+        self.fibers.add(area, x, y, material)
+        self._frames = None
 
-    def add_area(self, area_obj, dx=0, dy=0):
+    def add_fibers(self, areas, xs, ys, material):
+        """
+        Add many fibers sharing one material.
+
+        Parameters:
+            areas (array_like): Fiber areas.
+            xs (array_like): X-coordinates of the fiber centroids.
+            ys (array_like): Y-coordinates of the fiber centroids.
+            material (Material): Material object of all fibers.
+        """
+        self.fibers.extend(areas, xs, ys, material)
+        self._frames = None
+
+    def add_area(self, area_obj, dx=0, dy=0, material=None):
         """
         Add an area object (CompositeArea, Rectangle, Circle, etc.) to the section.
 
@@ -32,26 +56,112 @@ class Section:
             area_obj (Area): An area object that has an `area()` and `centroid()` method.
             dx (float): Shift in x-direction.
             dy (float): Shift in y-direction.
+            material (Material, optional): Material filling the area. Areas with a
+                material take part in the section analysis; without one they only
+                contribute to the geometric properties.
         """
         self.composite_area.add_area(area_obj, dx=dx, dy=dy)
+        self._frames = None
+        if material is not None:
+            self.regions.append((area_obj, dx, dy, material))
+
+    def region_polygons(self):
+        """
+        Return the material regions as a list of (Polygon, material) pairs.
+        """
+        polygons = []
+        for area_obj, dx, dy, material in self.regions:
+            if isinstance(area_obj, CompositeArea):
+                parts = area_obj.to_polygons()
+            else:
+                parts = [area_obj.to_polygon()]
+            polygons.extend((part.translate(dx, dy), material) for part in parts)
+        return polygons
+
+    def _area_parts(self):
+        """
+        Return ((A, cx, cy) of the area components, (area, x, y) fiber arrays).
+        """
+        A = self.composite_area.area() if self.composite_area.components else 0.0
+        cx, cy = self.composite_area.centroid() if A else (0.0, 0.0)
+        fibers = self.fibers
+        return (A, cx, cy), (fibers.area.astype(float), fibers.x.astype(float), fibers.y.astype(float))
 
     def total_area(self):
         """
         Calculate the total area of the section.
         """
-        return self.composite_area.area()
+        (A, _, _), (fa, _, _) = self._area_parts()
+        return A + fa.sum()
 
     def centroid(self):
         """
         Calculate the centroid of the section.
         """
-        return self.composite_area.centroid()
+        (A, cx, cy), (fa, fx, fy) = self._area_parts()
+        A_total = A + fa.sum()
+        return (A * cx + np.dot(fa, fx)) / A_total, (A * cy + np.dot(fa, fy)) / A_total
 
     def moment_of_inertia(self):
         """
         Calculate the moment of inertia of the section.
         """
-        return self.composite_area.moment_of_inertia()
+        (A, cx, cy), (fa, fx, fy) = self._area_parts()
+        x_c, y_c = self.centroid()
+        Ix, Iy = self.composite_area.moment_of_inertia() if A else (0.0, 0.0)
+        Ix += A * (cy - y_c) ** 2 + np.dot(fa, (fy - y_c) ** 2)
+        Iy += A * (cx - x_c) ** 2 + np.dot(fa, (fx - x_c) ** 2)
+        return Ix, Iy
+
+    def product_of_inertia(self):
+        """
+        Calculate the product of inertia Ixy of the section about its centroid.
+        """
+        (A, cx, cy), (fa, fx, fy) = self._area_parts()
+        x_c, y_c = self.centroid()
+        Ixy = self.composite_area.product_of_inertia() if A else 0.0
+        Ixy += A * (cx - x_c) * (cy - y_c) + np.dot(fa, (fx - x_c) * (fy - y_c))
+        return Ixy
+
+    def principal_axes(self):
+        """
+        Calculate the principal axes of the section.
+
+        Returns:
+            tuple: (angle, I1, I2): the counterclockwise angle (radians) from the
+            x-axis to the major principal axis, and the major and minor
+            principal moments of inertia.
+        """
+        Ix, Iy = self.moment_of_inertia()
+        Ixy = self.product_of_inertia()
+        average = (Ix + Iy) / 2
+        radius = np.hypot((Ix - Iy) / 2, Ixy)
+        angle = 0.5 * np.arctan2(-2 * Ixy, Ix - Iy)
+        return float(angle), float(average + radius), float(average - radius)
+
+    def rotated_coordinates(self, angles, origin=None, maxsize=16):
+        """
+        Fiber coordinates in frames rotated by `angles` (radians), e.g. the
+        neutral-axis directions of a skew-angle sweep.
+
+        Angle sets are computed with one matrix product and kept in a bounded
+        LRU cache (see RotatedFrames), which is reset when fibers or areas are
+        added.
+
+        Parameters:
+            angles (array_like): Frame angles in radians.
+            origin (tuple, optional): Center of rotation; defaults to the centroid.
+            maxsize (int): Maximum number of cached angle sets.
+
+        Returns:
+            tuple: (u, v) read-only arrays of shape (angles, fibers); v is the
+            distance from the axis through `origin` at each angle.
+        """
+        origin = self.centroid() if origin is None else origin
+        frames = self._frames
+        if frames is None or frames.origin != (float(origin[0]), float(origin[1])) or frames.maxsize != maxsize:
+            frames = self._frames = RotatedFrames(self.fibers.x, self.fibers.y, origin, maxsize)
+        return frames(angles)
 
     def __str__(self):
         return f"Section: {self.name}, Total Area: {self.total_area()}"
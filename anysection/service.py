@@ -0,0 +1,218 @@
+# anysection/service.py
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from anysection.interning import section_digest
+from anysection.strain_plane import StrainPlaneResult, StrainPlaneSolver
+
+_SOLVERS = OrderedDict()
+_SOLVERS_LOCK = threading.Lock()
+_SOLVER_CACHE_SIZE = 32
+
+
+def _solver(key, section, mesh_divisions):
+    """
+    Return the StrainPlaneSolver of a section, cached per process by section
+    digest and mesh divisions (bounded LRU) so that repeated batches do not
+    re-mesh the section.
+    """
+    key = (key, tuple(mesh_divisions))
+    with _SOLVERS_LOCK:
+        if key in _SOLVERS:
+            _SOLVERS.move_to_end(key)
+            return _SOLVERS[key]
+    solver = StrainPlaneSolver.from_section(section, mesh_divisions)
+    with _SOLVERS_LOCK:
+        _SOLVERS[key] = solver
+        while len(_SOLVERS) > _SOLVER_CACHE_SIZE:
+            _SOLVERS.popitem(last=False)
+    return solver
+
+
+def _solve_batch(operation, key, section, mesh_divisions, columns):
+    """
+    Solve one coalesced batch (runs in the executor; module level so that it
+    can be sent to a process pool).
+    """
+    solver = _solver(key, section, mesh_divisions)
+    if operation == "strain_plane":
+        result = solver.solve(*columns)
+        return result.planes, result.converged, result.iterations, result.residuals
+    axial_force, curvature = columns
+    evaluator = solver.evaluator
+    neutral_axis, moment, converged = evaluator.equilibrium(curvature, axial_force)
+    return neutral_axis, moment, converged
+
+
+class AnalysisService:
+    """
+    Asyncio facade over the batched section solvers.
+
+    Requests are awaited without blocking the event loop: the solves run in an
+    executor. Concurrent requests for the same section and operation that
+    arrive within `batch_window` seconds are coalesced into one vectorized
+    solve, and the request queue is bounded so that producers wait (back
+    pressure) instead of piling up work.
+
+    Example:
+        async with AnalysisService() as service:
+            plane = await service.analyze(section, axial_force=-200e3, moment=80e3)
+
+    Parameters:
+        executor (concurrent.futures.Executor, optional): Pool running the solves;
+            defaults to an in-process thread pool. A ProcessPoolExecutor also
+            works (sections are then pickled once per batch).
+        workers (int, optional): Threads of the default pool.
+        max_queue (int): Maximum number of pending requests.
+        batch_window (float): Seconds to wait for more requests after the first
+            one of a batch.
+        max_batch (int): Maximum number of requests coalesced into one batch.
+        max_in_flight (int): Maximum number of batches solving at once; when
+            all are busy the dispatcher stops draining the queue.
+        mesh_divisions (tuple): (nx, ny) grid used to mesh the material regions.
+
+    Sections are keyed by value (see interning.section_digest). The digest is
+    recomputed for every request, so sections edited in place (moved fibers,
+    resized areas, changed material parameters) are never served a stale
+    solver; it is computed in a thread of this process, off the event loop,
+    and only the short digest travels with the batch.
+    """
+
+    def __init__(self, executor=None, workers=None, max_queue=1024, batch_window=0.002, max_batch=512,
+                 max_in_flight=4, mesh_divisions=(20, 20)):
+        self._own_executor = executor is None
+        self.executor = ThreadPoolExecutor(max_workers=workers) if executor is None else executor
+        self.max_queue = max_queue
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_in_flight = max_in_flight
+        self.mesh_divisions = mesh_divisions
+        self.statistics = {"requests": 0, "batches": 0}
+        self._queue = None
+        self._dispatcher = None
+        self._pending = set()
+        self._slots = None
+
+    async def start(self):
+        """
+        Start the dispatcher on the running event loop.
+        """
+        if self._dispatcher is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def close(self):
+        """
+        Finish the queued requests and stop the dispatcher.
+        """
+        if self._dispatcher is not None:
+            await self._queue.join()
+            if self._pending:
+                await asyncio.gather(*self._pending)
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _section_key(self, section):
+        """
+        Digest of a section, hashed in the loop's default (thread) executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, section_digest, section)
+
+    async def _submit(self, operation, section, columns):
+        await self.start()
+        columns = np.broadcast_arrays(*[np.atleast_1d(np.asarray(column, dtype=float)) for column in columns])
+        key = await self._section_key(section)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, key, section, columns, future))
+        self.statistics["requests"] += 1
+        return await future
+
+    async def analyze(self, section, axial_force, moment_x, moment_y=None):
+        """
+        Find the strain plane carrying (N, Mx[, My]) (see StrainPlaneSolver.solve).
+
+        Arguments may be scalars or arrays of load cases.
+
+        Returns:
+            StrainPlaneResult: The planes of this request's load cases.
+        """
+        columns = [axial_force, moment_x] if moment_y is None else [axial_force, moment_x, moment_y]
+        return StrainPlaneResult(*await self._submit("strain_plane", section, columns))
+
+    async def moment(self, section, axial_force, curvature):
+        """
+        Moment about the neutral axis for given axial forces and curvatures.
+
+        Returns:
+            tuple: (neutral axes, moments, converged mask) of this request.
+        """
+        return await self._submit("moment", section, [axial_force, curvature])
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = {}
+            for request in batch:
+                operation, key, columns = request[0], request[1], request[3]
+                groups.setdefault((operation, key, len(columns)), []).append(request)
+            for requests in groups.values():
+                await self._slots.acquire()
+                task = loop.create_task(self._run(requests))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _run(self, requests):
+        operation, key, section = requests[0][:3]
+        sizes = [len(request[3][0]) for request in requests]
+        columns = [np.concatenate(column) for column in zip(*[request[3] for request in requests])]
+        self.statistics["batches"] += 1
+        try:
+            outputs = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _solve_batch, operation, key, section, self.mesh_divisions, columns)
+        except Exception as error:
+            for request in requests:
+                if not request[4].done():
+                    request[4].set_exception(error)
+            return
+        finally:
+            self._slots.release()
+        bounds = np.cumsum([0] + sizes)
+        for request, start, stop in zip(requests, bounds[:-1], bounds[1:]):
+            if not request[4].done():
+                request[4].set_result(tuple(output[start:stop] for output in outputs))
+
+    def __str__(self):
+        return (f"AnalysisService: {self.statistics['requests']} requests in "
+                f"{self.statistics['batches']} batches")
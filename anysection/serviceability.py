@@ -0,0 +1,192 @@
+# anysection/serviceability.py
+
+import numpy as np
+
+from anysection.strain_plane import StrainPlaneSolver
+
+
+class ServiceResult:
+    """
+    Strain states and stresses of a section under many service load cases.
+
+    All attributes are arrays over the load cases.
+
+    Attributes:
+        axial_force, moment: The applied actions (moment about the reference axis).
+        strain_at_reference: Strain at the reference axis.
+        curvature: Section curvature (strain = strain_at_reference + curvature * (y - reference)).
+        neutral_axis: Ordinate of zero strain (NaN for uniform strain).
+        converged: Whether equilibrium was reached.
+        concrete_stress: Most compressive (minimum) concrete fiber stress.
+        steel_stress: Largest reinforcement fiber stress.
+        steel_strain: Largest reinforcement fiber strain.
+        edge_strains: (cases, 2) strains at the bottom and top face.
+        fiber_strains, fiber_stresses: (cases, fibers) fields, if requested.
+    """
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __str__(self):
+        return f"ServiceResult: {len(self.curvature)} load cases, {int(self.converged.sum())} converged"
+
+
+class ServiceabilityAnalysis:
+    """
+    Serviceability (SLS) analysis of a section for arrays of (N, M) service actions.
+
+    The strain plane of every load case is found by StrainPlaneSolver, vectorized
+    over the load cases; stresses, strains, neutral axes and EC2
+    crack widths follow from the converged planes.
+
+    Parameters:
+        section (Section): Section to analyze. Material regions are meshed.
+        reinforcement (Material or list): Material(s) of the reinforcing bars;
+            every other material is treated as concrete.
+        mesh_divisions (tuple): (nx, ny) grid used to mesh the material regions.
+        reference (float, optional): Ordinate about which moments are taken;
+            defaults to the section centroid.
+    """
+
+    def __init__(self, section, reinforcement, mesh_divisions=(20, 20), reference=None):
+        centroid_x, centroid_y = section.centroid()
+        self.reference = centroid_y if reference is None else reference
+        self.planes = StrainPlaneSolver.from_section(section, mesh_divisions, (centroid_x, self.reference))
+        self.evaluator = self.planes.evaluator
+        reinforcement = reinforcement if isinstance(reinforcement, (list, tuple)) else [reinforcement]
+        steel = np.zeros(len(self.evaluator.area), dtype=bool)
+        for material, index in self.evaluator.groups:
+            if any(material is bar for bar in reinforcement):
+                steel[index] = True
+        self.steel = steel
+        # Faces of the section (region outlines, not the centroids of the edge fibers)
+        ys = [self.evaluator.y.min(), self.evaluator.y.max()]
+        for polygon, _ in section.region_polygons():
+            _, y_min, _, y_max = polygon.bounds()
+            ys.extend((y_min, y_max))
+        self.bottom, self.top = min(ys), max(ys)
+
+    def solve(self, axial_force, moment, max_iter=50, rtol=1e-8, chunk_size=1024, store_fields=False):
+        """
+        Solve equilibrium for every (N, M) load case.
+
+        Parameters:
+            axial_force (array_like): Axial forces (positive = tension).
+            moment (array_like): Moments about the reference axis.
+            max_iter (int): Maximum Newton iterations.
+            rtol (float): Equilibrium tolerance relative to the fiber force sums.
+            chunk_size (int): Load cases solved per batch, bounding the
+                (cases x fibers) temporaries.
+            store_fields (bool): Keep the full fiber strain and stress fields.
+
+        Returns:
+            ServiceResult: Strain planes, stresses and strains of every load case.
+        """
+        axial_force, moment = np.broadcast_arrays(np.atleast_1d(np.asarray(axial_force, dtype=float)),
+                                                  np.atleast_1d(np.asarray(moment, dtype=float)))
+        parts = []
+        for start in range(0, len(axial_force), chunk_size):
+            rows = slice(start, start + chunk_size)
+            planes = self.planes.solve(axial_force[rows], moment[rows], max_iter=max_iter, rtol=rtol)
+            e0, kappa, converged = planes.strain_at_reference, planes.curvature, planes.converged
+            strain, stress, _ = self.planes.state(planes.planes)
+            concrete = ~self.steel
+            part = {
+                "strain_at_reference": e0,
+                "curvature": kappa,
+                "converged": converged,
+                "concrete_stress": np.where(concrete, stress, np.inf).min(axis=1) if concrete.any() else np.full(len(e0), np.nan),
+                "steel_stress": np.where(self.steel, stress, -np.inf).max(axis=1) if self.steel.any() else np.full(len(e0), np.nan),
+                "steel_strain": np.where(self.steel, strain, -np.inf).max(axis=1) if self.steel.any() else np.full(len(e0), np.nan),
+                "edge_strains": np.column_stack((e0 + kappa * (self.bottom - self.reference),
+                                                 e0 + kappa * (self.top - self.reference))),
+            }
+            if store_fields:
+                part["fiber_strains"] = strain
+                part["fiber_stresses"] = stress
+            parts.append(part)
+
+        fields = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            neutral_axis = np.where(fields["curvature"] != 0,
+                                    self.reference - fields["strain_at_reference"] / fields["curvature"], np.nan)
+        return ServiceResult(axial_force=axial_force, moment=moment, neutral_axis=neutral_axis, **fields)
+
+    def check_stresses(self, result, concrete_limit, steel_limit):
+        """
+        EC2 7.2 stress limitation.
+
+        Parameters:
+            result (ServiceResult): Output of `solve`.
+            concrete_limit (float): Allowed compressive stress magnitude (e.g. 0.6 fck).
+            steel_limit (float): Allowed reinforcement stress (e.g. 0.8 fyk).
+
+        Returns:
+            numpy.ndarray: True where both limits are satisfied.
+        """
+        return (-result.concrete_stress <= concrete_limit) & (result.steel_stress <= steel_limit) & result.converged
+
+    def crack_widths(self, result, width, bar_diameter, cover, fct_eff, Ecm, kt=0.4, k1=0.8):
+        """
+        EC2 7.3.4 crack widths of every load case.
+
+        The tension face is the face with the larger edge strain. A load case is
+        cracked once that strain reaches the cracking strain fct_eff / Ecm, i.e.
+        once the extreme-fibre concrete stress of the uncracked section would
+        reach fct_eff; uncracked cases have no crack width. The tension
+        reinforcement is the reinforcement on that half of the section; its
+        centroid gives the effective depth d.
+
+        Parameters:
+            result (ServiceResult): Output of `solve`.
+            width (float): Width of the tension zone.
+            bar_diameter (float): Bar diameter.
+            cover (float): Clear cover to the tension reinforcement.
+            fct_eff (float): Effective tensile strength of concrete.
+            Ecm (float): Secant modulus of concrete.
+            kt (float): Load duration factor (0.6 short term, 0.4 long term).
+            k1 (float): Bond factor (0.8 high bond bars).
+
+        Returns:
+            numpy.ndarray: Characteristic crack widths (0 where the section is uncracked).
+        """
+        y = self.evaluator.y
+        area = self.evaluator.area
+        bottom, top = self.bottom, self.top
+        height = top - bottom
+        mid = (bottom + top) / 2
+        top_in_tension = result.curvature >= 0
+
+        bars = self.steel
+        upper = bars & (y >= mid)
+        lower = bars & (y < mid)
+        As = np.where(top_in_tension, area[upper].sum(), area[lower].sum())
+        bar_y = np.where(top_in_tension,
+                         np.dot(area[upper], y[upper]) / max(area[upper].sum(), 1e-300),
+                         np.dot(area[lower], y[lower]) / max(area[lower].sum(), 1e-300))
+        d = np.where(top_in_tension, bar_y - bottom, top - bar_y)
+        x = np.clip(np.where(top_in_tension, result.neutral_axis - bottom, top - result.neutral_axis), 0.0, height)
+        x = np.where(np.isnan(x), 0.0, x)
+
+        hc_eff = np.minimum(np.minimum(2.5 * (height - d), (height - x) / 3), height / 2)
+        Es = self._steel_modulus()
+        sigma_s = np.clip(result.steel_stress, 0.0, None)
+        e1 = result.edge_strains.max(axis=1)
+        e2 = result.edge_strains.min(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rho = As / (width * hc_eff)
+            strain_difference = np.maximum((sigma_s - kt * fct_eff / rho * (1 + Es / Ecm * rho)) / Es,
+                                           0.6 * sigma_s / Es)
+            k2 = np.clip(np.where(e1 > 0, (e1 + e2) / (2 * e1), 0.5), 0.5, 1.0)
+            spacing = 3.4 * cover + k1 * k2 * 0.425 * bar_diameter / rho
+        cracked = (e1 >= fct_eff / Ecm) & (result.steel_stress > 0) & (hc_eff > 0) & result.converged
+        return np.where(cracked, spacing * strain_difference, 0.0)
+
+    def _steel_modulus(self):
+        for material, index in self.evaluator.groups:
+            if self.steel[index].any():
+                return float(material.tangent_array(0.0))
+        raise ValueError("The section has no reinforcement fibers.")
+
+    def __str__(self):
+        return f"ServiceabilityAnalysis: {len(self.evaluator.area)} fibers, reference y = {self.reference}"
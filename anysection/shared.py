@@ -0,0 +1,161 @@
+# anysection/shared.py
+
+import os
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from anysection.fiber import FiberArrays
+from anysection.section import Section
+
+_FIELDS = ("area", "x", "y", "material_ids")
+
+
+def _layout(count, dtype):
+    """
+    Return {field: (offset, dtype)} and the total size of a shared fiber block.
+    """
+    float_type = np.dtype(dtype)
+    layout = {}
+    offset = 0
+    for field in _FIELDS:
+        field_type = np.dtype(np.int32) if field == "material_ids" else float_type
+        layout[field] = (offset, field_type)
+        offset += count * field_type.itemsize
+    return layout, offset
+
+
+class SharedFiberHandle:
+    """
+    Small picklable reference to fiber arrays held in shared memory.
+
+    Sending the handle to a worker process costs a few hundred bytes (name,
+    fiber count, dtype and the material table); `attach` maps the arrays
+    without copying them.
+    """
+
+    def __init__(self, name, count, dtype, materials):
+        self.name = name
+        self.count = count
+        self.dtype = np.dtype(dtype)
+        self.materials = materials
+
+    def attach(self):
+        """
+        Map the shared fiber arrays into this process.
+
+        Returns:
+            FiberArrays: Read-only container backed by the shared block. The
+            block stays mapped as long as the container is alive.
+        """
+        try:
+            block = shared_memory.SharedMemory(name=self.name, track=False)
+        except TypeError:
+            # Python < 3.13 registers attached blocks with the resource tracker,
+            # which child processes share with the owner, so this is harmless.
+            block = shared_memory.SharedMemory(name=self.name)
+        fibers = FiberArrays.from_arrays(*_views(block.buf, self.count, self.dtype, readonly=True),
+                                         materials=self.materials)
+        fibers._buffer = block
+        return fibers
+
+    def section(self, name="Shared section"):
+        """
+        Return a Section whose fibers are the attached shared arrays.
+        """
+        section = Section(name, dtype=self.dtype)
+        section.fibers = self.attach()
+        return section
+
+    def __str__(self):
+        return f"SharedFiberHandle: {self.name} ({self.count} fibers)"
+
+
+def _views(buffer, count, dtype, readonly=False):
+    layout, _ = _layout(count, dtype)
+    arrays = []
+    for field in _FIELDS:
+        offset, field_type = layout[field]
+        array = np.ndarray((count,), dtype=field_type, buffer=buffer, offset=offset)
+        if readonly:
+            array.flags.writeable = False
+        arrays.append(array)
+    return arrays
+
+
+class SharedFiberArrays:
+    """
+    Owner of a section's fiber arrays placed in `multiprocessing.shared_memory`.
+
+    Create it once in the parent process, pass `handle` to the workers and let
+    each worker `attach` by name instead of receiving a pickled copy of the
+    section. The owner must outlive the workers; `close` releases the block.
+
+    Example:
+        with SharedFiberArrays(solver.analysis_fibers()) as shared:
+            executor.map(work, [(shared.handle, angle) for angle in angles])
+
+    Parameters:
+        fibers (FiberArrays): Fibers to share (e.g. `solver.analysis_fibers()`).
+    """
+
+    def __init__(self, fibers):
+        count = len(fibers)
+        _, size = _layout(count, fibers.dtype)
+        self._block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for array, source in zip(_views(self._block.buf, count, fibers.dtype),
+                                 (fibers.area, fibers.x, fibers.y, fibers.material_ids)):
+            array[:] = source
+        self.handle = SharedFiberHandle(self._block.name, count, fibers.dtype, list(fibers.materials))
+
+    @property
+    def name(self):
+        return self.handle.name
+
+    def close(self):
+        """
+        Release and unlink the shared block.
+        """
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        return f"SharedFiberArrays: {self.handle.name} ({self.handle.count} fibers)"
+
+
+def save_fiber_arrays(fibers, directory):
+    """
+    Write fiber arrays to a directory of .npy files for memory-mapped loading.
+
+    Parameters:
+        fibers (FiberArrays): Fibers to save.
+        directory (str): Target directory (created if needed).
+    """
+    os.makedirs(directory, exist_ok=True)
+    for field in _FIELDS:
+        np.save(os.path.join(directory, f"{field}.npy"), getattr(fibers, field))
+    with open(os.path.join(directory, "materials.pkl"), "wb") as f:
+        pickle.dump(list(fibers.materials), f)
+
+
+def load_fiber_arrays(directory, mmap_mode="r"):
+    """
+    Load fiber arrays written by `save_fiber_arrays`, memory-mapped by default so
+    that processes reading the same files share the page cache.
+
+    Returns:
+        FiberArrays: Container backed by the (memory-mapped) arrays.
+    """
+    arrays = [np.load(os.path.join(directory, f"{field}.npy"), mmap_mode=mmap_mode) for field in _FIELDS]
+    with open(os.path.join(directory, "materials.pkl"), "rb") as f:
+        materials = pickle.load(f)
+    return FiberArrays.from_arrays(*arrays, materials=materials)
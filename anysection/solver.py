@@ -1,21 +1,374 @@
 # anysection/solvers/section_solver.py
 
 import numpy as np
+from anysection.adaptive import AdaptiveMesh
+from anysection.fiber import FiberArrays
+from anysection.fields import FiberFields
+from anysection.fused import FusedFiberKernel, resolve_engine
+from anysection.points import RotatedFrames
+
+BACKENDS = ("fiber", "analytic")
+
 
 class SectionSolver:
     """
     Class to perform section analysis to determine axial forces, moments,
     and moment-curvature relationships using iterative solvers.
+
+    Material regions of the section (areas added with a material) are handled
+    by the selected backend:
+
+    - "fiber": every region is meshed into fibers.
+    - "analytic": regions whose material law is piecewise polynomial in strain
+      are clipped at the strain breakpoints and integrated in closed form, so
+      results are mesh independent and cost O(vertices) per evaluation. Other
+      regions fall back to fibers.
+
+    Fiber sums run on the selected engine: "numpy" (vectorized kernels per
+    material group) or "numba" (one fused loop without temporary arrays for
+    the piecewise-polynomial laws, see FusedFiberKernel; fibers of other laws
+    such as Steel_ParkSampson stay on the NumPy path); "auto" uses Numba when
+    it is installed.
+
+    Fibers may carry an initial strain (see `set_initial_strain`) that is added
+    to the strain of the section plane: the strain of fiber i is
+    curvature * (y_i - neutral_axis) + initial_strain_i.
     """
 
-    def __init__(self, section):
+    def __init__(self, section, backend="fiber", mesh_divisions=(20, 20), engine="auto"):
         """
         Initialize the SectionSolver.
 
         Parameters:
             section (Section): The section object to analyze.
+            backend (str): "fiber" or "analytic".
+            mesh_divisions (tuple): (nx, ny) grid used to mesh material regions
+                into fibers.
+            engine (str): Fiber integration engine, "auto", "numpy" or "numba".
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}.")
         self.section = section
+        self.backend = backend
+        self.mesh_divisions = mesh_divisions
+        self.engine = resolve_engine(engine)
+        self._fused = None
+        self._frames = None
+        self._fibers = None
+        self._analytic_regions = None
+        self._meshed_regions = None
+        self.adaptive_meshes = None
+        self.confinements = []  # applied on every (re)meshing, see confinement.assign_confinement
+        self.strain_planes = None
+        self.initial_strain = None
+
+    def _prepare(self, mesh_all=False):
+        """
+        Split the section into discrete fibers and analytically integrated regions.
+        """
+        analytic = []
+        meshed = []
+        regions = self.section.region_polygons()
+        for confinement in self.confinements:
+            regions = confinement.split_regions(regions)
+        for polygon, material in regions:
+            segments = material.polynomial_segments() if self.backend == "analytic" and not mesh_all else None
+            if segments is not None:
+                analytic.append((polygon, material, segments))
+            else:
+                meshed.append((polygon, material))
+
+        if meshed:
+            fibers = FiberArrays()
+            fibers.extend_from(self._discrete_fibers())
+            nx, ny = self.mesh_divisions
+            for polygon, material in meshed:
+                x, y, area = polygon.mesh(nx, ny)
+                fibers.extend(area, x, y, material)
+        else:
+            # Nothing to mesh: use the discrete fiber arrays as they are (no copy)
+            fibers = self._discrete_fibers()
+        self._fibers = fibers
+        self._frames = None
+        self._analytic_regions = analytic
+        self._meshed_regions = meshed
+        self.adaptive_meshes = None
+        self.regroup()
+
+    def refine_mesh(self, curvature_range, axial_force=0.0, tolerance=1e-3, divisions=(4, 4), order=5,
+                    max_level=8, max_iter=20):
+        """
+        Replace the uniform mesh of the fiber-integrated regions by adaptive
+        meshes (see AdaptiveMesh) refined for a curvature history.
+
+        Each iteration solves the neutral axis of every curvature on the current
+        mesh, estimates the error of every cell relative to the sum of |fiber
+        forces| (times the section depth for moments) and splits the cells with
+        the largest errors until the summed estimate is below `tolerance`.
+        Discrete fibers and analytically integrated regions are kept as they are.
+
+        Parameters:
+            curvature_range (iterable): Curvatures of the analysis.
+            axial_force (float): Applied axial force (positive = tension).
+            tolerance (float): Target relative error of N and M.
+            divisions (tuple): (nx, ny) initial grid of every region.
+            order (int): Gauss points per cell interval of the error estimate.
+            max_level (int): Maximum number of splits of an initial cell.
+            max_iter (int): Maximum number of refinement iterations.
+
+        Returns:
+            dict: "iterations", "fibers" (meshed fibers) and "error" (estimated
+            relative error of the final mesh).
+        """
+        if self.initial_strain is not None:
+            raise ValueError("Refine the mesh before setting initial strains.")
+        if self._fibers is None:
+            self._prepare()
+        meshes = [AdaptiveMesh(polygon, material, divisions, order, max_level)
+                  for polygon, material in self._meshed_regions]
+        curvatures = np.asarray(list(curvature_range), dtype=float)
+        error = 0.0
+        for iteration in range(1, max_iter + 1):
+            self._assemble(meshes)
+            states = []
+            for curvature in curvatures:
+                try:
+                    states.append((self.find_neutral_axis(axial_force, curvature), curvature))
+                except ValueError:
+                    continue
+            if not meshes or not states:
+                break
+            neutral_axes, steps = np.array(states).T
+
+            fibers = self.analysis_fibers()
+            strain = steps[:, None] * (fibers.y - neutral_axes[:, None])
+            magnitude = np.abs(self.fiber_stresses(strain) * fibers.area).sum(axis=1)
+            magnitude = np.where(magnitude > 0, magnitude, 1.0)[:, None]
+            y_min, y_max = self._y_bounds()
+            errors = []
+            for mesh in meshes:
+                force_error, moment_error = mesh.errors(neutral_axes, steps)
+                errors.append(np.maximum(np.abs(force_error) / magnitude,
+                                         np.abs(moment_error) / (magnitude * (y_max - y_min))).max(axis=0))
+            cell_errors = np.concatenate(errors)
+            error = float(cell_errors.sum())
+            if error <= tolerance or iteration == max_iter:
+                break
+
+            # Split the largest contributors until the rest is below half the tolerance
+            ranked = np.argsort(cell_errors)[::-1]
+            remaining = error - np.cumsum(cell_errors[ranked])
+            marked = np.zeros(len(cell_errors), dtype=bool)
+            marked[ranked[:int(np.argmax(remaining <= tolerance / 2)) + 1]] = True
+            start = 0
+            split = 0
+            for mesh, mesh_errors in zip(meshes, errors):
+                split += mesh.split(marked[start:start + len(mesh_errors)])
+                start += len(mesh_errors)
+            if not split:
+                break
+
+        self.adaptive_meshes = meshes
+        return {"iterations": iteration, "fibers": sum(len(mesh) for mesh in meshes), "error": error}
+
+    def _assemble(self, meshes):
+        """
+        Use the discrete fibers plus the fibers of adaptive meshes for analysis.
+        """
+        fibers = FiberArrays()
+        fibers.extend_from(self._discrete_fibers())
+        for mesh in meshes:
+            x, y, area = mesh.fibers()
+            fibers.extend(area, x, y, mesh.material)
+        self._fibers = fibers
+        self._frames = None
+        self.regroup()
+
+    def _discrete_fibers(self):
+        """
+        The section's discrete fibers, copied with the confined core fibers
+        reassigned when confinements apply to them (the section is not changed).
+        """
+        fibers = self.section.fibers
+        masks = [confinement.fiber_mask(fibers) for confinement in self.confinements]
+        if not any(mask.any() for mask in masks):
+            return fibers
+        confined = FiberArrays(dtype=fibers.dtype)
+        confined.extend_from(fibers)
+        for confinement, mask in zip(self.confinements, masks):
+            confined.assign_material(mask, confinement.core_material)
+        return confined
+
+    def regroup(self):
+        """
+        Rebuild the material groups and kernels of the analysis fibers, e.g. after
+        their materials were reassigned (see confinement.assign_confinement).
+        """
+        fibers = self.analysis_fibers()
+        ids = fibers.material_ids
+        self._material_groups = [(material, np.flatnonzero(ids == k))
+                                 for k, material in enumerate(fibers.materials)]
+        self._kernels = [material.kernel() for material in fibers.materials]
+        self._fused = FusedFiberKernel(fibers, self._kernels) if self.engine == "numba" else None
+
+    def analysis_fibers(self):
+        """
+        Return the fibers summed by the solver (discrete fibers plus meshed regions).
+        """
+        if self._fibers is None:
+            self._prepare()
+        return self._fibers
+
+    def material_groups(self):
+        """
+        Return (material, fiber indices) pairs grouping the analysis fibers by material.
+        """
+        if self._fibers is None:
+            self._prepare()
+        return self._material_groups
+
+    def fiber_stresses(self, strain):
+        """
+        Evaluate the stress of every analysis fiber, one vectorized call per material.
+
+        Parameters:
+            strain (numpy.ndarray): Fiber strains; the last axis runs over fibers.
+
+        Returns:
+            numpy.ndarray: Fiber stresses with the shape of strain.
+        """
+        stress = np.empty(np.shape(strain))
+        for (_, index), kernel in zip(self.material_groups(), self._kernels):
+            stress[..., index] = kernel.stress(strain[..., index])
+        return stress
+
+    def set_initial_strain(self, strain, material=None):
+        """
+        Superpose initial (eigen) strains on the analysis fibers.
+
+        The initial strain is the strain a fiber carries when the section plane
+        strain is zero: a tendon prestrain is positive, while a free strain that
+        the section restrains (shrinkage, creep, temperature) enters with the
+        opposite sign, e.g. -eps_cs for a shrinkage strain eps_cs. Calls for
+        different materials accumulate; `None` clears all initial strains.
+
+        With the analytic backend all regions are meshed from then on, since the
+        closed-form integration assumes a strain linear over the region.
+
+        Parameters:
+            strain (float or array_like): Initial strain, scalar or one value per
+                selected fiber.
+            material (Material, optional): Apply only to the analysis fibers of
+                this material; defaults to all analysis fibers.
+        """
+        if strain is None:
+            self.initial_strain = None
+            return
+        if self.backend == "analytic" and self.analytic_regions():
+            self._prepare(mesh_all=True)
+            self.initial_strain = None
+        count = len(self.analysis_fibers())
+        initial = np.zeros(count) if self.initial_strain is None else self.initial_strain.copy()
+        if material is None:
+            index = np.arange(count)
+        else:
+            index = np.concatenate([np.zeros(0, dtype=int)] + [group for candidate, group in self.material_groups()
+                                                               if candidate is material])
+        initial[index] = np.broadcast_to(np.asarray(strain, dtype=float), index.shape)
+        self.initial_strain = initial
+
+    def rotated_coordinates(self, angles, origin=None, maxsize=16):
+        """
+        Coordinates of the analysis fibers in frames rotated by `angles`
+        (radians), cached per angle set; see Section.rotated_coordinates.
+        """
+        origin = self.section.centroid() if origin is None else origin
+        frames = self._frames
+        if frames is None or frames.origin != (float(origin[0]), float(origin[1])) or frames.maxsize != maxsize:
+            fibers = self.analysis_fibers()
+            frames = self._frames = RotatedFrames(fibers.x, fibers.y, origin, maxsize)
+        return frames(angles)
+
+    def _fiber_sums(self, neutral_axis, curvature):
+        """
+        Axial force and moment about the neutral axis of the analysis fibers.
+        """
+        fibers = self.analysis_fibers()
+        if self._fused is not None:
+            force, moment, _ = self._fused(neutral_axis, curvature, self.initial_strain)
+            return force, moment
+        lever_arm = fibers.y - neutral_axis
+        force = self.fiber_stresses(self._fiber_strains(neutral_axis, curvature)) * fibers.area
+        return np.sum(force), np.dot(force, lever_arm)
+
+    def _fiber_strains(self, neutral_axis, curvature):
+        """
+        Strain of every analysis fiber for a plane plus the initial strains.
+        """
+        strain = curvature * (self.analysis_fibers().y - neutral_axis)
+        if self.initial_strain is not None:
+            strain = strain + self.initial_strain
+        return strain
+
+    def analytic_regions(self):
+        """
+        Return the (polygon, material, segments) regions integrated in closed form.
+        """
+        if self._analytic_regions is None:
+            self._prepare()
+        return self._analytic_regions
+
+    @staticmethod
+    def _integrate_region(polygon, material, segments, neutral_axis, curvature):
+        """
+        Integrate stress over a polygon for strain = curvature * (y - neutral_axis).
+
+        Returns:
+            tuple: (axial force, moment about the neutral axis).
+        """
+        if curvature == 0:
+            stress = material.stress(0.0)
+            moments = polygon.y_moments(1, neutral_axis)
+            return stress * moments[0], stress * moments[1]
+
+        _, y_min, _, y_max = polygon.bounds()
+        force = 0.0
+        moment = 0.0
+        for strain_min, strain_max, coefficients in segments:
+            y_a = neutral_axis + strain_min / curvature
+            y_b = neutral_axis + strain_max / curvature
+            low, high = min(y_a, y_b), max(y_a, y_b)
+            if high <= y_min or low >= y_max:
+                continue
+            band = polygon.clip(0.0, 1.0, low).clip(0.0, -1.0, -high)
+            if not band.rings:
+                continue
+            # stress = sum(c_j * (curvature * eta)^j) with eta = y - neutral_axis
+            scaled = np.asarray(coefficients, dtype=float) * curvature ** np.arange(len(coefficients))
+            moments = band.y_moments(len(coefficients), neutral_axis)
+            force += np.dot(scaled, moments[:-1])
+            moment += np.dot(scaled, moments[1:])
+        return force, moment
+
+    def _analytic_forces(self, neutral_axis, curvature):
+        force = 0.0
+        moment = 0.0
+        for polygon, material, segments in self.analytic_regions():
+            n, m = self._integrate_region(polygon, material, segments, neutral_axis, curvature)
+            force += n
+            moment += m
+        return force, moment
+
+    def _y_bounds(self):
+        fiber_y = self.analysis_fibers().y
+        ys = [fiber_y.min(), fiber_y.max()] if len(fiber_y) else []
+        # Region outlines, so that coarse (e.g. adaptive) meshes do not narrow the range
+        regions = [polygon for polygon, _, _ in self.analytic_regions()] + [polygon for polygon, _ in
+                                                                           self._meshed_regions]
+        for polygon in regions:
+            _, y_min, _, y_max = polygon.bounds()
+            ys.extend((y_min, y_max))
+        return min(ys), max(ys)
 
     def calculate_axial_force(self, neutral_axis, curvature):
         """
@@ -28,17 +381,17 @@ class SectionSolver:
         Returns:
             float: Total axial force.
         """
-        total_force = 0.0
+        total_force = self._analytic_forces(neutral_axis, curvature)[0]
 
-        # Iterate through fibers in the section
-        for fiber in self.section.fibers:
-            # Calculate strain in the fiber based on curvature and neutral axis
-            strain = curvature * (fiber.y - neutral_axis)
-            stress = fiber.material.stress(strain)
-            force = stress * fiber.area
-            total_force += force
+        # Strain in every fiber based on curvature, neutral axis and initial strain
+        if self._fused is not None:
+            total_force += self._fiber_sums(neutral_axis, curvature)[0]
+        else:
+            fibers = self.analysis_fibers()
+            strain = self._fiber_strains(neutral_axis, curvature)
+            total_force += np.dot(self.fiber_stresses(strain), fibers.area)
 
-        return total_force
+        return float(total_force)
 
     def calculate_moment_capacity(self, curvature):
         """
@@ -69,24 +422,57 @@ class SectionSolver:
 
         Parameters:
             curvature_range (iterable): List or array of curvature values.
-            axial_force (float): Applied axial force (positive = compression).
+            axial_force (float): Applied axial force (positive = tension, so a
+                compressive load is negative; see the sign convention in the README).
 
         Returns:
             list: List of (curvature, moment) tuples.
+
+        The strain plane of every step is kept in `strain_planes` (see
+        `fiber_fields`); failed steps have NaN planes.
         """
         results = []
+        neutral_axes = []
 
         for curvature in curvature_range:
             try:
                 neutral_axis = self.find_neutral_axis(axial_force, curvature)
                 moment = self.calculate_moment_capacity(curvature, neutral_axis)
                 results.append((curvature, moment))
+                neutral_axes.append(neutral_axis)
             except Exception as e:
                 print(f"⚠️ Curvature {curvature:.5f} failed: {e}")
                 results.append((curvature, None))
+                neutral_axes.append(np.nan)
 
+        curvatures = np.array([curvature for curvature, _ in results], dtype=float)
+        self.strain_planes = FiberFields.planes_from_neutral_axes(curvatures, neutral_axes)
         return results
 
+    def fiber_fields(self, planes=None, fibers=None, quantities=("strain", "stress")):
+        """
+        Lazy fiber strains/stresses of saved strain planes.
+
+        Fields are computed per step on demand (or streamed in chunks, or written
+        to memory-mapped files), so the analysis itself stays lean. Regions
+        integrated by the analytic backend have no fibers and are not included.
+
+        Parameters:
+            planes (numpy.ndarray, optional): (steps, 2) planes [strain at y = 0,
+                curvature]; default to those of the last moment-curvature analysis.
+            fibers (array_like, optional): Indices or boolean mask of the analysis
+                fibers to keep.
+            quantities (tuple): Any of "strain", "stress", "force" and "tangent".
+
+        Returns:
+            FiberFields: The lazy fields.
+        """
+        if planes is None:
+            if self.strain_planes is None:
+                raise ValueError("No strain planes saved; run moment_curvature_analysis first.")
+            planes = self.strain_planes
+        return FiberFields.from_solver(self, planes, fibers, quantities, self.initial_strain)
+
     def calculate_moment_capacity(self, curvature, neutral_axis):
         """
         Calculate bending moment for a given curvature and neutral axis.
@@ -98,23 +484,17 @@ class SectionSolver:
         Returns:
             float: Resulting moment.
         """
-        total_moment = 0.0
+        total_moment = self._analytic_forces(neutral_axis, curvature)[1]
+        total_moment += self._fiber_sums(neutral_axis, curvature)[1]
 
-        for fiber in self.section.fibers:
-            strain = curvature * (fiber.y - neutral_axis)
-            stress = fiber.material.stress(strain)
-            force = stress * fiber.area
-            lever_arm = fiber.y - neutral_axis
-            total_moment += force * lever_arm
-
-        return total_moment
+        return float(total_moment)
 
     def find_neutral_axis(self, target_axial_force, curvature, tolerance=1e-6, max_iter=100):
         """
         Find the neutral axis depth that satisfies the target axial force.
 
         Parameters:
-            target_axial_force (float): Applied axial force.
+            target_axial_force (float): Applied axial force (positive = tension).
             curvature (float): Section curvature.
             tolerance (float): Convergence tolerance.
             max_iter (int): Max iterations.
@@ -122,8 +502,7 @@ class SectionSolver:
         Returns:
             float: Neutral axis position.
         """
-        y_min = min(fiber.y for fiber in self.section.fibers)
-        y_max = max(fiber.y for fiber in self.section.fibers)
+        y_min, y_max = self._y_bounds()
 
         low = y_min
         high = y_max
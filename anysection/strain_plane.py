@@ -0,0 +1,222 @@
+# anysection/strain_plane.py
+
+import numpy as np
+
+from anysection.batch import BatchEvaluator
+from anysection.fields import FiberFields
+
+
+class StrainPlaneResult:
+    """
+    Strain planes found for a batch of load cases.
+
+    Attributes:
+        planes (numpy.ndarray): (cases, 2) [strain at reference, curvature] or
+            (cases, 3) [strain at reference, curvature x, curvature y].
+        converged (numpy.ndarray): Per-case convergence mask.
+        iterations (numpy.ndarray): Newton iterations used by every case.
+        residuals (numpy.ndarray): Remaining force residuals, shaped like `planes`.
+    """
+
+    def __init__(self, planes, converged, iterations, residuals):
+        self.planes = planes
+        self.converged = converged
+        self.iterations = iterations
+        self.residuals = residuals
+
+    @property
+    def strain_at_reference(self):
+        return self.planes[:, 0]
+
+    @property
+    def curvature(self):
+        return self.planes[:, 1]
+
+    def __str__(self):
+        return f"StrainPlaneResult: {len(self.planes)} load cases, {int(self.converged.sum())} converged"
+
+
+class StrainPlaneSolver:
+    """
+    Inverse section analysis: find the strain plane that carries given forces.
+
+    Uniaxial bending uses the plane strain = e0 + kx * (y - yr) with the
+    forces (N, Mx), Mx = sum(F * (y - yr)). Biaxial bending adds a second
+    curvature, strain = e0 + kx * (y - yr) + ky * (x - xr), with the forces
+    (N, Mx, My), My = sum(F * (x - xr)). N is positive in tension. Initial
+    fiber strains (shrinkage, creep, prestress) are added to the plane strain.
+
+    Every load case runs its own damped Newton iteration on the section tangent
+    stiffness, but all cases advance together as (cases x fibers) arrays.
+    Cases drop out of the update once converged (per-case masks) and a
+    backtracking line search keeps steps that overshoot, e.g. across cracking
+    or yielding, from diverging.
+
+    Parameters:
+        evaluator (BatchEvaluator): Fibers and material groups of the section.
+        reference (tuple, optional): (xr, yr) point about which moments are
+            taken; defaults to the area centroid of the fibers.
+    """
+
+    def __init__(self, evaluator, reference=None):
+        self.evaluator = evaluator
+        if reference is None:
+            total = evaluator.area.sum()
+            reference = (np.dot(evaluator.area, evaluator.x) / total, np.dot(evaluator.area, evaluator.y) / total)
+        self.reference = tuple(float(value) for value in reference)
+        self.height = max(float(np.ptp(evaluator.y)), 1e-12)
+        self.width = max(float(np.ptp(evaluator.x)), 1e-12)
+        self.lever_arms = np.vstack((np.ones_like(evaluator.area), evaluator.y - self.reference[1],
+                                     evaluator.x - self.reference[0]))
+
+    @classmethod
+    def from_section(cls, section, mesh_divisions=(20, 20), reference=None):
+        """
+        Build a solver for a section, meshing its material regions.
+        """
+        return cls(BatchEvaluator.from_section(section, mesh_divisions), reference)
+
+    def state(self, planes, initial_strain=None):
+        """
+        Fiber strains, stresses and tangent moduli of a batch of strain planes.
+
+        Parameters:
+            planes (numpy.ndarray): (cases, 2) or (cases, 3) strain planes.
+            initial_strain (numpy.ndarray, optional): Initial fiber strains, shape
+                (fibers,) or (cases, fibers); defaults to those of the evaluator.
+
+        Returns:
+            tuple: (strains, stresses, tangents), each of shape (cases, fibers).
+        """
+        strain = planes @ self.lever_arms[:planes.shape[1]]
+        initial_strain = self.evaluator.initial_strain if initial_strain is None else initial_strain
+        if initial_strain is not None:
+            strain = strain + initial_strain
+        stress = np.empty(strain.shape)
+        tangent = np.empty(strain.shape)
+        for (_, index), kernel in zip(self.evaluator.groups, self.evaluator.kernels):
+            stress[:, index] = kernel.stress(strain[:, index])
+            tangent[:, index] = kernel.tangent(strain[:, index])
+        return strain, stress, tangent
+
+    def forces(self, planes, initial_strain=None):
+        """
+        Section forces (N, Mx[, My]) of a batch of strain planes.
+        """
+        _, stress, _ = self.state(planes, initial_strain)
+        return (stress * self.evaluator.area) @ self.lever_arms[:planes.shape[1]].T
+
+    def fiber_fields(self, planes, fibers=None, quantities=("strain", "stress"), initial_strain=None):
+        """
+        Lazy fiber fields of solved planes (a StrainPlaneResult or its planes
+        array), see FiberFields.
+        """
+        planes = getattr(planes, "planes", planes)
+        return FiberFields.from_evaluator(self.evaluator, planes, self.reference, fibers, quantities, initial_strain)
+
+    def _evaluate(self, planes, targets, initial_strain=None):
+        z = self.lever_arms[:planes.shape[1]]
+        _, stress, tangent = self.state(planes, initial_strain)
+        force = stress * self.evaluator.area
+        residual = targets - force @ z.T
+        scale = np.abs(force) @ np.abs(z).T
+        # Softening fibers (cracking drops, post-peak branches) are left out of
+        # the stiffness: their negative, near-infinite tangents would make the
+        # Newton step jump across the discontinuity instead of settling on it.
+        tangent = np.maximum(tangent, 0.0)
+        stiffness = np.einsum("cf,if,jf->cij", tangent * self.evaluator.area, z, z)
+        return residual, scale, stiffness
+
+    def _norm(self, residual):
+        lengths = np.array([1.0, self.height, self.width])[:residual.shape[1]]
+        return np.sqrt(((residual / lengths) ** 2).sum(axis=1))
+
+    @staticmethod
+    def _newton_step(stiffness, residual):
+        # A tiny diagonal shift keeps fully cracked or yielded sections solvable
+        diagonal = np.abs(np.diagonal(stiffness, axis1=1, axis2=2))
+        shift = 1e-12 * diagonal.max(axis=1, keepdims=True) + 1e-300
+        regularized = stiffness + np.eye(stiffness.shape[1]) * shift[:, :, None]
+        try:
+            return np.linalg.solve(regularized, residual[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            return np.einsum("cij,cj->ci", np.linalg.pinv(regularized), residual)
+
+    def solve(self, axial_force, moment_x, moment_y=None, initial=None, max_iter=50, rtol=1e-8, atol=1e-6,
+              max_halvings=8, initial_strain=None):
+        """
+        Find the strain plane of every load case.
+
+        Parameters:
+            axial_force (array_like): Axial forces (positive = tension).
+            moment_x (array_like): Moments Mx about the reference point.
+            moment_y (array_like, optional): Moments My; given for biaxial bending.
+            initial (numpy.ndarray, optional): Starting planes (warm start), shape
+                (cases, 2) or (cases, 3). Defaults to the unstrained section.
+            max_iter (int): Maximum Newton iterations.
+            rtol (float): Tolerance relative to the sums of |fiber force| (and
+                |fiber moment|) of every case.
+            atol (float): Absolute force/moment tolerance.
+            max_halvings (int): Maximum step halvings of the line search.
+            initial_strain (array_like, optional): Initial fiber strains, shape
+                (fibers,) or (cases, fibers), e.g. the shrinkage and creep strains
+                of one time step per case. Defaults to those of the evaluator.
+
+        Returns:
+            StrainPlaneResult: Planes, convergence mask, iterations and residuals.
+        """
+        actions = [axial_force, moment_x] if moment_y is None else [axial_force, moment_x, moment_y]
+        actions = np.broadcast_arrays(*[np.atleast_1d(np.asarray(a, dtype=float)) for a in actions])
+        targets = np.column_stack(actions)
+        if initial_strain is None:
+            initial_strain = self.evaluator.initial_strain
+        if initial_strain is not None:
+            initial_strain = np.asarray(initial_strain, dtype=float)
+            if initial_strain.ndim == 2:
+                # One initial strain field per case; single loads apply to all of them
+                targets = np.broadcast_to(targets, (max(len(targets), len(initial_strain)), targets.shape[1]))
+            initial_strain = np.broadcast_to(initial_strain, (len(targets), len(self.evaluator.area)))
+        count, size = targets.shape
+        planes = np.zeros((count, size)) if initial is None else np.array(initial, dtype=float).reshape(count, size)
+        iterations = np.zeros(count, dtype=int)
+        residual = np.zeros((count, size))
+        converged = np.zeros(count, dtype=bool)
+        active = np.arange(count)
+
+        def eigen(rows):
+            return None if initial_strain is None else initial_strain[rows]
+
+        # Cases beyond the section capacity diverge; their overflows are expected
+        with np.errstate(over="ignore", invalid="ignore"):
+            for _ in range(max_iter + 1):
+                r, scale, stiffness = self._evaluate(planes[active], targets[active], eigen(active))
+                residual[active] = r
+                done = (np.abs(r) <= rtol * scale + atol).all(axis=1)
+                converged[active[done]] = True
+                keep = ~done & (iterations[active] < max_iter)
+                active, r, stiffness = active[keep], r[keep], stiffness[keep]
+                if not len(active):
+                    break
+                iterations[active] += 1
+
+                step = self._newton_step(stiffness, r)
+                start = planes[active]
+                norm = self._norm(r)
+                alpha = np.ones(len(active))
+                pending = np.arange(len(active))
+                for _ in range(max_halvings + 1):
+                    trial = start[pending] + alpha[pending, None] * step[pending]
+                    trial_residual = targets[active[pending]] - self.forces(trial, eigen(active[pending]))
+                    accepted = self._norm(trial_residual) <= (1 - 1e-4 * alpha[pending]) * norm[pending]
+                    planes[active[pending]] = trial
+                    pending = pending[~accepted]
+                    if not len(pending):
+                        break
+                    alpha[pending] /= 2
+                # No descent along the step (e.g. a softening branch where the
+                # residual norm has a local minimum): take the full Newton step.
+                planes[active[pending]] = start[pending] + step[pending]
+        return StrainPlaneResult(planes, converged, iterations, residual)
+
+    def __str__(self):
+        return f"StrainPlaneSolver: {len(self.evaluator.area)} fibers, reference {self.reference}"
@@ -0,0 +1,193 @@
+# anysection/surrogate.py
+
+import os
+
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+
+from anysection.batch import BatchEvaluator
+
+
+def _check_axes(axial_forces, curvatures):
+    """
+    Raise ValueError unless both grid axes have at least two strictly increasing
+    points, so that every query lies in a cell of non-zero width.
+    """
+    if len(axial_forces) < 2 or len(curvatures) < 2:
+        raise ValueError("Grid axes need at least two points each.")
+    if np.any(np.diff(axial_forces) <= 0) or np.any(np.diff(curvatures) <= 0):
+        raise ValueError("Grid axes must be strictly increasing.")
+
+
+class SectionSurrogate:
+    """
+    Precomputed moment and tangent stiffness tables of a section over an
+    (axial force, curvature) grid, queried by vectorized interpolation.
+
+    Building the tables costs one batched moment-curvature analysis; afterwards
+    a frame solver can look up M(N, kappa) and dM/dkappa at every integration
+    point in a single array call instead of solving the section each time.
+    Grid points without equilibrium (beyond the section capacity) are NaN, and
+    queries that touch them or fall outside the grid return NaN.
+
+    Parameters:
+        axial_forces (array_like): Increasing axial forces of the grid (positive
+            = tension), at least two.
+        curvatures (array_like): Increasing curvatures of the grid, at least two.
+        moments (numpy.ndarray): Moments, shape (axial forces, curvatures).
+        stiffness (numpy.ndarray, optional): Tangent stiffness dM/dkappa with the
+            shape of `moments`; differentiated from the moments if omitted.
+    """
+
+    def __init__(self, axial_forces, curvatures, moments, stiffness=None):
+        self.axial_forces = np.asarray(axial_forces, dtype=float)
+        self.curvatures = np.asarray(curvatures, dtype=float)
+        self.moments = np.asarray(moments, dtype=float)
+        if self.moments.shape != (len(self.axial_forces), len(self.curvatures)):
+            raise ValueError("moments must have shape (len(axial_forces), len(curvatures)).")
+        _check_axes(self.axial_forces, self.curvatures)
+        if stiffness is None:
+            stiffness = np.gradient(self.moments, self.curvatures, axis=1)
+        self.stiffness = np.asarray(stiffness, dtype=float)
+        self._splines = {}
+
+    @classmethod
+    def build(cls, section, axial_forces, curvatures, mesh_divisions=(20, 20), max_iter=50, rtol=1e-6):
+        """
+        Tabulate a section with the batched solver.
+
+        Every axial force is a realization of one BatchEvaluator run, so the
+        whole table takes one equilibrium solve per curvature.
+
+        Parameters:
+            section (Section): Section to tabulate.
+            axial_forces (array_like): Axial forces of the grid.
+            curvatures (array_like): Curvatures of the grid.
+            mesh_divisions (tuple): (nx, ny) grid used to mesh the material regions.
+            max_iter, rtol: See BatchEvaluator.equilibrium.
+
+        Returns:
+            SectionSurrogate: The tabulated section.
+        """
+        axial_forces = np.asarray(axial_forces, dtype=float)
+        curvatures = np.asarray(curvatures, dtype=float)
+        _check_axes(axial_forces, curvatures)
+        evaluator = BatchEvaluator.from_section(section, mesh_divisions)
+        _, moments = evaluator.moment_curvature(curvatures, axial_forces, max_iter=max_iter, rtol=rtol)
+        return cls(axial_forces, curvatures, moments)
+
+    def _cells(self, axial_force, curvature):
+        """
+        Cell indices and local coordinates of query points (NaN outside the grid).
+        """
+        i = np.clip(np.searchsorted(self.axial_forces, axial_force, side="right") - 1, 0, len(self.axial_forces) - 2)
+        j = np.clip(np.searchsorted(self.curvatures, curvature, side="right") - 1, 0, len(self.curvatures) - 2)
+        u = (axial_force - self.axial_forces[i]) / (self.axial_forces[i + 1] - self.axial_forces[i])
+        v = (curvature - self.curvatures[j]) / (self.curvatures[j + 1] - self.curvatures[j])
+        outside = (u < 0) | (u > 1) | (v < 0) | (v > 1)
+        return i, j, np.where(outside, np.nan, u), np.where(outside, np.nan, v)
+
+    def _bilinear(self, table, i, j, u, v):
+        return ((1 - u) * (1 - v) * table[i, j] + u * (1 - v) * table[i + 1, j]
+                + (1 - u) * v * table[i, j + 1] + u * v * table[i + 1, j + 1])
+
+    def _spline(self, name):
+        """
+        Bicubic spline of a table, fitted once. NaN grid points are filled with
+        the nearest valid value along the curvature axis for the fit only.
+        """
+        if name not in self._splines:
+            table = getattr(self, name).copy()
+            for row in table:
+                valid = np.flatnonzero(~np.isnan(row))
+                if len(valid):
+                    row[:] = row[valid[np.abs(np.arange(len(row))[:, None] - valid).argmin(axis=1)]]
+            table = np.nan_to_num(table)
+            # Cubic where the axes allow it (a degree k spline needs k + 1 points)
+            self._splines[name] = RectBivariateSpline(self.axial_forces, self.curvatures, table,
+                                                      kx=min(3, len(self.axial_forces) - 1),
+                                                      ky=min(3, len(self.curvatures) - 1))
+        return self._splines[name]
+
+    def interpolate(self, name, axial_force, curvature, method="linear"):
+        """
+        Interpolate a table ("moments" or "stiffness") at arrays of query points.
+
+        Parameters:
+            name (str): Table to interpolate.
+            axial_force (array_like): Axial forces of the queries.
+            curvature (array_like): Curvatures of the queries.
+            method (str): "linear" (bilinear) or "cubic" (bicubic spline; the
+                degree drops along an axis with fewer than four points).
+
+        Returns:
+            numpy.ndarray: Interpolated values, broadcast shape of the inputs.
+        """
+        axial_force, curvature = np.broadcast_arrays(np.asarray(axial_force, dtype=float),
+                                                     np.asarray(curvature, dtype=float))
+        i, j, u, v = self._cells(axial_force, curvature)
+        # Queries in cells touching a NaN grid point are undefined for both methods
+        value = self._bilinear(getattr(self, name), i, j, u, v)
+        if method == "linear":
+            return value
+        if method == "cubic":
+            spline = self._spline(name).ev(axial_force, curvature)
+            return np.where(np.isnan(value), np.nan, spline)
+        raise ValueError(f"Unknown interpolation method '{method}'. Use 'linear' or 'cubic'.")
+
+    def moment(self, axial_force, curvature, method="linear"):
+        """
+        Moment M(N, kappa) at arrays of query points.
+        """
+        return self.interpolate("moments", axial_force, curvature, method)
+
+    def tangent(self, axial_force, curvature, method="linear"):
+        """
+        Tangent stiffness dM/dkappa (N, kappa) at arrays of query points.
+        """
+        return self.interpolate("stiffness", axial_force, curvature, method)
+
+    def __call__(self, axial_force, curvature, method="linear"):
+        """
+        Return (moment, tangent stiffness) at arrays of query points.
+        """
+        return self.moment(axial_force, curvature, method), self.tangent(axial_force, curvature, method)
+
+    def save(self, path, compressed=False):
+        """
+        Store the tables.
+
+        Parameters:
+            path (str): A ".npz" file, or a directory of ".npy" files that `load`
+                can memory-map.
+            compressed (bool): Compress the ".npz" archive.
+        """
+        tables = {"axial_forces": self.axial_forces, "curvatures": self.curvatures,
+                  "moments": self.moments, "stiffness": self.stiffness}
+        if path.endswith(".npz"):
+            (np.savez_compressed if compressed else np.savez)(path, **tables)
+            return
+        os.makedirs(path, exist_ok=True)
+        for name, table in tables.items():
+            np.save(os.path.join(path, f"{name}.npy"), table)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Load tables written by `save`; ".npy" directories are memory-mapped by
+        default so that processes reading the same surrogate share the page cache.
+        """
+        names = ("axial_forces", "curvatures", "moments", "stiffness")
+        if path.endswith(".npz"):
+            with np.load(path) as archive:
+                tables = [archive[name] for name in names]
+        else:
+            tables = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in names]
+        surrogate = cls.__new__(cls)
+        surrogate.axial_forces, surrogate.curvatures, surrogate.moments, surrogate.stiffness = tables
+        surrogate._splines = {}
+        return surrogate
+
+    def __str__(self):
+        return (f"SectionSurrogate: {len(self.axial_forces)} axial forces x "
+                f"{len(self.curvatures)} curvatures")
@@ -0,0 +1,217 @@
+# anysection/sweep.py
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+
+from anysection.batch import BatchEvaluator
+
+
+class SweepResult:
+    """
+    Labeled N-D result of a parametric sweep.
+
+    Attributes:
+        dims (tuple): Names of the grid axes, followed by "curvature".
+        coords (dict): Coordinate values of every axis.
+        moments (numpy.ndarray): Moments on the grid, NaN where no equilibrium
+            was found; the last axis runs over the curvatures.
+        neutral_axes (numpy.ndarray): Neutral axes with the shape of `moments`.
+    """
+
+    def __init__(self, dims, coords, moments, neutral_axes):
+        self.dims = tuple(dims)
+        self.coords = coords
+        self.moments = moments
+        self.neutral_axes = neutral_axes
+
+    @property
+    def capacity(self):
+        """
+        Largest moment over the curvature axis (NaN if no step converged).
+        """
+        moments = np.where(np.isnan(self.moments), -np.inf, self.moments).max(axis=-1)
+        return np.where(np.isfinite(moments), moments, np.nan)
+
+    def sel(self, **labels):
+        """
+        Select grid points by coordinate value, dropping the selected axes.
+
+        Example:
+            result.sel(width=0.3, axial_force=-500e3)
+        """
+        index = []
+        for dim in self.dims:
+            if dim in labels:
+                matches = np.flatnonzero(np.isclose(self.coords[dim], labels[dim]))
+                if not len(matches):
+                    raise KeyError(f"{labels[dim]} not found along '{dim}'.")
+                index.append(matches[0])
+            else:
+                index.append(slice(None))
+        dims = [dim for dim in self.dims if dim not in labels]
+        coords = {dim: self.coords[dim] for dim in dims}
+        return SweepResult(dims, coords, self.moments[tuple(index)], self.neutral_axes[tuple(index)])
+
+    def __str__(self):
+        shape = ", ".join(f"{dim}: {len(self.coords[dim])}" for dim in self.dims)
+        return f"SweepResult({shape})"
+
+
+class ParametricSweep:
+    """
+    Moment-curvature analysis over a grid of section dimensions, material
+    parameters and axial loads.
+
+    Work is shared between grid points instead of rebuilding everything:
+    - every geometry point is built and meshed once, and all material/axial
+      combinations are evaluated on that mesh as one batch of realizations;
+    - the batched material tables are built once and reused for every geometry.
+
+    Parameters:
+        builder (callable): builder(materials, **geometry) -> Section, where
+            materials is the dict given below. Must be picklable (a module-level
+            function) when workers > 1.
+        materials (dict): Named base materials used by the builder.
+        curvatures (iterable): Curvatures of the moment-curvature analysis.
+        mesh_divisions (tuple): (nx, ny) grid used to mesh the material regions.
+    """
+
+    def __init__(self, builder, materials, curvatures, mesh_divisions=(20, 20)):
+        self.builder = builder
+        self.materials = materials
+        self.curvatures = np.asarray(curvatures, dtype=float)
+        self.mesh_divisions = mesh_divisions
+        self.geometry = {}
+        self.material_parameters = []
+        self.axial_forces = np.array([0.0])
+
+    def add_geometry(self, name, values):
+        """
+        Sweep a builder argument (e.g. width or height).
+        """
+        self.geometry[name] = np.asarray(values, dtype=float)
+
+    def add_material_parameter(self, name, material, parameter, values):
+        """
+        Sweep a constructor argument of a named material.
+
+        Parameters:
+            name (str): Axis name, e.g. "fy".
+            material (str): Key of the material in `materials`.
+            parameter (str): Constructor argument, e.g. "fy" or "fcm".
+            values (iterable): Values of the parameter.
+        """
+        if material not in self.materials:
+            raise KeyError(f"Unknown material '{material}'.")
+        self.material_parameters.append((name, material, parameter, np.asarray(values, dtype=float)))
+
+    def set_axial_forces(self, values):
+        """
+        Sweep the axial force (positive = tension).
+        """
+        self.axial_forces = np.atleast_1d(np.asarray(values, dtype=float))
+
+    @property
+    def dims(self):
+        return (list(self.geometry) + [axis[0] for axis in self.material_parameters]
+                + ["axial_force", "curvature"])
+
+    def material_tables(self, chunk_size):
+        """
+        Build the batched materials and axial forces of every chunk of the
+        material/axial grid.
+
+        Returns:
+            list: (slice, {material name: batched material}, axial forces) per chunk.
+        """
+        grids = [axis[3] for axis in self.material_parameters] + [self.axial_forces]
+        columns = [grid.ravel() for grid in np.meshgrid(*grids, indexing="ij")]
+        count = len(columns[-1])
+        tables = []
+        for start in range(0, count, chunk_size):
+            rows = slice(start, start + chunk_size)
+            overrides = {}
+            for (_, material, parameter, _), column in zip(self.material_parameters, columns):
+                overrides.setdefault(material, {})[parameter] = column[rows][:, None]
+            batched = {material: self.materials[material].with_parameters(**parameters)
+                       for material, parameters in overrides.items()}
+            tables.append((rows, batched, columns[-1][rows]))
+        return tables
+
+    def evaluate_geometry(self, point, tables):
+        """
+        Build and mesh one geometry point and evaluate every material/axial combination on it.
+
+        Returns:
+            tuple: (neutral axes, moments) of shape (combinations, curvatures).
+        """
+        evaluator = BatchEvaluator.from_section(self.builder(self.materials, **point), self.mesh_divisions)
+        names = {id(material): name for name, material in self.materials.items()}
+        count = sum(len(axial_forces) for _, _, axial_forces in tables)
+        neutral_axes = np.full((count, len(self.curvatures)), np.nan)
+        moments = np.full((count, len(self.curvatures)), np.nan)
+        for rows, batched, axial_forces in tables:
+            materials = [batched.get(names.get(id(material)), material) for material in evaluator.materials]
+            neutral_axes[rows], moments[rows] = evaluator.moment_curvature(self.curvatures, axial_forces,
+                                                                            materials=materials)
+        return neutral_axes, moments
+
+    def run(self, workers=1, chunk_size=1024):
+        """
+        Evaluate the whole grid.
+
+        Parameters:
+            workers (int): Number of worker processes; geometry points are dealt
+                out in one block per worker. Each worker receives the sweep once,
+                when it starts, and builds the material tables once.
+            chunk_size (int): Material/axial combinations evaluated per batch.
+
+        Returns:
+            SweepResult: Moments and neutral axes on the labeled grid.
+        """
+        names = list(self.geometry)
+        points = [dict(zip(names, values)) for values in product(*self.geometry.values())]
+        combinations = int(np.prod([len(axis[3]) for axis in self.material_parameters])) * len(self.axial_forces)
+        chunk_size = min(chunk_size, combinations)
+
+        if workers > 1 and len(points) > 1:
+            blocks = [points[i::workers] for i in range(workers) if points[i::workers]]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_sweep,
+                                     initargs=(self, chunk_size)) as executor:
+                outputs = list(executor.map(_evaluate_block, blocks))
+            ordered = [None] * len(points)
+            for i, output in enumerate(outputs):
+                ordered[i::len(blocks)] = output
+        else:
+            tables = self.material_tables(chunk_size)
+            ordered = [self.evaluate_geometry(point, tables) for point in points]
+
+        shape = ([len(values) for values in self.geometry.values()]
+                 + [len(axis[3]) for axis in self.material_parameters]
+                 + [len(self.axial_forces), len(self.curvatures)])
+        neutral_axes = np.stack([output[0] for output in ordered]).reshape(shape)
+        moments = np.stack([output[1] for output in ordered]).reshape(shape)
+        coords = dict(self.geometry)
+        coords.update({axis[0]: axis[3] for axis in self.material_parameters})
+        coords["axial_force"] = self.axial_forces
+        coords["curvature"] = self.curvatures
+        return SweepResult(self.dims, coords, moments, neutral_axes)
+
+    def __str__(self):
+        return f"ParametricSweep over {', '.join(self.dims[:-1])}"
+
+
+_WORKER_SWEEP = None
+
+
+def _set_worker_sweep(sweep, chunk_size):
+    # Pool initializer: the sweep is unpickled and its tables built once per worker
+    global _WORKER_SWEEP
+    _WORKER_SWEEP = sweep, sweep.material_tables(chunk_size)
+
+
+def _evaluate_block(points):
+    sweep, tables = _WORKER_SWEEP
+    return [sweep.evaluate_geometry(point, tables) for point in points]
@@ -1,9 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from anysection.material import Concrete_NonlinearEC2, Steel_Bilinear
 from anysection.area import Tee
 from anysection.section import Section
 from anysection.solver import SectionSolver
+from anysection.plotting import plot_moment_curvature, plot_section, save_figure
 
 # --- Define Materials ---
 concrete = Concrete_NonlinearEC2(fcm=20e6, ec1=0.002, ecu1=0.0035)
@@ -29,18 +29,9 @@ axial_force = -500e3  # 500 kN axial compression
 
 results = solver.moment_curvature_analysis(curvatures, axial_force=axial_force)
 
-# --- Filter results and plot ---
-valid_results = [(k, m) for k, m in results if m is not None]
-if valid_results:
-    curvatures_valid, moments_valid = zip(*valid_results)
-
-    plt.figure(figsize=(10, 5))
-    plt.plot(curvatures_valid, moments_valid, label=f'N = {axial_force/1e3:.0f} kN')
-    plt.xlabel('Curvature (1/m)')
-    plt.ylabel('Moment (Nm)')
-    plt.title('Moment-Curvature Diagram with Axial Load')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+# --- Plot results (rendered headless to files) ---
+if any(moment is not None for _, moment in results):
+    save_figure(plot_moment_curvature(results, label=f'N = {axial_force/1e3:.0f} kN'), "example5_moment_curvature.png")
+    save_figure(plot_section(section), "example5_section.png")
 else:
     print("❌ No valid results found. Check section definition and fiber locations.")
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from anysection.area import Polygon, Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+CURVATURES = np.linspace(0.002, 0.03, 8)
+AXIAL_FORCE = -800e3
+
+
+def make_section():
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    return section
+
+
+def errors(solver, reference):
+    # N and M errors over the equilibrium states of the exact section
+    dN, dM = [], []
+    for curvature in CURVATURES:
+        neutral_axis = reference.find_neutral_axis(AXIAL_FORCE, curvature)
+        dN.append(solver.calculate_axial_force(neutral_axis, curvature) - AXIAL_FORCE)
+        dM.append(solver.calculate_moment_capacity(curvature, neutral_axis)
+                  - reference.calculate_moment_capacity(curvature, neutral_axis))
+    return np.abs(dN).max(), np.abs(dM).max()
+
+
+def test_refinement_lowers_the_error_against_the_analytic_backend():
+    reference = SectionSolver(make_section(), backend="analytic")
+    solver = SectionSolver(make_section(), mesh_divisions=(4, 4))
+    coarse_N, coarse_M = errors(solver, reference)
+
+    info = solver.refine_mesh(CURVATURES, AXIAL_FORCE, tolerance=1e-3, divisions=(4, 4))
+    fine_N, fine_M = errors(solver, reference)
+    assert info["error"] <= 1e-3
+    assert fine_N < coarse_N / 5 and fine_M < coarse_M / 5
+    # The tolerance is relative to the axial force and to the force times the depth
+    assert fine_N < 1e-3 * abs(AXIAL_FORCE) and fine_M < 1e-3 * abs(AXIAL_FORCE) * 0.5
+    # Far fewer fibers than a uniform mesh of the finest cell size
+    assert info["fibers"] < 4 * 4 * 2 ** 8
+
+
+def test_chord_widths_of_a_polygon_with_a_hole():
+    # 0.4 x 0.6 box with a 0.2 x 0.2 hole centred at (0.1, 0.1)
+    polygon = Polygon([(-0.2, -0.3), (0.2, -0.3), (0.2, 0.3), (-0.2, 0.3)],
+                      holes=[[(0.0, 0.0), (0.2, 0.0), (0.2, 0.2), (0.0, 0.2)][::-1]])
+    y = np.array([-0.29, -0.1, 0.05, 0.1, 0.19, 0.25])
+    np.testing.assert_allclose(polygon.chord_widths(y), [0.4, 0.4, 0.2, 0.2, 0.2, 0.4])
+    # The widths integrate to the area
+    ys = np.linspace(-0.3, 0.3, 60001)
+    widths = polygon.chord_widths((ys[:-1] + ys[1:]) / 2)
+    assert widths.sum() * (ys[1] - ys[0]) == pytest.approx(polygon.area(), rel=1e-9)
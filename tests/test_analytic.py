@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from scipy.integrate import quad
+
+from anysection.area import Polygon, Rectangle
+from anysection.material import (Concrete_MC90General, Concrete_NonlinearEC2, Concrete_ParabolicLinearEC2,
+                                  Concrete_ParabolicLinearFRC, Concrete_ParabolicLinearGeneral, Concrete_Popovics,
+                                  Steel_Bilinear)
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+# T-section: 0.8 x 0.15 flange on a 0.3 x 0.45 web
+T_SECTION = Polygon([(-0.15, -0.3), (0.15, -0.3), (0.15, 0.15), (0.4, 0.15), (0.4, 0.3), (-0.4, 0.3),
+                     (-0.4, 0.15), (-0.15, 0.15)])
+STATES = [(0.0, 0.01), (0.1, 0.02), (-0.2, 0.005), (0.25, -0.012), (0.05, 0.0005)]
+# No fiber reaches the crushing strain: the stress jump there converges only linearly on a mesh
+UNCRUSHED = [(0.0, 0.01), (-0.2, 0.005), (0.35, -0.004), (0.05, 0.0005)]
+CONCRETE = [
+    Concrete_NonlinearEC2(30e6, 0.002, 0.0035),
+    Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2),
+    Concrete_ParabolicLinearGeneral(30e9, 30e6, 0.002, 0.0035, 0.0, 2.9e6, 0.002),
+    Concrete_ParabolicLinearFRC(30e9, 30e6, 0.002, 0.0035, 2.9e6, 1.5e6, 0.002, 0.5e6, 0.01),
+    Concrete_MC90General(30e6, 0.0035, 2.9e6, 0.002),
+]
+
+
+def width(y):
+    return 0.8 if y > 0.15 else 0.3
+
+
+def reference(material, neutral_axis, curvature):
+    # Adaptive quadrature over the depth, split at the flange and at the strain breakpoints
+    strains = [-0.0035, -0.002, 0.0, 2.9e6 / 30e9, 0.002, 0.01]
+    breaks = neutral_axis + np.array(strains) / curvature
+    points = [0.15] + list(breaks[np.abs(breaks) < 0.3])
+
+    def integrate(power):
+        return quad(lambda y: material.stress(curvature * (y - neutral_axis)) * width(y) * (y - neutral_axis) ** power,
+                    -0.3, 0.3, points=sorted(points), limit=200, epsabs=1e-6, epsrel=1e-12)[0]
+    return integrate(0), integrate(1)
+
+
+@pytest.mark.parametrize("material", CONCRETE, ids=lambda material: material.name)
+def test_closed_form_integration_matches_quadrature(material):
+    section = Section("tee")
+    section.add_area(T_SECTION, material=material)
+    solver = SectionSolver(section, backend="analytic")
+    assert solver.analytic_regions() and not len(solver.analysis_fibers())
+    for neutral_axis, curvature in STATES:
+        force, moment = reference(material, neutral_axis, curvature)
+        assert solver.calculate_axial_force(neutral_axis, curvature) == pytest.approx(force, rel=1e-8, abs=1e-3)
+        assert solver.calculate_moment_capacity(curvature, neutral_axis) == pytest.approx(moment, rel=1e-8, abs=1e-3)
+
+
+@pytest.mark.parametrize("concrete", [Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2),
+                                      Concrete_Popovics(30e9, 30e6, 0.002, 0.0035)], ids=lambda material: material.name)
+def test_analytic_and_fiber_backends_agree(concrete):
+    # Popovics has no polynomial form and is meshed by both backends
+    def make_section():
+        section = Section("beam")
+        section.add_area(Rectangle(0.3, 0.5), material=concrete)
+        section.add_area(T_SECTION, dx=0.0, dy=0.6, material=concrete)
+        section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+        return section
+
+    analytic = SectionSolver(make_section(), backend="analytic", mesh_divisions=(40, 200))
+    fiber = SectionSolver(make_section(), backend="fiber", mesh_divisions=(40, 200))
+    for neutral_axis, curvature in UNCRUSHED:
+        assert analytic.calculate_axial_force(neutral_axis, curvature) == pytest.approx(
+            fiber.calculate_axial_force(neutral_axis, curvature), rel=1e-4, abs=10.0)
+        assert analytic.calculate_moment_capacity(curvature, neutral_axis) == pytest.approx(
+            fiber.calculate_moment_capacity(curvature, neutral_axis), rel=1e-4, abs=1.0)
+
+    for axial_force in (-2e6, 0.0):
+        expected = fiber.moment_curvature_analysis([0.005, 0.01], axial_force)
+        np.testing.assert_allclose(analytic.moment_curvature_analysis([0.005, 0.01], axial_force), expected, rtol=2e-3)
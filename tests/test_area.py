@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from anysection.adaptive import AdaptiveMesh
+from anysection.area import Polygon, Rectangle, Triangle
+from anysection.material import Steel_Bilinear
+
+THIN_WEB = Polygon([(-0.5, -0.5), (0.5, -0.5), (0.5, -0.4), (0.01, -0.4), (0.01, 0.4), (0.5, 0.4), (0.5, 0.5),
+                    (-0.5, 0.5), (-0.5, 0.4), (-0.01, 0.4), (-0.01, -0.4), (-0.5, -0.4)])
+SLIT = Polygon([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)],
+               holes=[[(0.2, 0.52), (0.8, 0.52), (0.8, 0.53), (0.2, 0.53)]])
+
+
+@pytest.mark.parametrize("polygon, area", [(THIN_WEB, 0.216), (SLIT, 0.994)], ids=["thin-web", "slit-hole"])
+@pytest.mark.parametrize("divisions", [(20, 20), (7, 3), (1, 1)])
+def test_mesh_conserves_area_and_centroid(polygon, area, divisions):
+    x, y, fiber_area = polygon.mesh(*divisions)
+    assert polygon.area() == pytest.approx(area)
+    assert fiber_area.sum() == pytest.approx(area, rel=1e-12)
+    assert np.dot(fiber_area, y) / area == pytest.approx(polygon.centroid()[1], abs=1e-12)
+
+
+@pytest.mark.parametrize("polygon", [THIN_WEB, SLIT], ids=["thin-web", "slit-hole"])
+def test_adaptive_mesh_conserves_area(polygon):
+    mesh = AdaptiveMesh(polygon, Steel_Bilinear(200e9, 500e6, 0.05), divisions=(20, 20))
+    assert mesh.fibers()[2].sum() == pytest.approx(polygon.area(), rel=1e-12)
+
+
+def test_crossed_cells_marks_cells_cut_by_a_thin_web():
+    xs = ys = np.linspace(-0.5, 0.5, 21)
+    crossed = THIN_WEB.crossed_cells(xs, ys)
+    # The web (|x| <= 0.01) runs through the two middle columns without any corner inside
+    assert crossed[9:11, 2:18].all()
+    assert not crossed[:8, 3:17].any()
+
+
+@pytest.mark.parametrize("shape", [Rectangle(0.3, 0.5, 0.1, -0.2), Triangle(0.4, 0.6, -0.3, 0.2)],
+                         ids=["rectangle", "triangle"])
+def test_polygon_properties_match_the_primitive_formulas(shape):
+    polygon = shape.to_polygon()
+    assert polygon.area() == pytest.approx(shape.area(), rel=1e-12)
+    assert polygon.centroid() == pytest.approx(shape.centroid(), abs=1e-12)
+    assert polygon.moment_of_inertia() == pytest.approx(shape.moment_of_inertia(), rel=1e-12)
+    assert polygon.product_of_inertia() == pytest.approx(shape.product_of_inertia(), abs=1e-15)
+
+
+def test_hollow_box_far_from_the_origin():
+    # 1.0 x 2.0 box with a 0.6 x 1.4 hole, placed 1 km away: still exact
+    outer = [(0.0, 0.0), (1.0, 0.0), (1.0, 2.0), (0.0, 2.0)]
+    hole = [(0.2, 0.3), (0.8, 0.3), (0.8, 1.7), (0.2, 1.7)]
+    box = Polygon(outer, holes=[hole]).translate(1000.0, 1000.0)
+    assert box.area() == pytest.approx(2.0 - 0.84, rel=1e-12)
+    assert box.centroid() == pytest.approx((1000.5, 1001.0), abs=1e-9)
+    Ix = 1.0 * 2.0 ** 3 / 12 - 0.6 * 1.4 ** 3 / 12
+    Iy = 2.0 * 1.0 ** 3 / 12 - 1.4 * 0.6 ** 3 / 12
+    assert box.moment_of_inertia() == pytest.approx((Ix, Iy), rel=1e-9)
+    assert box.product_of_inertia() == pytest.approx(0.0, abs=1e-9)
+    # Vertex order and orientation of the input rings do not matter
+    assert Polygon(outer[::-1], holes=[hole]).area() == pytest.approx(2.0 - 0.84, rel=1e-12)
+
+
+def test_y_moments_are_the_exact_integrals():
+    box = Polygon([(0.0, 0.0), (1.0, 0.0), (1.0, 2.0), (0.0, 2.0)], holes=[[(0.2, 0.3), (0.8, 0.3), (0.8, 1.7),
+                                                                            (0.2, 1.7)]])
+    y0 = 0.5
+    expected = [((2.0 - y0) ** (k + 1) - (0.0 - y0) ** (k + 1)
+                 - 0.6 * ((1.7 - y0) ** (k + 1) - (0.3 - y0) ** (k + 1))) / (k + 1) for k in range(5)]
+    np.testing.assert_allclose(box.y_moments(4, y0), expected, rtol=1e-12)
@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from anysection.cli import _parser, build_section, load_model, main
+from anysection.material import MaterialFactory
+from anysection.solver import SectionSolver
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL = os.path.join(ROOT, "examples", "model.json")
+
+
+def test_capacity_check_of_the_example_model(capsys):
+    assert main(["capacity", MODEL]) == 0
+    output = capsys.readouterr().out
+    assert "Beam 300x600: 2 load(s)" in output and "Column D500: 1 load(s)" in output
+    assert "2 section(s)" in output
+
+
+def test_failed_capacity_check_returns_1(tmp_path, capsys):
+    with open(MODEL) as f:
+        model = json.load(f)
+    model["sections"][0]["loads"] = [{"axial_force": 0.0, "moment": -5e6}]
+    path = tmp_path / "overloaded.json"
+    path.write_text(json.dumps(model))
+    assert main(["capacity", str(path), "--sections", "Beam 300x600"]) == 1
+    assert "FAILED" in capsys.readouterr().out
+
+
+def test_moment_curvature_output_matches_the_solver(tmp_path, capsys):
+    arguments = ["moment-curvature", MODEL, "--sections", "Beam 300x600", "--axial-force", "0", "-5e5",
+                 "--curvatures", "0.002", "0.02", "4", "--mesh", "10", "20"]
+    assert main(arguments + ["--output", str(tmp_path / "csv")]) == 0
+    assert main(arguments + ["--output", str(tmp_path / "npz"), "--format", "npz", "--workers", "2"]) == 0
+    table = np.genfromtxt(tmp_path / "csv" / "Beam_300x600_moment-curvature.csv", delimiter=",", names=True)
+    assert table.dtype.names == ("axial_force", "curvature", "moment", "neutral_axis")
+    assert len(table) == 2 * 4
+    archive = np.load(tmp_path / "npz" / "Beam_300x600_moment-curvature.npz")
+    np.testing.assert_allclose(archive["moment"], table["moment"], rtol=1e-12)
+
+    # Without axial force the moment about the centroid is the moment about the neutral axis
+    materials, sections = load_model(MODEL)
+    materials = {name: MaterialFactory.from_spec(spec) for name, spec in materials.items()}
+    solver = SectionSolver(build_section(sections[0], materials), mesh_divisions=(10, 20))
+    expected = [moment for _, moment in solver.moment_curvature_analysis(np.linspace(0.002, 0.02, 4), 0.0)]
+    np.testing.assert_allclose(table["moment"][:4], expected, rtol=1e-5)
+
+
+def test_profile_reports_every_phase(capsys):
+    assert main(["interaction", MODEL, "--points", "3", "--curvatures", "0.002", "0.02", "3", "--profile"]) == 0
+    output = capsys.readouterr().out
+    for heading in ("Time per phase", "meshing", "neutral-axis search", "material evaluation", "cProfile",
+                    "tracemalloc: peak"):
+        assert heading in output
+
+
+def test_negative_forces_in_any_notation_are_values():
+    args = _parser().parse_args(["moment-curvature", MODEL, "--axial-force", "-5e5", "-1.5E+6", "-2", "-.5",
+                                 "--mesh", "4", "4"])
+    assert args.axial_force == [-5e5, -1.5e6, -2.0, -0.5]
+
+
+def test_unknown_section_is_reported():
+    with pytest.raises(SystemExit, match="Missing"):
+        main(["capacity", MODEL, "--sections", "Missing"])
+
+
+def test_module_entry_point():
+    completed = subprocess.run([sys.executable, "-m", "anysection", "capacity", MODEL], cwd=ROOT,
+                               capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    assert "Column D500" in completed.stdout
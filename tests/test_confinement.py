@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.confinement import Hoops, add_confined_area, assign_confinement
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+CONCRETE = Concrete_ParabolicLinearEC2(30e6, 1.0, 1.0, 0.002, 0.0035, 2)
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+RECT = Rectangle(0.4, 0.6)
+HOOPS = Hoops(0.01, 0.1, 500e6, 0.03, legs_x=2, legs_y=3)
+CONFINED = HOOPS.confined_material(RECT, 30e6)
+
+
+def make_section(confined=False):
+    section = Section("column")
+    if confined:
+        add_confined_area(section, RECT, HOOPS, CONCRETE, 30e6)
+    else:
+        section.add_area(RECT, material=CONCRETE)
+    for x in (-0.15, 0.15):
+        for y in (-0.25, 0.25):
+            section.add_fiber(np.pi * 0.01 ** 2, x, y, STEEL)
+    return section
+
+
+def moment(solver, axial_force=-3e6, curvature=0.01):
+    return solver.calculate_moment_capacity(curvature, solver.find_neutral_axis(axial_force, curvature))
+
+
+def test_analytic_and_fiber_backends_are_confined_alike():
+    expected = moment(SectionSolver(make_section(confined=True), backend="analytic"))
+    for backend in ("analytic", "fiber"):
+        solver = SectionSolver(make_section(), backend=backend, mesh_divisions=(40, 60))
+        assign_confinement(solver, RECT, HOOPS, CONCRETE, CONFINED)
+        assert moment(solver) == pytest.approx(expected, rel=0.01)
+
+
+def test_confinement_survives_remeshing():
+    solver = SectionSolver(make_section(), backend="analytic")
+    assign_confinement(solver, RECT, HOOPS, CONCRETE, CONFINED)
+    confined = moment(solver)
+    solver.refine_mesh(np.linspace(0.002, 0.01, 5), -3e6)
+    assert moment(solver) == pytest.approx(confined, rel=0.01)
+    solver.set_initial_strain(0.0)
+    assert moment(solver) == pytest.approx(confined, rel=0.01)
+
+
+def test_discrete_fibers_are_reassigned_on_a_copy():
+    section = Section("meshed")
+    xs, ys = np.meshgrid(np.linspace(-0.19, 0.19, 20), np.linspace(-0.29, 0.29, 30))
+    section.add_fibers(np.full(xs.size, 0.24 / xs.size), xs.ravel(), ys.ravel(), CONCRETE)
+    solver = SectionSolver(section)
+    mask = assign_confinement(solver, RECT, HOOPS, CONCRETE, CONFINED)
+    assert mask.any()
+    assert all(material is CONCRETE for material in section.fibers.materials)
+    solver.set_initial_strain(0.0)
+    assert np.array_equal(solver.analysis_fibers().material_ids == solver.analysis_fibers().material_index(CONFINED),
+                          mask)
+
+
+def test_unmatched_material_raises():
+    solver = SectionSolver(make_section(), backend="analytic")
+    other = Concrete_ParabolicLinearEC2(40e6, 1.0, 1.0, 0.002, 0.0035, 2)
+    with pytest.raises(ValueError):
+        assign_confinement(solver, RECT, HOOPS, other, CONFINED)
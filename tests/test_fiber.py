@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from anysection.fiber import Fiber, FiberArrays, FiberView
+from anysection.material import Steel_Bilinear
+
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+
+
+def test_views_have_no_instance_storage_beyond_their_index():
+    fibers = FiberArrays()
+    fibers.add(4.9e-4, 0.1, -0.2, STEEL)
+    view = fibers[0]
+    assert isinstance(view, FiberView) and not isinstance(view, Fiber)
+    assert not hasattr(view, "__dict__")
+    assert [slot for cls in type(view).__mro__ for slot in getattr(cls, "__slots__", ())] == ["_store", "_index"]
+    assert view._store is fibers and view._index == 0
+    assert (view.area, *view.centroid()) == pytest.approx((4.9e-4, 0.1, -0.2))
+    assert view.force(0.001) == pytest.approx(Fiber(4.9e-4, 0.1, -0.2, STEEL).force(0.001))
+
+
+def test_view_writes_go_to_the_arrays():
+    fibers = FiberArrays(dtype=np.float32)
+    fibers.add(1e-4, 0.0, 0.0, STEEL)
+    fibers[0].y = 0.25
+    assert fibers.y[0] == pytest.approx(0.25)
+
+
+def test_slices_and_negative_indices_match_a_list_of_fibers():
+    fibers = FiberArrays()
+    fibers.extend(np.full(5, 1e-4), np.arange(5.0), np.zeros(5), STEEL)
+    assert [view.x for view in fibers[1:4]] == [1.0, 2.0, 3.0]
+    assert [view.x for view in fibers[::-2]] == [4.0, 2.0, 0.0]
+    assert fibers[-1].x == 4.0 and fibers[np.int64(2)].x == 2.0
+    assert fibers[10:] == []
+    with pytest.raises(IndexError):
+        fibers[5]
+    with pytest.raises(TypeError):
+        fibers[1.0]
+
+
+@pytest.mark.parametrize("dtype, expected", [(np.float64, 28), (np.float32, 16)])
+def test_memory_per_fiber(dtype, expected):
+    fibers = FiberArrays(dtype=dtype)
+    for k in range(10000):
+        fibers.add(1e-4, 0.001 * k, 0.0, STEEL)
+    fibers.trim()
+    assert fibers.nbytes / len(fibers) == expected
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.fields import FiberFields
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+from anysection.strain_plane import StrainPlaneSolver
+
+CURVATURES = np.linspace(0.004, 0.02, 7)
+AXIAL_FORCE = -800e3
+
+
+def make_section():
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    return section
+
+
+def test_fields_reproduce_the_section_forces():
+    solver = SectionSolver(make_section(), mesh_divisions=(10, 20))
+    with pytest.raises(ValueError):
+        solver.fiber_fields()
+    results = solver.moment_curvature_analysis(CURVATURES, AXIAL_FORCE)
+    fields = solver.fiber_fields(quantities=("strain", "force"))
+    assert len(fields) == len(CURVATURES)
+
+    y = solver.analysis_fibers().y
+    for (curvature, moment), plane, step in zip(results, solver.strain_planes, fields):
+        neutral_axis = -plane[0] / curvature
+        np.testing.assert_allclose(step["strain"], curvature * (y - neutral_axis))
+        assert step["force"].sum() == pytest.approx(AXIAL_FORCE, rel=1e-5)
+        assert np.dot(step["force"], y - neutral_axis) == pytest.approx(moment, rel=1e-9)
+
+
+def test_steps_chunks_selection_and_saved_files_agree(tmp_path):
+    solver = SectionSolver(make_section(), mesh_divisions=(10, 20))
+    solver.moment_curvature_analysis(CURVATURES, AXIAL_FORCE)
+    quantities = ("strain", "stress", "force", "tangent")
+    fields = solver.fiber_fields(quantities=quantities)
+    every = fields[:]
+    assert every["stress"].shape == (len(CURVATURES), len(solver.analysis_fibers().y))
+
+    chunked = {name: np.concatenate([chunk[name] for _, chunk in fields.chunks(3)]) for name in quantities}
+    saved = fields.save(tmp_path / "fields", chunk_size=2)
+    for name in quantities:
+        np.testing.assert_allclose(chunked[name], every[name], rtol=1e-12, atol=1e-18)
+        np.testing.assert_allclose(saved[name], every[name], rtol=1e-12, atol=1e-18)
+        np.testing.assert_allclose(fields[4][name], every[name][4], rtol=1e-12, atol=1e-18)
+
+    # Only the bars, by mask
+    bars = solver.analysis_fibers().y == -0.2
+    selected = solver.fiber_fields(fibers=bars, quantities=quantities)[:]
+    for name in quantities:
+        np.testing.assert_allclose(selected[name], every[name][:, bars], rtol=1e-12, atol=1e-18)
+
+    with pytest.raises(ValueError):
+        solver.fiber_fields(quantities=("curvature",))
+
+
+def test_fields_of_biaxial_strain_planes():
+    solver = StrainPlaneSolver.from_section(make_section(), mesh_divisions=(10, 20))
+    targets = np.array([[-800e3, 80e3, 20e3], [-300e3, -50e3, 10e3]])
+    result = solver.solve(*targets.T)
+    assert result.converged.all()
+    fields = solver.fiber_fields(result, quantities=("force",))
+    forces = fields[:]["force"]
+    np.testing.assert_allclose(forces @ fields.lever_arms.T, targets, rtol=1e-6)
+    assert isinstance(fields, FiberFields) and fields.reference == solver.reference
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.fused import FusedFiberKernel
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear, Steel_ParkSampson
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+NEUTRAL_AXES = np.array([-0.2, -0.05, 0.0, 0.1, 0.3])
+CURVATURES = np.array([0.002, -0.01, 0.02, 0.005, -0.03])
+
+
+def make_section():
+    prestress = Steel_Bilinear(195e9, 1600e6, 0.035)
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    section.add_fibers(np.full(2, 3.1e-4), [-0.1, 0.1], np.full(2, 0.2), Steel_ParkSampson(200e9, 500e6, 650e6, 0.01, 0.1))
+    section.add_fiber(1.4e-4, 0.0, -0.15, prestress)
+    return section, prestress
+
+
+def make_solvers():
+    section, prestress = make_section()
+    solvers = {engine: SectionSolver(section, mesh_divisions=(10, 20), engine=engine) for engine in ("numpy", "numba")}
+    return solvers, prestress
+
+
+@pytest.mark.parametrize("initial_strain", [False, True])
+def test_numba_engine_matches_numpy(initial_strain):
+    pytest.importorskip("numba")
+    solvers, prestress = make_solvers()
+    if initial_strain:
+        for solver in solvers.values():
+            solver.set_initial_strain(0.006, material=prestress)
+            solver.set_initial_strain(-3e-4)
+    numpy, numba = solvers["numpy"], solvers["numba"]
+
+    # Single load cases through the solver
+    for neutral_axis, curvature in zip(NEUTRAL_AXES, CURVATURES):
+        assert numba.calculate_axial_force(neutral_axis, curvature) == pytest.approx(
+            numpy.calculate_axial_force(neutral_axis, curvature), rel=1e-9, abs=1e-6)
+        assert numba.calculate_moment_capacity(curvature, neutral_axis) == pytest.approx(
+            numpy.calculate_moment_capacity(curvature, neutral_axis), rel=1e-9, abs=1e-6)
+
+    # One batched call of the fused kernel over all cases
+    force, moment, _ = numba._fused(NEUTRAL_AXES, CURVATURES, numba.initial_strain)
+    expected = np.array([numpy._fiber_sums(neutral_axis, curvature)
+                         for neutral_axis, curvature in zip(NEUTRAL_AXES, CURVATURES)])
+    np.testing.assert_allclose(force, expected[:, 0], rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(moment, expected[:, 1], rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize("initial_strain", [False, True])
+def test_fused_kernel_matches_numpy(initial_strain):
+    # Runs without numba too: the loops are then the pure-Python reference
+    section, prestress = make_section()
+    solver = SectionSolver(section, mesh_divisions=(10, 20), engine="numpy")
+    if initial_strain:
+        solver.set_initial_strain(0.006, material=prestress)
+        solver.set_initial_strain(-3e-4)
+    fibers = solver.analysis_fibers()
+    fused = FusedFiberKernel(fibers, [material.kernel() for material in fibers.materials])
+    assert fused.remaining  # Steel_ParkSampson stays on the NumPy path
+
+    expected = np.array([solver._fiber_sums(neutral_axis, curvature)
+                         for neutral_axis, curvature in zip(NEUTRAL_AXES, CURVATURES)])
+    for (neutral_axis, curvature), (force, moment) in zip(zip(NEUTRAL_AXES, CURVATURES), expected):
+        single = fused(neutral_axis, curvature, solver.initial_strain)
+        assert single[0] == pytest.approx(force, rel=1e-9, abs=1e-6)
+        assert single[1] == pytest.approx(moment, rel=1e-9, abs=1e-6)
+    force, moment, _ = fused(NEUTRAL_AXES, CURVATURES, solver.initial_strain)
+    np.testing.assert_allclose(force, expected[:, 0], rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(moment, expected[:, 1], rtol=1e-9, atol=1e-6)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.batch import BatchEvaluator
+from anysection.material import (AgeAdjustedMaterial, Concrete_ParabolicLinearGeneral, Steel_Bilinear,
+                                  age_adjusted_modulus)
+from anysection.section import Section
+from anysection.solver import SectionSolver
+from anysection.strain_plane import StrainPlaneSolver
+
+CONCRETE = Concrete_ParabolicLinearGeneral(30e9, 30e6, 0.002, 0.0035, 0.0, 2.9e6, 1.0)
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+TENDON = Steel_Bilinear(195e9, 1600e6, 0.035)
+
+
+def make_section(concrete=CONCRETE, tendon=False):
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=concrete)
+    section.add_fibers(np.full(4, 4.9e-4), [-0.1, 0.1, -0.1, 0.1], [-0.2, -0.2, 0.2, 0.2], STEEL)
+    if tendon:
+        section.add_fiber(1.4e-4, 0.0, -0.15, TENDON)
+    return section
+
+
+def test_restrained_shrinkage_of_a_symmetric_elastic_section():
+    # Elastic concrete, symmetric bars: no curvature, and the section shortens
+    # by the free shrinkage times the concrete share of the axial stiffness.
+    # (The bars are fibers on top of the meshed rectangle, which keeps its full area.)
+    Ec, shrinkage = 30e9, -4e-4
+    concrete = Steel_Bilinear(Ec, 1e12, 1.0)
+    solver = SectionSolver(make_section(concrete), mesh_divisions=(10, 20))
+    solver.set_initial_strain(-shrinkage, material=concrete)
+    result = StrainPlaneSolver(BatchEvaluator(solver)).solve(0.0, 0.0)
+    assert result.converged.all()
+    concrete_stiffness = Ec * 0.15
+    steel_stiffness = 200e9 * 4 * 4.9e-4
+    expected = shrinkage * concrete_stiffness / (concrete_stiffness + steel_stiffness)
+    assert result.strain_at_reference[0] == pytest.approx(expected, rel=1e-9)
+    assert result.curvature[0] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_initial_strains_accumulate_per_material_and_clear():
+    solver = SectionSolver(make_section(tendon=True), mesh_divisions=(10, 20))
+    solver.set_initial_strain(0.006, material=TENDON)
+    solver.set_initial_strain(-3e-4, material=CONCRETE)
+    fibers = solver.analysis_fibers()
+    initial = solver.initial_strain
+    assert set(initial[fibers.material_ids == fibers.material_index(TENDON)]) == {0.006}
+    assert set(initial[fibers.material_ids == fibers.material_index(CONCRETE)]) == {-3e-4}
+    assert set(initial[fibers.material_ids == fibers.material_index(STEEL)]) == {0.0}
+
+    # At zero curvature the fibers carry their initial strains only
+    tendon = 1.4e-4 * TENDON.stress(0.006)
+    concrete = 0.15 * CONCRETE.stress(-3e-4)
+    assert solver.calculate_axial_force(0.0, 0.0) == pytest.approx(tendon + concrete, rel=1e-12)
+
+    solver.set_initial_strain(None)
+    assert solver.initial_strain is None
+    assert solver.calculate_axial_force(0.0, 0.0) == 0.0
+
+
+def test_analytic_backend_meshes_once_initial_strains_are_set():
+    results = {}
+    for backend in ("analytic", "fiber"):
+        solver = SectionSolver(make_section(tendon=True), backend=backend, mesh_divisions=(20, 40))
+        assert bool(solver.analytic_regions()) == (backend == "analytic")
+        solver.set_initial_strain(0.006, material=TENDON)
+        assert not solver.analytic_regions()
+        results[backend] = solver.moment_curvature_analysis([0.005, 0.01], -500e3)
+    np.testing.assert_allclose(results["analytic"], results["fiber"], rtol=1e-9)
+
+
+def test_batched_initial_strains_are_time_steps():
+    solver = SectionSolver(make_section(), mesh_divisions=(10, 20))
+    evaluator = BatchEvaluator(solver)
+    concrete = evaluator.groups[evaluator.material_index(CONCRETE)][1]
+    steps = np.zeros((3, len(evaluator.y)))
+    steps[:, concrete] = np.array([0.0, -2e-4, -4e-4])[:, None]
+    neutral_axes, moments = evaluator.moment_curvature([0.01], np.full(3, -500e3), initial_strain=steps)
+    for row, strain in enumerate((0.0, -2e-4, -4e-4)):
+        solver.set_initial_strain(None)
+        solver.set_initial_strain(strain, material=CONCRETE)
+        (_, moment), = solver.moment_curvature_analysis([0.01], -500e3)
+        assert moments[row, 0] == pytest.approx(moment, rel=1e-4)
+
+
+def test_age_adjusted_material_stretches_the_strain_axis():
+    phi, chi = 2.0, 0.8
+    material = AgeAdjustedMaterial(CONCRETE, phi, chi)
+    strains = np.linspace(-0.012, 0.001, 131)
+    np.testing.assert_allclose(material.stress_array(strains * (1 + chi * phi)), CONCRETE.stress_array(strains),
+                               atol=1e-6)
+    assert material.tangent_array(np.array([-1e-7]))[0] == pytest.approx(age_adjusted_modulus(30e9, phi, chi),
+                                                                        rel=1e-4)
+    assert material.is_failure(-0.0035 * (1 + chi * phi) * 1.01) and not material.is_failure(-0.005)
+    # The stretched polynomial segments reproduce the law
+    np.testing.assert_allclose(material.kernel().stress(strains), material.stress_array(strains), atol=1e-3)
+
+    # Creep coefficients of several time steps in one batch
+    evaluator = BatchEvaluator(SectionSolver(make_section(material), mesh_divisions=(10, 20)))
+    phis = np.array([0.0, 1.0, 2.5])
+    batched = evaluator.batched_materials({material: {"creep_coefficient": phis[:, None]}})
+    _, moments = evaluator.moment_curvature([0.01], np.full(3, -500e3), materials=batched)
+    for row, value in enumerate(phis):
+        single = make_section(AgeAdjustedMaterial(CONCRETE, value, chi))
+        (_, moment), = SectionSolver(single, mesh_divisions=(10, 20)).moment_curvature_analysis([0.01], -500e3)
+        assert moments[row, 0] == pytest.approx(moment, rel=1e-4)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.keypoints import KeyPointAnalysis, bilinear_idealization, peak_points
+from anysection.material import Concrete_ParabolicLinearGeneral, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+# Tension plateau instead of a drop to zero: N(neutral axis) stays monotonic,
+# so every curvature has a single equilibrium to locate events on
+CONCRETE = Concrete_ParabolicLinearGeneral(30e9, 30e6, 0.002, 0.0035, 0.0, 2.9e6, 1.0)
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+BAR_Y = 0.2
+CURVATURES = np.linspace(1e-4, 0.04, 80)
+
+
+def make_beam():
+    # Positive curvature: bars at the top in tension, concrete at the bottom in compression
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=CONCRETE)
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, BAR_Y), STEEL)
+    return section
+
+
+def test_peak_of_a_sampled_parabola_is_exact():
+    curvatures = np.linspace(0.0, 1.0, 11)
+    moments = np.array([5.0 - 8.0 * (curvatures - 0.37) ** 2, 2.0 * curvatures])
+    peak_curvature, peak_moment, index = peak_points(curvatures, moments)
+    assert peak_curvature == pytest.approx([0.37, 1.0])
+    assert peak_moment == pytest.approx([5.0, 2.0])
+    assert list(index) == [4, 10]
+
+
+def test_bilinear_idealization_of_a_bilinear_curve_is_itself():
+    # Yield at (0.01, 100), hardening to (0.05, 120)
+    curvatures = np.linspace(0.001, 0.05, 50)
+    moments = np.where(curvatures <= 0.01, 1e4 * curvatures, 100.0 + 500.0 * (curvatures - 0.01))[None, :]
+    yield_curvature, yield_moment = bilinear_idealization(curvatures, moments, np.array([0.005]), np.array([50.0]),
+                                                          np.array([0.05]), np.array([120.0]))
+    assert yield_curvature == pytest.approx([0.01], rel=1e-9)
+    assert yield_moment == pytest.approx([100.0], rel=1e-9)
+
+
+@pytest.mark.parametrize("refine", [True, False])
+def test_key_points_of_a_reinforced_beam(refine):
+    section = make_beam()
+    analysis = KeyPointAnalysis.from_section(section, CONCRETE, STEEL, mesh_divisions=(10, 50))
+    points, neutral_axes, moments = analysis.run(CURVATURES, [0.0], refine=refine)
+    curvature = {name: values[0] for name, values in points.curvature.items()}
+    moment = {name: values[0] for name, values in points.moment.items()}
+    assert moments.shape == neutral_axes.shape == (1, len(CURVATURES))
+    assert 0 < curvature["cracking"] < curvature["first_yield"] < curvature["peak"] <= curvature["ultimate"]
+    assert points.ultimate_cause[0] == "crushing"
+    assert curvature["first_yield"] < curvature["idealized_yield"] < curvature["ultimate"]
+    assert points.ductility[0] > 1
+
+    # Refined events sit on the event strains; interpolated ones close to them.
+    # Crushing is measured at the outermost concrete fibers.
+    tolerance = 1e-5 if refine else 2e-2
+    bottom = analysis.evaluator.y[analysis.concrete_fibers].min()
+    solver = SectionSolver(section, mesh_divisions=(10, 50))
+    strain_checks = [("first_yield", lambda na, k: k * (BAR_Y - na), STEEL.ey),
+                     ("ultimate", lambda na, k: -k * (bottom - na), 0.0035)]
+    for name, strain, expected in strain_checks:
+        neutral_axis = solver.find_neutral_axis(0.0, curvature[name], tolerance=1e-9)
+        assert strain(neutral_axis, curvature[name]) == pytest.approx(expected, rel=tolerance)
+        assert moment[name] == pytest.approx(solver.calculate_moment_capacity(curvature[name], neutral_axis),
+                                             rel=tolerance)
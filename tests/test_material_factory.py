@@ -0,0 +1,74 @@
+import gc
+
+import numpy as np
+import pytest
+
+from anysection.material import (Concrete_ConfinedKappos, Concrete_ConfinedSpoelstra, Concrete_Popovics,
+                                 MaterialFactory, Steel_ParkSampson)
+
+SPEC = {"model": "Steel_Bilinear", "Es": 200e9, "fy": 500e6, "euk": 0.02}
+STRAINS = np.linspace(-0.03, 0.03, 121) + 1.234e-6
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    MaterialFactory.clear_registry()
+    yield
+    MaterialFactory.clear_registry()
+
+
+def test_materials_are_not_shared_by_default():
+    first, second = MaterialFactory.from_spec(SPEC), MaterialFactory.from_spec(SPEC)
+    assert first == second and first is not second
+    first.fy = 400e6
+    assert second.fy == 500e6
+    assert len(MaterialFactory._registry) == 0
+
+
+def test_interned_materials_are_shared_and_held_weakly():
+    first = MaterialFactory.from_spec(SPEC, intern=True)
+    assert MaterialFactory.from_spec(SPEC, intern=True) is first
+    assert MaterialFactory.create_material("STEEL_BILINEAR", 200e9, 500e6, 0.02, intern=True) is first
+    assert len(MaterialFactory._registry) == 1
+    del first
+    gc.collect()
+    assert len(MaterialFactory._registry) == 0
+
+
+def test_edited_interned_material_is_not_returned_for_its_old_parameters():
+    first = MaterialFactory.from_spec(SPEC, intern=True)
+    first.fy = 400e6
+    second = MaterialFactory.from_spec(SPEC, intern=True)
+    assert second is not first and second.fy == 500e6
+
+
+def test_kernel_cache_matches_the_law_and_is_bounded(monkeypatch):
+    steel = MaterialFactory.from_spec(SPEC)
+    kernel = MaterialFactory.kernel(steel)
+    assert MaterialFactory.kernel(MaterialFactory.from_spec(SPEC)) is kernel
+    np.testing.assert_allclose(kernel.stress(STRAINS), [steel.stress(strain) for strain in STRAINS])
+
+    # An edited material gets a kernel of its new parameters
+    steel.fy = 400e6
+    edited = MaterialFactory.kernel(steel)
+    assert edited is not kernel
+    np.testing.assert_allclose(edited.stress(STRAINS), [steel.stress(strain) for strain in STRAINS])
+
+    monkeypatch.setattr(MaterialFactory, "kernel_cache_size", 3)
+    for fy in (300e6, 350e6, 450e6, 550e6):
+        MaterialFactory.kernel(MaterialFactory.from_spec(dict(SPEC, fy=fy)))
+    assert len(MaterialFactory._kernels) == 3
+
+
+@pytest.mark.parametrize("material, parameter, value", [
+    (Concrete_Popovics(30e9, 30e6, 0.002, 0.0035), "Eco", 25e9),
+    (Steel_ParkSampson(200e9, 500e6, 650e6, 0.01, 0.1), "fu", 700e6),
+    (Concrete_ConfinedKappos(30e6, 0.002, 0.01, 0.3, 0.1, 500e6, "rectangular"), "fyw", 400e6),
+    (Concrete_ConfinedSpoelstra(0.3, 0.002, 30e6, 500e6, 200e9, 0.002), "tj", 0.003),
+], ids=lambda value: getattr(value, "name", ""))
+def test_derived_constants_follow_edited_parameters(material, parameter, value):
+    setattr(material, parameter, value)
+    rebuilt = material.with_parameters()
+    np.testing.assert_allclose([material.stress(strain) for strain in STRAINS],
+                               [rebuilt.stress(strain) for strain in STRAINS])
+    np.testing.assert_allclose(material.stress_array(STRAINS), rebuilt.stress_array(STRAINS))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from anysection.material import MODEL_CLASSES, AgeAdjustedMaterial, ModelType
+
+SPECS = {
+    ModelType.CONCRETE_PARABOLIC_LINEAR_EC2: dict(fck=30e6, acc=0.85, gc=1.5, ec2=0.002, ecu2=0.0035, n=2),
+    ModelType.CONCRETE_Nonlinear_EC2: dict(fcm=38e6, ec1=0.0022, ecu1=0.0035),
+    ModelType.CONCRETE_POPOVICS: dict(Eco=30e9, fc=30e6, ec=0.002, ecu=0.0035),
+    ModelType.CONCRETE_PARABOLIC_LINEAR_GENERAL: dict(Ec=30e9, fc=30e6, eco=0.002, ecu=0.0035, slope=0.0, ft=2e6,
+                                                      etu=0.0002),
+    ModelType.CONCRETE_PARABOLIC_LINEAR_FRC: dict(Ec=30e9, fc=30e6, eco=0.002, ecu=0.0035, ft=2e6, s2=1.5e6,
+                                                  e2=0.001, s3=1e6, e3=0.02),
+    ModelType.CONCRETE_MC90_GENERAL: dict(fcm=30e6, ecu=0.0035, ft=2e6, etu=0.00015),
+    ModelType.CONCRETE_CONFINED_KAPPOS: dict(fc=30e6, eco=0.002, rw=0.01, bc=0.3, s=0.1, fyw=500e6,
+                                             HoopType="rectangular"),
+    ModelType.CONCRETE_CONFINED_SPOELSTRA: dict(D=0.5, tj=0.001, fco=30e6, fju=500e6, Ej=200e9, eco=0.002),
+    ModelType.STEEL_BILINEAR: dict(Es=200e9, fy=500e6, euk=0.05),
+    ModelType.STEEL_PARK_SAMPSON: dict(Es=200e9, fy=500e6, fu=600e6, esh=0.01, esu=0.05),
+    ModelType.FRP_LINEAR: dict(Es=230e9, euk=0.015, gs=1.2),
+}
+
+
+def materials():
+    params = []
+    for model in ModelType:
+        material = MODEL_CLASSES[model](**SPECS[model])
+        params.append(pytest.param(material, id=model.value))
+        params.append(pytest.param(AgeAdjustedMaterial(material, 2.0), id=f"AgeAdjusted_{model.value}"))
+    return params
+
+
+def test_every_model_has_a_spec():
+    assert set(SPECS) == set(ModelType)
+
+
+@pytest.mark.parametrize("material", materials())
+def test_kernel_matches_scalar_law(material):
+    segments = material.polynomial_segments()
+    breaks = sorted({bound for lower, upper, _ in segments or [] for bound in (lower, upper)} | {0.0})
+    strains = []
+    for bound in breaks:
+        eps = 1e-9 * max(abs(bound), 1e-3)
+        strains.extend((bound - eps, bound, bound + eps))
+    strains.extend(np.linspace(-0.06, 0.06, 241))
+    strains = np.array(strains)
+
+    expected = np.array([float(material.stress(strain)) for strain in strains])
+    kernel = material.kernel()
+    np.testing.assert_allclose(kernel.stress(strains), expected, rtol=1e-9, atol=1e-3)
+    np.testing.assert_allclose([float(kernel.stress(strain)) for strain in breaks],
+                               [float(material.stress(strain)) for strain in breaks], rtol=1e-9, atol=1e-3)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from matplotlib import pyplot
+from matplotlib.collections import EllipseCollection, PolyCollection
+
+from anysection.area import Polygon, Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.plotting import plot_moment_curvature, plot_section, render_sections
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+
+def make_section(name="beam"):
+    section = Section(name)
+    section.add_area(Polygon([(-0.15, -0.25), (0.15, -0.25), (0.15, 0.25), (-0.15, 0.25)],
+                             holes=[[(-0.05, -0.05), (0.05, -0.05), (0.05, 0.05), (-0.05, 0.05)]]),
+                     material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    return section
+
+
+def only(ax, kind):
+    collections = [collection for collection in ax.collections if isinstance(collection, kind)]
+    assert len(collections) == 1
+    return collections[0]
+
+
+def test_section_is_drawn_headless_with_true_scale_fibers():
+    section = make_section()
+    solver = SectionSolver(section, mesh_divisions=(20, 40))
+    figure = plot_section(section, solver)
+    assert not pyplot.get_fignums()
+    ax, = figure.axes
+    fibers = only(ax, EllipseCollection)
+    assert len(fibers.get_offsets()) == len(solver.analysis_fibers().y)
+    # Bars (larger than the mesh cells) are drawn last, on top of the concrete
+    np.testing.assert_allclose(fibers.get_offsets()[-3:], [[-0.1, -0.2], [0.0, -0.2], [0.1, -0.2]])
+    # Outer boundary and hole
+    assert len(only(ax, PolyCollection).get_paths()) == 2
+    assert sorted(text.get_text() for text in ax.get_legend().get_texts()) == ["Concrete_ParabolicLinearEC2",
+                                                                               "Steel_Bilinear"]
+
+
+def test_section_colored_by_a_field():
+    section = make_section()
+    solver = SectionSolver(section, mesh_divisions=(6, 10))
+    solver.moment_curvature_analysis([0.01], -500e3)
+    stress = solver.fiber_fields(quantities=("stress",))[0]["stress"]
+    figure = plot_section(section, solver, values=stress, label="Stress (Pa)")
+    ax, colorbar = figure.axes
+    assert sorted(only(ax, EllipseCollection).get_array()) == pytest.approx(sorted(stress))
+    assert colorbar.get_ylabel() == "Stress (Pa)"
+
+
+def test_moment_curvature_skips_failed_steps():
+    figure = plot_moment_curvature([(0.0, 0.0), (0.01, 5.0), (0.02, None), (0.03, 7.0)], label="N = 0")
+    line, = figure.axes[0].get_lines()
+    np.testing.assert_array_equal(line.get_xydata(), [[0.0, 0.0], [0.01, 5.0], [0.03, 7.0]])
+    line, = plot_moment_curvature((np.array([0.0, 1.0]), np.array([0.0, 2.0]))).axes[0].get_lines()
+    np.testing.assert_array_equal(line.get_xydata(), [[0.0, 0.0], [1.0, 2.0]])
+
+
+def test_render_sections_writes_one_file_per_section(tmp_path):
+    sections = [make_section("B 1/a"), make_section("B 1/a"), (make_section("other"), None)]
+    paths = render_sections(sections, tmp_path / "views", dpi=30)
+    assert [path.rsplit("/", 1)[1] for path in map(str, paths)] == ["B_1_a.png", "B_1_a_2.png", "other.png"]
+    for path in paths:
+        with open(path, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+    assert not pyplot.get_fignums()
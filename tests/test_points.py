@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from anysection.area import Polygon, Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.points import Point, RotatedFrames, rotate_coordinates
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+
+
+def rotated_rectangle(width, height, angle):
+    corners = [Point(x, y) for x, y in [(-width / 2, -height / 2), (width / 2, -height / 2),
+                                        (width / 2, height / 2), (-width / 2, height / 2)]]
+    for corner in corners:
+        corner.rotate(angle)
+    return Polygon([(corner.x, corner.y) for corner in corners])
+
+
+@pytest.mark.parametrize("angle", [0.0, 0.3, -0.7])
+def test_principal_axes_of_a_rotated_rectangle(angle):
+    # 0.2 wide, 0.6 tall: the largest I is about the x-axis, which turns with the rectangle
+    section = Section("rotated")
+    section.add_area(rotated_rectangle(0.2, 0.6, angle).translate(1.0, -2.0))
+    principal_angle, I1, I2 = section.principal_axes()
+    assert principal_angle == pytest.approx(angle, abs=1e-12)
+    assert I1 == pytest.approx(0.2 * 0.6 ** 3 / 12, rel=1e-12)
+    assert I2 == pytest.approx(0.6 * 0.2 ** 3 / 12, rel=1e-12)
+
+
+def test_principal_axes_of_an_angle_with_bars():
+    # L-section from two rectangles plus bars, against the eigenvalues of the inertia tensor
+    section = Section("angle")
+    section.add_area(Rectangle(0.1, 0.5), dx=-0.2, dy=0.0)
+    section.add_area(Rectangle(0.3, 0.1), dx=0.0, dy=-0.2)
+    section.add_fibers(np.full(2, 1e-3), [-0.2, 0.1], [0.2, -0.2], STEEL)
+    outline = Polygon([(-0.25, -0.25), (0.15, -0.25), (0.15, -0.15), (-0.15, -0.15), (-0.15, 0.25), (-0.25, 0.25)])
+    x_c, y_c = section.centroid()
+    Ix, Iy = outline.moment_of_inertia()
+    Ixy = outline.product_of_inertia()
+    cx, cy = outline.centroid()
+    A = outline.area()
+    Ix += A * (cy - y_c) ** 2 + 1e-3 * ((0.2 - y_c) ** 2 + (-0.2 - y_c) ** 2)
+    Iy += A * (cx - x_c) ** 2 + 1e-3 * ((-0.2 - x_c) ** 2 + (0.1 - x_c) ** 2)
+    Ixy += A * (cx - x_c) * (cy - y_c) + 1e-3 * ((-0.2 - x_c) * (0.2 - y_c) + (0.1 - x_c) * (-0.2 - y_c))
+    assert section.product_of_inertia() == pytest.approx(Ixy, rel=1e-12)
+
+    angle, I1, I2 = section.principal_axes()
+    eigenvalues, eigenvectors = np.linalg.eigh([[Ix, -Ixy], [-Ixy, Iy]])
+    assert (I2, I1) == pytest.approx(tuple(eigenvalues), rel=1e-12)
+    # The major axis direction is an eigenvector of I1
+    direction = np.array([np.cos(angle), np.sin(angle)])
+    assert abs(direction @ eigenvectors[:, 1]) == pytest.approx(1.0, rel=1e-12)
+
+
+def test_rotate_coordinates_matches_rotating_the_points():
+    x, y = np.array([0.3, -0.1, 0.0]), np.array([0.2, 0.4, -0.5])
+    angles = np.array([0.0, 0.4, np.pi / 2])
+    u, v = rotate_coordinates(x, y, angles, origin=(0.1, 0.1))
+    assert u.shape == v.shape == (3, 3)
+    for k, angle in enumerate(angles):
+        for i in range(3):
+            # A frame rotated by +angle sees the point rotated by -angle
+            point = Point(x[i], y[i])
+            point.rotate(-angle, origin=(0.1, 0.1))
+            assert (u[k, i], v[k, i]) == pytest.approx((point.x - 0.1, point.y - 0.1), abs=1e-15)
+
+
+def test_rotated_frames_cache_hits_and_eviction():
+    frames = RotatedFrames(np.arange(5.0), np.zeros(5), maxsize=2)
+    first = frames([0.0, 0.5])
+    assert frames([0.0, 0.5])[0] is first[0] and (frames.hits, frames.misses) == (1, 1)
+    with pytest.raises(ValueError):
+        first[0][0, 0] = 1.0
+    frames([1.0])
+    frames([0.0, 0.5])
+    frames([2.0])  # evicts [1.0], the least recently used
+    assert len(frames) == 2 and (frames.hits, frames.misses) == (2, 3)
+    frames([1.0])
+    assert frames.misses == 4
+
+
+def test_section_and_solver_frames_are_cached_and_reset():
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), STEEL)
+    angles = np.linspace(0.0, np.pi, 7)
+    u, v = section.rotated_coordinates(angles)
+    assert section.rotated_coordinates(angles)[0] is u and section._frames.hits == 1
+    section.add_fiber(4.9e-4, 0.0, 0.2, STEEL)
+    assert section.rotated_coordinates(angles)[0].shape == (7, 4)
+    assert section._frames.hits == 0
+
+    solver = SectionSolver(section, mesh_divisions=(4, 5))
+    u, v = solver.rotated_coordinates(angles, origin=(0.0, 0.0))
+    assert u.shape == (7, 24)
+    assert solver.rotated_coordinates(angles, origin=(0.0, 0.0))[1] is v
+    np.testing.assert_allclose(v[0], solver.analysis_fibers().y)
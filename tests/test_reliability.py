@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from anysection.area import Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.reliability import ReliabilityModel
+from anysection.section import Section
+
+CURVATURES = np.linspace(0.002, 0.03, 8)
+
+
+def make_model():
+    steel = Steel_Bilinear(200e9, 500e6, 0.05)
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), steel)
+    model = ReliabilityModel(section, mesh_divisions=(6, 12))
+    model.material_parameter("fy", steel, "fy", stats.norm(500e6, 30e6))
+    model.fiber_area("As", steel, stats.norm(4.9e-4, 2e-5))
+    return model
+
+
+def test_run_streams_chunks_without_keeping_samples():
+    model = make_model()
+    result = model.run(50, CURVATURES, seed=1, chunk_size=16)
+    assert result.samples is None and result.capacities is None
+    assert result.statistics.count + result.statistics.failures == 50
+
+    kept = model.run(50, CURVATURES, seed=1, chunk_size=16, keep_samples=True)
+    assert kept.samples.shape == (50, 2) and kept.capacities.shape == (50,)
+    assert kept.statistics.mean == pytest.approx(result.statistics.mean)
+    np.testing.assert_allclose(kept.capacities, model.evaluate(kept.samples, CURVATURES))
+
+
+@pytest.mark.parametrize("method", ["lhs", "mc"])
+def test_workers_get_the_model_once_and_match_in_process(method, monkeypatch):
+    model = make_model()
+    expected = model.run(40, CURVATURES, method=method, seed=3, chunk_size=8, keep_samples=True)
+
+    pickled = []
+
+    def getstate(self):
+        pickled.append(self)
+        return self.__dict__
+
+    monkeypatch.setattr(ReliabilityModel, "__getstate__", getstate, raising=False)
+    result = model.run(40, CURVATURES, method=method, seed=3, chunk_size=8, workers=2, keep_samples=True)
+    # At most once per worker (not at all when the workers are forked), never per chunk
+    assert len(pickled) <= 2
+    np.testing.assert_allclose(result.samples, expected.samples)
+    np.testing.assert_allclose(result.capacities, expected.capacities)
+
+
+def test_equal_but_distinct_materials_are_selected_by_identity():
+    top, bottom = Steel_Bilinear(200e9, 500e6, 0.05), Steel_Bilinear(200e9, 500e6, 0.05)
+    assert top == bottom and top is not bottom
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(2, 2e-4), [-0.1, 0.1], np.full(2, 0.2), top)
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), bottom)
+    model = ReliabilityModel(section, mesh_divisions=(6, 12))
+    evaluator = model.evaluator
+    assert evaluator.materials[evaluator.material_index(bottom)] is bottom
+
+    model.fiber_area("As", bottom, stats.norm(4.9e-4, 2e-5))
+    mask = model.variables[0][2]
+    np.testing.assert_array_equal(model.y[mask], np.full(3, -0.2))
+
+    model.material_parameter("fy", bottom, "fy", stats.norm(500e6, 30e6))
+    materials = evaluator.batched_materials({bottom: {"fy": np.array([[400e6]])}})
+    assert materials[evaluator.material_index(top)] is top
+    assert materials[evaluator.material_index(bottom)].fy[0, 0] == 400e6
+    assert model.variables[1][2][0] == evaluator.material_index(bottom)
@@ -0,0 +1,76 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from anysection import service
+from anysection.area import Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+
+
+def make_section():
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    return section
+
+
+def test_solver_cache_is_keyed_by_mesh_divisions():
+    section = make_section()
+
+    async def run(mesh_divisions):
+        async with service.AnalysisService(mesh_divisions=mesh_divisions) as analysis:
+            await analysis.moment(section, -100e3, 0.005)
+            return await analysis._section_key(section)
+
+    key = asyncio.run(run((4, 4)))
+    asyncio.run(run((30, 30)))
+    coarse = service._SOLVERS[(key, (4, 4))]
+    fine = service._SOLVERS[(key, (30, 30))]
+    assert len(coarse.evaluator.area) < len(fine.evaluator.area)
+
+
+def test_section_is_hashed_in_process_for_every_request(monkeypatch):
+    section = make_section()
+    calls = []
+
+    def digest(value):
+        calls.append(value)
+        return "digest"
+
+    monkeypatch.setattr(service, "section_digest", digest)
+
+    async def run():
+        async with service.AnalysisService() as analysis:
+            for curvature in (0.003, 0.004, 0.005):
+                await analysis.moment(section, -100e3, curvature)
+
+    asyncio.run(run())
+    assert len(calls) == 3 and all(value is section for value in calls)
+
+
+@pytest.mark.parametrize("edit", ["move fiber", "resize area", "material parameter"])
+def test_in_place_edits_are_not_served_a_stale_solver(edit):
+    section = make_section()
+
+    def apply_edit():
+        if edit == "move fiber":
+            section.fibers[0].y = 0.2
+        elif edit == "resize area":
+            section.regions[0][0].width = 0.4
+        else:
+            section.regions[0][3].fck = 20e6
+
+    async def run():
+        async with service.AnalysisService(mesh_divisions=(6, 10)) as analysis:
+            _, before, _ = await analysis.moment(section, -100e3, 0.005)
+            apply_edit()
+            _, after, _ = await analysis.moment(section, -100e3, 0.005)
+            return before[0], after[0]
+
+    before, after = asyncio.run(run())
+    expected = service.StrainPlaneSolver.from_section(section, (6, 10)).evaluator.equilibrium(
+        np.array([0.005]), np.array([-100e3]))[1][0]
+    assert after != pytest.approx(before)
+    assert after == pytest.approx(expected)
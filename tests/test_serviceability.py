@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.serviceability import ServiceabilityAnalysis
+
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+FCT_EFF, ECM = 2.9e6, 33e9
+
+
+def make_analysis():
+    # 300 x 500 beam, three 25 mm bars 50 mm above the bottom face
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 1.0, 1.0, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), STEEL)
+    return ServiceabilityAnalysis(section, STEEL, mesh_divisions=(10, 50))
+
+
+def test_uncracked_cases_have_no_crack_width():
+    analysis = make_analysis()
+    result = analysis.solve([0.0, 0.0], [-5e3, -100e3])
+    # The tension face of the small moment stays below the cracking strain
+    tension_face = result.edge_strains[:, 0]
+    assert tension_face[0] < FCT_EFF / ECM < tension_face[1]
+    assert result.steel_stress[0] > 0
+    widths = analysis.crack_widths(result, 0.3, 0.025, 0.0375, FCT_EFF, ECM)
+    assert widths[0] == 0.0 and widths[1] > 0.0
+
+
+def test_cracked_width_matches_ec2_by_hand():
+    analysis = make_analysis()
+    result = analysis.solve(0.0, -100e3)
+    sigma_s = result.steel_stress[0]
+    x = 0.25 - result.neutral_axis[0]            # compression depth from the top face
+    h, d, As, b, c, phi = 0.5, 0.45, 3 * 4.9e-4, 0.3, 0.0375, 0.025
+    alpha_e = 200e9 / ECM
+
+    hc_eff = min(2.5 * (h - d), (h - x) / 3, h / 2)                               # 7.3.2 (3)
+    rho = As / (b * hc_eff)                                                       # (7.10)
+    strain_difference = max((sigma_s - 0.4 * FCT_EFF / rho * (1 + alpha_e * rho)) / 200e9,
+                            0.6 * sigma_s / 200e9)                                # (7.9)
+    spacing = 3.4 * c + 0.8 * 0.5 * 0.425 * phi / rho                             # (7.11), k2 = 0.5 in bending
+    expected = spacing * strain_difference                                        # (7.8)
+
+    assert 100e6 < sigma_s < 250e6
+    assert analysis.crack_widths(result, b, phi, c, FCT_EFF, ECM)[0] == pytest.approx(expected, rel=1e-9)
+    assert 0.05e-3 < expected < 0.3e-3
@@ -0,0 +1,70 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.batch import BatchEvaluator
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.shared import SharedFiberArrays, load_fiber_arrays, save_fiber_arrays
+from anysection.solver import SectionSolver
+
+
+def make_fibers():
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    section.add_fibers(np.full(3, 4.9e-4), [-0.1, 0.0, 0.1], np.full(3, -0.2), Steel_Bilinear(200e9, 500e6, 0.05))
+    return SectionSolver(section, mesh_divisions=(10, 20)).analysis_fibers()
+
+
+def moment(section, curvature=0.01, axial_force=-500e3):
+    solver = SectionSolver(section)
+    return solver.calculate_moment_capacity(curvature, solver.find_neutral_axis(axial_force, curvature))
+
+
+def attached_moment(handle):
+    return moment(handle.section())
+
+
+def assert_same_fibers(fibers, expected):
+    for field in ("area", "x", "y", "material_ids"):
+        np.testing.assert_array_equal(getattr(fibers, field), getattr(expected, field))
+    assert [material.name for material in fibers.materials] == [material.name for material in expected.materials]
+
+
+def test_shared_handle_round_trip():
+    fibers = make_fibers()
+    section = Section("copy")
+    section.fibers = fibers
+    expected = moment(section)
+
+    with SharedFiberArrays(fibers) as shared:
+        handle = pickle.loads(pickle.dumps(shared.handle))
+        attached = handle.attach()
+        assert_same_fibers(attached, fibers)
+        assert not attached.y.flags.writeable
+        assert moment(handle.section()) == pytest.approx(expected, rel=1e-12)
+        # The handle does not carry the arrays
+        assert len(pickle.dumps(shared.handle)) < fibers.y.nbytes
+
+        # float64 arrays are evaluated in place
+        evaluator = BatchEvaluator.from_fibers(attached)
+        assert np.shares_memory(evaluator.y, attached.y)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(attached_moment, [shared.handle] * 2))
+        assert results == pytest.approx([expected] * 2, rel=1e-12)
+        del attached, evaluator
+
+    with pytest.raises(FileNotFoundError):
+        shared.handle.attach()
+
+
+def test_memory_mapped_round_trip(tmp_path):
+    fibers = make_fibers()
+    save_fiber_arrays(fibers, tmp_path)
+    loaded = load_fiber_arrays(tmp_path)
+    assert isinstance(loaded.y, np.memmap)
+    assert_same_fibers(loaded, fibers)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.material import (Concrete_MC90General, Concrete_NonlinearEC2, Concrete_ParabolicLinearEC2,
+                                  Concrete_ParabolicLinearFRC, Concrete_ParabolicLinearGeneral, Concrete_Popovics,
+                                  Steel_Bilinear, Steel_ParkSampson, FRP_Linear)
+from anysection.section import Section
+from anysection.solver import SectionSolver
+
+STRAINS = [-0.004, -0.0035, -0.003, -0.002, -0.0015, -0.001, -0.0002, 0.0, 5e-5, 1e-4, 0.001, 0.004]
+
+
+def legacy_parabola_linear(strain, fc, eco, ecu):
+    # Compression branch as returned before the tension-positive convention
+    if abs(strain) <= eco:
+        return fc * (2 * (abs(strain) / eco) - (abs(strain) / eco) ** 2)
+    if abs(strain) <= ecu:
+        return fc * (1 - (abs(strain) - eco) / (ecu - eco))
+    return 0.0
+
+
+def legacy_nonlinear_ec2(strain):
+    if abs(strain) <= 0.002:
+        return 30e6 * (2 * abs(strain) / 0.002 - (abs(strain) / 0.002) ** 2)
+    return 30e6 if abs(strain) <= 0.0035 else 0.0
+
+
+def legacy_parabolic_linear_ec2(strain):
+    fcd = 0.85 * 30e6 / 1.5
+    if abs(strain) <= 0.002:
+        return fcd * (1 - (1 - abs(strain) / 0.002) ** 2)
+    return fcd if abs(strain) <= 0.0035 else 0.0
+
+
+def legacy_popovics(strain):
+    r = 30e9 / (30e9 - 30e6 / 0.002)
+    if abs(strain) <= 0.002:
+        return 30e6 * (r * abs(strain) / 0.002) / (r - 1 + (abs(strain) / 0.002) ** r)
+    return 30e6 * (1 - (abs(strain) - 0.002) / 0.0015) if abs(strain) <= 0.0035 else 0.0
+
+
+# (material, magnitude of the compressive stress returned before the change)
+CONCRETE = [
+    (Concrete_NonlinearEC2(30e6, 0.002, 0.0035), legacy_nonlinear_ec2),
+    (Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2), legacy_parabolic_linear_ec2),
+    (Concrete_Popovics(30e9, 30e6, 0.002, 0.0035), legacy_popovics),
+    (Concrete_ParabolicLinearGeneral(30e9, 30e6, 0.002, 0.0035, 0.0, 2.9e6, 0.002),
+     lambda strain: legacy_parabola_linear(strain, 30e6, 0.002, 0.0035)),
+    (Concrete_ParabolicLinearFRC(30e9, 30e6, 0.002, 0.0035, 2.9e6, 1.5e6, 0.002, 0.5e6, 0.01),
+     lambda strain: legacy_parabola_linear(strain, 30e6, 0.002, 0.0035)),
+    (Concrete_MC90General(30e6, 0.0035, 2.9e6, 0.002),
+     lambda strain: 30e6 * (1 - abs(strain) / 0.0035) if abs(strain) <= 0.0035 else 0.0),
+]
+
+
+@pytest.mark.parametrize("material, legacy", CONCRETE, ids=lambda value: getattr(value, "name", ""))
+def test_concrete_compression_is_the_negated_legacy_stress(material, legacy):
+    for strain in STRAINS:
+        if strain < 0:
+            assert material.stress(strain) == pytest.approx(-legacy(strain), abs=1e-6)
+            assert material.stress(strain) <= 0
+        # Tension branches are unchanged (tension was already positive)
+        assert np.sign(material.stress(abs(strain))) >= 0
+
+
+@pytest.mark.parametrize("material", [Steel_Bilinear(200e9, 500e6, 0.05),
+                                      Steel_ParkSampson(200e9, 500e6, 650e6, 0.01, 0.1),
+                                      FRP_Linear(150e9, 0.015, 1.25)], ids=lambda material: material.name)
+def test_reinforcement_laws_are_unchanged_and_odd(material):
+    for strain in STRAINS:
+        assert material.stress(-strain) == pytest.approx(-material.stress(strain))
+        assert np.sign(material.stress(strain)) == np.sign(strain)
+
+
+@pytest.mark.parametrize("backend", ["fiber", "analytic"])
+def test_compressive_axial_force_is_negative(backend):
+    concrete = Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2)
+    steel = Steel_Bilinear(200e9, 500e6, 0.05)
+    section = Section("column")
+    section.add_area(Rectangle(0.3, 0.5), material=concrete)
+    section.add_fibers(np.full(4, 4.9e-4), [-0.1, 0.1, -0.1, 0.1], [-0.2, -0.2, 0.2, 0.2], steel)
+    solver = SectionSolver(section, backend=backend, mesh_divisions=(10, 20))
+
+    # A uniform shortening of 2.5 per mille crushes the concrete and yields the bars
+    squash = -(0.85 * 30e6 / 1.5 * 0.15 + 500e6 * 4 * 4.9e-4)
+    solver.set_initial_strain(-0.0025)
+    assert solver.calculate_axial_force(0.0, 0.0) == pytest.approx(squash, rel=1e-3)
+    solver.set_initial_strain(None)
+
+    # A compressive load (negative) puts the fibers below the neutral axis in
+    # compression for a positive curvature, which gives a positive moment
+    axial_force = 0.3 * squash
+    neutral_axis = solver.find_neutral_axis(axial_force, 0.01)
+    assert solver.calculate_axial_force(neutral_axis, 0.01) == pytest.approx(axial_force, rel=1e-4)
+    assert neutral_axis > 0.0
+    (_, moment), = solver.moment_curvature_analysis([0.01], axial_force)
+    assert moment > 0.0
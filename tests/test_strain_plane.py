@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+from anysection.strain_plane import StrainPlaneSolver
+
+CONCRETE = Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2)
+STEEL = Steel_Bilinear(200e9, 500e6, 0.05)
+
+
+def make_column():
+    section = Section("column")
+    section.add_area(Rectangle(0.4, 0.6), material=CONCRETE)
+    for x in (-0.15, 0.15):
+        for y in (-0.25, 0.25):
+            section.add_fiber(np.pi * 0.0125 ** 2, x, y, STEEL)
+    return section
+
+
+def test_elastic_biaxial_plane_in_closed_form():
+    # Linear elastic rectangle: N = E A e0, Mx = E Ix kx, My = E Iy ky. The
+    # midpoint fibers of an n-cell grid give I = b h^3 / 12 * (1 - 1 / n^2).
+    b, h, nx, ny, E = 0.4, 0.6, 16, 24, 30e9
+    section = Section("elastic")
+    section.add_area(Rectangle(b, h), material=Steel_Bilinear(E, 1e12, 1.0))
+    solver = StrainPlaneSolver.from_section(section, mesh_divisions=(nx, ny))
+    assert solver.reference == pytest.approx((0.0, 0.0), abs=1e-12)
+
+    expected = np.array([[-2e-4, 1e-3, 0.0], [1e-4, -2e-3, 3e-3], [0.0, 5e-4, -1e-3]])
+    A = b * h
+    Ix = b * h ** 3 / 12 * (1 - 1 / ny ** 2)
+    Iy = h * b ** 3 / 12 * (1 - 1 / nx ** 2)
+    N, Mx, My = (E * np.array([A, Ix, Iy]) * expected).T
+    result = solver.solve(N, Mx, My)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.planes, expected, rtol=1e-8, atol=1e-15)
+
+
+def test_nonlinear_biaxial_planes_are_recovered():
+    solver = StrainPlaneSolver.from_section(make_column(), mesh_divisions=(20, 30))
+    # Cracked and yielded planes in one batch, bending about both axes
+    expected = np.array([[-5e-4, 4e-3, 2e-3], [1e-4, -8e-3, 6e-3], [-1e-3, 1e-3, -1e-3], [-3e-4, 1e-2, 0.0]])
+    N, Mx, My = solver.forces(expected).T
+    result = solver.solve(N, Mx, My)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.planes, expected, rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(solver.forces(result.planes), solver.forces(expected), rtol=1e-7, atol=1e-3)
+
+
+def test_uniaxial_planes_match_the_section_solver():
+    section = make_column()
+    solver = StrainPlaneSolver.from_section(section, mesh_divisions=(20, 30))
+    section_solver = SectionSolver(section, mesh_divisions=(20, 30))
+    yr = solver.reference[1]
+    axial_force = -1.5e6
+    curvatures = np.array([0.002, 0.005, 0.01])
+    neutral_axes = np.array([section_solver.find_neutral_axis(axial_force, k) for k in curvatures])
+    # Moments about the neutral axis moved to the reference point
+    moments = np.array([section_solver.calculate_moment_capacity(k, na) for k, na in zip(curvatures, neutral_axes)])
+    moments += axial_force * (neutral_axes - yr)
+
+    result = solver.solve(axial_force, moments)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.curvature, curvatures, rtol=1e-5)
+    np.testing.assert_allclose(result.strain_at_reference, curvatures * (yr - neutral_axes), rtol=1e-5, atol=1e-9)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.material import Concrete_ParabolicLinearEC2
+from anysection.section import Section
+from anysection.surrogate import SectionSurrogate
+
+
+@pytest.mark.parametrize("axial_forces, curvatures", [([0.0], [0.0, 0.01]), ([-1e5, 0.0], [0.01])])
+def test_single_point_axes_are_rejected(axial_forces, curvatures):
+    moments = np.zeros((len(axial_forces), len(curvatures)))
+    with pytest.raises(ValueError):
+        SectionSurrogate(axial_forces, curvatures, moments)
+    section = Section("beam")
+    section.add_area(Rectangle(0.3, 0.5), material=Concrete_ParabolicLinearEC2(30e6, 0.85, 1.5, 0.002, 0.0035, 2))
+    with pytest.raises(ValueError):
+        SectionSurrogate.build(section, axial_forces, curvatures)
+
+
+def test_queries_inside_the_grid_are_finite():
+    surrogate = SectionSurrogate([0.0, 1.0], [0.0, 2.0], [[0.0, 2.0], [1.0, 3.0]])
+    assert surrogate.moment(0.5, 1.0) == pytest.approx(1.5)
+    assert np.isnan(surrogate.moment(2.0, 1.0))
+
+
+@pytest.mark.parametrize("points", [2, 3, 4, 6])
+def test_cubic_falls_back_on_short_axes(points):
+    axial_forces = np.linspace(0.0, 1.0, points)
+    curvatures = np.linspace(0.0, 2.0, 5)
+    moments = 1.0 + axial_forces[:, None] + curvatures[None, :] ** 2
+    surrogate = SectionSurrogate(axial_forces, curvatures, moments)
+    # Linear along N, quadratic along kappa: reproduced by any degree >= 1 along N
+    assert surrogate.moment(0.5, 1.1, method="cubic") == pytest.approx(1.0 + 0.5 + 1.1 ** 2)
+    two_point = SectionSurrogate([0.0, 1.0], [0.0, 2.0], [[0.0, 2.0], [1.0, 3.0]])
+    assert two_point.moment(0.5, 1.0, method="cubic") == pytest.approx(1.5)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from anysection.area import Rectangle
+from anysection.material import Concrete_NonlinearEC2, Steel_Bilinear
+from anysection.section import Section
+from anysection.solver import SectionSolver
+from anysection.sweep import ParametricSweep
+
+CURVATURES = np.linspace(0.002, 0.03, 6)
+
+
+def build(materials, width, height):
+    section = Section("beam")
+    section.add_area(Rectangle(width, height, width / 2, height / 2), material=materials["concrete"])
+    for x in (0.05, width - 0.05):
+        for y in (0.05, height - 0.05):
+            section.add_fiber(3.14e-4, x, y, materials["steel"])
+    return section
+
+
+def make_sweep():
+    materials = {"concrete": Concrete_NonlinearEC2(30e6, 0.002, 0.0035), "steel": Steel_Bilinear(200e9, 500e6, 0.02)}
+    sweep = ParametricSweep(build, materials, CURVATURES, mesh_divisions=(6, 12))
+    sweep.add_geometry("width", [0.25, 0.3, 0.4])
+    sweep.add_geometry("height", [0.5])
+    sweep.add_material_parameter("fy", "steel", "fy", [400e6, 500e6])
+    sweep.set_axial_forces([0.0, -200e3])
+    return sweep
+
+
+def test_grid_point_matches_a_direct_analysis():
+    result = make_sweep().run()
+    assert result.dims == ("width", "height", "fy", "axial_force", "curvature")
+    materials = {"concrete": Concrete_NonlinearEC2(30e6, 0.002, 0.0035), "steel": Steel_Bilinear(200e9, 400e6, 0.02)}
+    solver = SectionSolver(build(materials, 0.3, 0.5), mesh_divisions=(6, 12))
+    expected = [moment for _, moment in solver.moment_curvature_analysis(CURVATURES[:3], -200e3)]
+    np.testing.assert_allclose(result.sel(width=0.3, height=0.5, fy=400e6, axial_force=-200e3).moments[:3], expected, rtol=1e-4)
+
+
+def test_workers_get_the_sweep_once(monkeypatch):
+    sweep = make_sweep()
+    expected = sweep.run(chunk_size=2)
+    pickled = []
+
+    def getstate(self):
+        pickled.append(self)
+        return self.__dict__
+
+    monkeypatch.setattr(ParametricSweep, "__getstate__", getstate, raising=False)
+    result = sweep.run(workers=2, chunk_size=2)
+    assert len(pickled) <= 2
+    np.testing.assert_allclose(result.moments, expected.moments, equal_nan=True)